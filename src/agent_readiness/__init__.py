@@ -1,8 +1,8 @@
 """Agent Readiness Score - Production-readiness scoring for AI agent codebases."""
 
-from .models import CheckResult, PillarResult, ScanResult
+from .models import CheckResult, PillarResult, ScanContext, ScanResult
 from .pillar import Pillar
 from .scanner import Scanner
 
 __version__ = "0.1.0"
-__all__ = ["CheckResult", "PillarResult", "ScanResult", "Pillar", "Scanner"]
+__all__ = ["CheckResult", "PillarResult", "ScanContext", "ScanResult", "Pillar", "Scanner"]
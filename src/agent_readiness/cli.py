@@ -1,6 +1,5 @@
 """Command-line interface for agent-readiness-score."""
 
-import json
 import sys
 from pathlib import Path
 
@@ -20,6 +19,7 @@ from agent_readiness.pillars import (
     TestingPillar,
 )
 from agent_readiness.scanner import Scanner
+from agent_readiness.serialization import dumps_pretty
 
 console = Console()
 
@@ -49,7 +49,7 @@ def get_pillar_by_name(name: str):
 
 def format_json_output(result) -> str:
     """Format scan result as JSON."""
-    return json.dumps(result.to_dict(), indent=2)
+    return dumps_pretty(result.to_dict())
 
 
 def format_markdown_output(result) -> str:
@@ -0,0 +1,201 @@
+"""Filesystem helpers shared by pillar implementations."""
+
+import mmap
+import os
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import cast
+
+try:
+    import re2  # type: ignore[import-untyped]
+except ImportError:
+    re2 = None
+
+# Below this size a plain read is cheaper than setting up a mapping
+MMAP_THRESHOLD = 16 * 1024
+
+# Vendored, generated and VCS directories that never hold project sources
+PRUNE_DIRS = frozenset(
+    {".git", "node_modules", ".venv", "venv", "__pycache__", "dist", "build", ".tox", ".mypy_cache"}
+)
+
+
+def compile_pattern(pattern: bytes, ignore_case: bool = False) -> re.Pattern[bytes]:
+    """Compile a bytes pattern, preferring google-re2 when it is installed.
+
+    RE2 matches in linear time, so scanning untrusted files cannot backtrack
+    catastrophically. Patterns RE2 rejects fall back to the standard library.
+
+    Args:
+        pattern: Regular expression source
+        ignore_case: Whether to match case-insensitively
+
+    Returns:
+        Compiled pattern exposing ``search``
+    """
+    if ignore_case:
+        pattern = b"(?i)" + pattern
+    if re2 is not None:
+        try:
+            # RE2 patterns expose the same search API as re.Pattern
+            return cast(re.Pattern[bytes], re2.compile(pattern))
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+def file_matches(path: str | os.PathLike, pattern: re.Pattern[bytes]) -> bool:
+    """Check whether a text file's contents match a bytes pattern.
+
+    Files of at least MMAP_THRESHOLD bytes are memory-mapped so the search only
+    pages in what it reads. Files with a NUL byte in their first 512 bytes are
+    treated as binary and never match.
+
+    Args:
+        path: File to search
+        pattern: Compiled bytes pattern
+
+    Returns:
+        True if the pattern matches the file contents
+    """
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+                data = f.read()
+                if data.find(b"\x00", 0, 512) != -1:
+                    return False
+                return pattern.search(data) is not None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b"\x00", 0, 512) != -1:
+                    return False
+                return pattern.search(mm) is not None
+    except (OSError, ValueError):
+        return False
+
+
+def walk(
+    root: str | os.PathLike,
+    prune: frozenset[str] = PRUNE_DIRS,
+    max_depth: int | None = None,
+) -> Iterator[os.DirEntry]:
+    """Yield every entry below root using an explicit stack of os.scandir calls.
+
+    Directories named in prune are neither yielded nor descended into, and
+    directory symlinks are not followed. Unreadable directories are skipped.
+
+    Args:
+        root: Directory to walk
+        prune: Directory names to skip
+        max_depth: Deepest level to yield, where root's children are level 1;
+            None walks the whole tree
+
+    Yields:
+        os.DirEntry for each file and directory found
+    """
+    stack = [(os.fspath(root), 1)]
+    while stack:
+        path, depth = stack.pop()
+        descend = max_depth is None or depth < max_depth
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name in prune:
+                                continue
+                            if descend:
+                                stack.append((entry.path, depth + 1))
+                    except OSError:
+                        continue
+                    yield entry
+        except OSError:
+            continue
+
+
+def walk_files(
+    root: str | os.PathLike,
+    prune: frozenset[str] = PRUNE_DIRS,
+    max_depth: int | None = None,
+) -> Iterator[os.DirEntry]:
+    """Yield the regular file entries below root, skipping pruned directories.
+
+    Args:
+        root: Directory to walk
+        prune: Directory names to skip
+        max_depth: Deepest level to yield, where root's children are level 1;
+            None walks the whole tree
+
+    Yields:
+        os.DirEntry for each file found
+    """
+    for entry in walk(root, prune, max_depth):
+        try:
+            if entry.is_file():
+                yield entry
+        except OSError:
+            continue
+
+
+@dataclass(frozen=True)
+class DirIndex:
+    """Names of the regular files and directories directly inside one directory.
+
+    Built from a single os.scandir call, so membership tests replace a stat per
+    probed path. Symlinks are classified by their targets, like Path.exists.
+
+    Attributes:
+        path: Directory that was listed
+        files: Names of regular files
+        dirs: Names of directories
+    """
+
+    path: str
+    files: frozenset[str] = frozenset()
+    dirs: frozenset[str] = frozenset()
+    _subdirs: dict[str, "DirIndex"] = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def scan(cls, path: str | os.PathLike) -> "DirIndex":
+        """List a directory once.
+
+        Args:
+            path: Directory to list
+
+        Returns:
+            Index of its entries; empty if the directory is missing or unreadable
+        """
+        path = os.fspath(path)
+        files = set()
+        dirs = set()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            files.add(entry.name)
+                        elif entry.is_dir():
+                            dirs.add(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return cls(path, frozenset(files), frozenset(dirs))
+
+    def subdir(self, name: str) -> "DirIndex":
+        """Return the index of a child directory, listing it at most once.
+
+        Args:
+            name: Child directory name
+
+        Returns:
+            Index of the child; empty if it is not a directory
+        """
+        index = self._subdirs.get(name)
+        if index is None:
+            if name in self.dirs:
+                index = DirIndex.scan(os.path.join(self.path, name))
+            else:
+                index = DirIndex(os.path.join(self.path, name))
+            self._subdirs[name] = index
+        return index
@@ -14,6 +14,7 @@ from mcp.types import Tool, TextContent, Resource
 
 from agent_readiness.cli import get_all_pillars, get_pillar_by_name
 from agent_readiness.scanner import Scanner
+from agent_readiness.serialization import dumps_pretty
 
 # Create MCP server instance
 server = Server("agent-readiness-score")
@@ -53,7 +54,7 @@ class Tools:
 
             # Run scan
             result = scanner.scan(target_path)
-            return json.dumps(result.to_dict(), indent=2)
+            return dumps_pretty(result.to_dict())
 
         except Exception as e:
             return json.dumps({"error": f"Error scanning repository: {str(e)}"})
@@ -84,7 +85,7 @@ class Tools:
             scanner.register_pillar(selected_pillar)
             result = scanner.scan(target_path)
 
-            return json.dumps(result.to_dict(), indent=2)
+            return dumps_pretty(result.to_dict())
 
         except Exception as e:
             return json.dumps({"error": f"Error scanning pillar: {str(e)}"})
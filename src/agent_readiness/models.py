@@ -2,11 +2,15 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
 
-class Severity(Enum):
-    """Check severity levels."""
+class Severity(str, Enum):
+    """Check severity levels.
+
+    Members are also their string values, so JSON encoders serialize them as is.
+    """
 
     INFO = "info"
     WARNING = "warning"
@@ -18,7 +22,7 @@ class Severity(Enum):
     OPTIONAL = "optional"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CheckResult:
     """Result of a single check within a pillar.
 
@@ -126,3 +130,26 @@ class ScanResult:
             5: "Optimizing - Continuous improvement",
         }
         return labels.get(self.maturity_level, "Unknown")
+
+
+@dataclass
+class ScanContext:
+    """State shared by every pillar evaluating one directory in one scan.
+
+    Pillars read files and derive results through these caches so work done
+    by one pillar is reused by the others. A fresh context is made per scan.
+
+    Attributes:
+        root: Directory being scanned
+        changed_files: Files changed since the base ref of an incremental
+            scan, relative to root with forward slashes; None for a full scan
+        file_cache: Decoded file text by path (None if unreadable)
+        parsed_cache: Parsed manifests (TOML/JSON) by path (None if invalid)
+        artifacts: Other derived results, keyed by a name chosen by the pillar
+    """
+
+    root: Path
+    changed_files: frozenset[str] | None = None
+    file_cache: dict[str, str | None] = field(default_factory=dict)
+    parsed_cache: dict[str, dict | None] = field(default_factory=dict)
+    artifacts: dict[str, Any] = field(default_factory=dict)
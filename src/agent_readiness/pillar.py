@@ -1,9 +1,14 @@
 """Base pillar class that all evaluation pillars inherit from."""
 
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from pathlib import Path
 
-from .models import CheckResult, PillarResult
+from .models import CheckResult, PillarResult, ScanContext
+
+# Context of the scan running in the current thread; a context variable rather
+# than pillar state so concurrent scans can share pillar instances
+_scan_context: ContextVar[ScanContext | None] = ContextVar("scan_context", default=None)
 
 
 class Pillar(ABC):
@@ -13,8 +18,8 @@ class Pillar(ABC):
     Pillars are discovered and loaded dynamically by the scanner.
 
     Subclasses must implement:
-        - name: Property returning the pillar name
-        - weight: Property returning the pillar weight (default 1.0)
+        - name: Property (or class attribute) returning the pillar name
+        - weight: Property (or class attribute) returning the pillar weight (default 1.0)
         - evaluate: Method that runs checks and returns results
     """
 
@@ -24,6 +29,20 @@ class Pillar(ABC):
         """Human-readable name of this pillar."""
         pass
 
+    @property
+    def context(self) -> ScanContext | None:
+        """State shared with the other pillars of the scan in progress.
+
+        Set by run for the duration of evaluate in the calling thread; None
+        when checks are called directly.
+        """
+        return _scan_context.get()
+
+    @property
+    def changed_files(self) -> frozenset[str] | None:
+        """Files changed since the base ref of an incremental scan, or None."""
+        return self.context.changed_files if self.context is not None else None
+
     @property
     def weight(self) -> float:
         """Weight of this pillar in overall scoring (default 1.0).
@@ -45,7 +64,7 @@ class Pillar(ABC):
         """
         pass
 
-    def run(self, target_dir: Path) -> PillarResult:
+    def run(self, target_dir: Path, context: ScanContext | None = None) -> PillarResult:
         """Execute pillar evaluation and calculate score.
 
         This is the main entry point called by the scanner.
@@ -54,11 +73,17 @@ class Pillar(ABC):
 
         Args:
             target_dir: Path to the directory to evaluate
+            context: Caches shared with the scan's other pillars, exposed to
+                evaluate as self.context; a private one is made when omitted
 
         Returns:
             PillarResult with checks and calculated score
         """
-        checks = self.evaluate(target_dir)
+        token = _scan_context.set(context if context is not None else ScanContext(root=target_dir))
+        try:
+            checks = self.evaluate(target_dir)
+        finally:
+            _scan_context.reset(token)
 
         # Calculate score as percentage of checks passed
         if not checks:
@@ -1,107 +1,162 @@
 """Build System pillar implementation."""
 
 import json
+import os
+import re
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
+from typing import ClassVar
 
+from agent_readiness.fs import DirIndex, compile_pattern, file_matches
 from agent_readiness.models import CheckResult, Severity
 from agent_readiness.pillar import Pillar
 
+# Package manager files that mark a language at the repository root
+_PKG_MANAGER_FILES: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "python": ("pyproject.toml", "setup.py", "requirements.txt"),
+        "javascript": ("package.json",),
+        "rust": ("Cargo.toml",),
+        "go": ("go.mod",),
+    }
+)
+
+# Lock files that pin each language's dependencies
+_LOCK_FILES: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "python": ("poetry.lock", "Pipfile.lock", "requirements.lock"),
+        "javascript": ("package-lock.json", "yarn.lock", "pnpm-lock.yaml"),
+        "rust": ("Cargo.lock",),
+        "go": ("go.sum",),
+    }
+)
+
+_LANG_MARKERS: Mapping[str, str] = MappingProxyType(
+    {marker: lang for lang, markers in _PKG_MANAGER_FILES.items() for marker in markers}
+)
+
+# A "build" key inside a flat "scripts" object; misses fall back to a full parse
+_BUILD_KEY_RE = re.compile(rb'"scripts"\s*:\s*\{[^}]*"build"\s*:')
+
+# Cache markers per CI system, each an alternation searched in one pass over the
+# config; compile_pattern uses RE2's automaton when installed
+_GITHUB_CACHE_RE = compile_pattern(rb"actions/cache|cache:")
+_GITLAB_CACHE_RE = compile_pattern(rb"cache:")
+_CIRCLECI_CACHE_RE = compile_pattern(rb"save_cache|restore_cache")
+
+# "scripts" sits near the top of package.json, so the probe reads only this much
+_PACKAGE_JSON_HEAD_BYTES = 64 * 1024
+
+
+def _read_head(path: Path, size: int) -> bytes:
+    """Read at most size bytes from the start of a file.
+
+    Args:
+        path: File to read
+        size: Maximum number of bytes to read
+
+    Returns:
+        The leading bytes of the file
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
 
 class BuildPillar(Pillar):
     """Evaluates build reproducibility and dependency management."""
 
-    @property
-    def name(self) -> str:
-        """Human-readable name of this pillar."""
-        return "Build System"
+    # Static, so plain class attributes spare a property call per access
+    name: ClassVar[str] = "Build System"
+    weight: ClassVar[float] = 1.0
 
     def evaluate(self, target_dir: Path) -> list[CheckResult]:
         """Evaluate the target directory for build system checks."""
         results = []
 
+        # List the root once; every check probes it through the shared index
+        index = DirIndex.scan(target_dir)
+
         # Detect languages first
-        languages = self._detect_languages(target_dir)
+        languages = self._detect_languages(target_dir, index)
 
         # Level 1: Package manager exists (per-language)
-        results.extend(self._check_package_manager_exists(target_dir, languages))
+        results.extend(self._check_package_manager_exists(target_dir, languages, index))
 
         # Level 2: Lock file exists (per-language)
-        results.extend(self._check_lock_file_exists(target_dir, languages))
+        results.extend(self._check_lock_file_exists(target_dir, languages, index))
 
         # Level 3: Build script exists (per-language)
-        results.extend(self._check_build_script_exists(target_dir, languages))
+        results.extend(self._check_build_script_exists(target_dir, languages, index))
 
         # Level 4: Build caching (repository-wide)
-        results.append(self._check_build_caching(target_dir))
+        results.append(self._check_build_caching(target_dir, index))
 
         # Level 4: Containerization (repository-wide)
-        results.append(self._check_containerization(target_dir))
+        results.append(self._check_containerization(target_dir, index))
 
         # Level 5: Dependency automation (repository-wide)
-        results.append(self._check_dependency_automation(target_dir))
+        results.append(self._check_dependency_automation(target_dir, index))
 
         # Level 5: Reproducible builds (repository-wide)
-        results.append(self._check_reproducible_builds(target_dir, languages))
+        results.append(self._check_reproducible_builds(target_dir, languages, index))
 
         return results
 
-    def _detect_languages(self, target_dir: Path) -> set[str]:
+    def _detect_languages(self, target_dir: Path, index: DirIndex | None = None) -> set[str]:
         """Detect programming languages by package manager files.
 
+        During a scan the result is kept in the scan context's artifacts under
+        "build_languages", per resolved target directory, so other pillars can
+        reuse it. It is distinct from StylePillar's extension-based languages.
+
         Args:
             target_dir: Directory to scan
+            index: Listing of target_dir; listed here when omitted
 
         Returns:
             Set of detected language names
         """
-        languages = set()
-
-        # Python
-        if (
-            (target_dir / "pyproject.toml").exists()
-            or (target_dir / "setup.py").exists()
-            or (target_dir / "requirements.txt").exists()
-        ):
-            languages.add("python")
-
-        # JavaScript/TypeScript
-        if (target_dir / "package.json").exists():
-            languages.add("javascript")
-
-        # Rust
-        if (target_dir / "Cargo.toml").exists():
-            languages.add("rust")
-
-        # Go
-        if (target_dir / "go.mod").exists():
-            languages.add("go")
-
-        return languages
+        if self.context is not None:
+            cache = self.context.artifacts.setdefault("build_languages", {})
+            key = os.fspath(target_dir.resolve())
+            languages = cache.get(key)
+            if languages is None:
+                languages = cache[key] = frozenset(self._scan_languages(target_dir, index))
+            return set(languages)
+        return self._scan_languages(target_dir, index)
+
+    def _scan_languages(self, target_dir: Path, index: DirIndex | None) -> set[str]:
+        """Match the root listing against the package manager markers."""
+        # One directory listing answers every marker probe
+        if index is None:
+            index = DirIndex.scan(target_dir)
+
+        return {lang for marker, lang in _LANG_MARKERS.items() if marker in index.files}
 
     def _check_package_manager_exists(
-        self, target_dir: Path, languages: set[str]
+        self, target_dir: Path, languages: set[str], index: DirIndex | None = None
     ) -> list[CheckResult]:
         """Check if each language has a package manager file.
 
         Args:
             target_dir: Directory to scan
             languages: Set of detected languages
+            index: Listing of target_dir; listed here when omitted
 
         Returns:
             List of CheckResults, one per language
         """
+        if index is None:
+            index = DirIndex.scan(target_dir)
         results = []
 
-        package_files = {
-            "python": ["pyproject.toml", "setup.py", "requirements.txt"],
-            "javascript": ["package.json"],
-            "rust": ["Cargo.toml"],
-            "go": ["go.mod"],
-        }
-
         for lang in sorted(languages):
-            files = package_files.get(lang, [])
-            found_files = [f for f in files if (target_dir / f).exists()]
+            files = _PKG_MANAGER_FILES.get(lang, ())
+            found_files = [f for f in files if f in index.files]
 
             if found_files:
                 results.append(
@@ -128,29 +183,25 @@ class BuildPillar(Pillar):
         return results
 
     def _check_lock_file_exists(
-        self, target_dir: Path, languages: set[str]
+        self, target_dir: Path, languages: set[str], index: DirIndex | None = None
     ) -> list[CheckResult]:
         """Check if each language has a lock file for reproducibility.
 
         Args:
             target_dir: Directory to scan
             languages: Set of detected languages
+            index: Listing of target_dir; listed here when omitted
 
         Returns:
             List of CheckResults, one per language
         """
+        if index is None:
+            index = DirIndex.scan(target_dir)
         results = []
 
-        lock_files = {
-            "python": ["poetry.lock", "Pipfile.lock", "requirements.lock"],
-            "javascript": ["package-lock.json", "yarn.lock", "pnpm-lock.yaml"],
-            "rust": ["Cargo.lock"],
-            "go": ["go.sum"],
-        }
-
         for lang in sorted(languages):
-            files = lock_files.get(lang, [])
-            found_files = [f for f in files if (target_dir / f).exists()]
+            files = _LOCK_FILES.get(lang, ())
+            found_files = [f for f in files if f in index.files]
 
             if found_files:
                 results.append(
@@ -176,26 +227,29 @@ class BuildPillar(Pillar):
         return results
 
     def _check_build_script_exists(
-        self, target_dir: Path, languages: set[str]
+        self, target_dir: Path, languages: set[str], index: DirIndex | None = None
     ) -> list[CheckResult]:
         """Check if each language has a build script documented.
 
         Args:
             target_dir: Directory to scan
             languages: Set of detected languages
+            index: Listing of target_dir; listed here when omitted
 
         Returns:
             List of CheckResults, one per language
         """
+        if index is None:
+            index = DirIndex.scan(target_dir)
         results = []
 
         for lang in sorted(languages):
             if lang == "python":
                 # Check for Makefile with build target or pyproject.toml with scripts
-                has_makefile = (target_dir / "Makefile").exists()
+                has_makefile = "Makefile" in index.files
                 has_pyproject_scripts = False
 
-                if (target_dir / "pyproject.toml").exists():
+                if "pyproject.toml" in index.files:
                     try:
                         import tomllib
                     except ImportError:
@@ -237,13 +291,17 @@ class BuildPillar(Pillar):
             elif lang == "javascript":
                 # Check for build script in package.json
                 has_build_script = False
-                if (target_dir / "package.json").exists():
+                if "package.json" in index.files:
                     try:
-                        content = (target_dir / "package.json").read_text(
-                            encoding="utf-8", errors="ignore"
-                        )
-                        data = json.loads(content)
-                        has_build_script = "build" in data.get("scripts", {})
+                        package_json = target_dir / "package.json"
+                        head = _read_head(package_json, _PACKAGE_JSON_HEAD_BYTES)
+                        if _BUILD_KEY_RE.search(head):
+                            has_build_script = True
+                        elif b'"build"' in head or len(head) == _PACKAGE_JSON_HEAD_BYTES:
+                            # Only parse when the key appears outside the fast-path
+                            # shape, or may lie past the head of a large file
+                            data = json.loads(package_json.read_bytes())
+                            has_build_script = "build" in data.get("scripts", {})
                     except Exception:
                         pass
 
@@ -297,48 +355,42 @@ class BuildPillar(Pillar):
 
         return results
 
-    def _check_build_caching(self, target_dir: Path) -> CheckResult:
+    def _check_build_caching(
+        self, target_dir: Path, index: DirIndex | None = None
+    ) -> CheckResult:
         """Check if build caching is configured (repository-wide).
 
         Args:
             target_dir: Directory to scan
+            index: Listing of target_dir; listed here when omitted
 
         Returns:
             Single CheckResult for the repository
         """
+        if index is None:
+            index = DirIndex.scan(target_dir)
         found = []
 
         # Check GitHub Actions
-        gh_workflows = target_dir / ".github" / "workflows"
-        if gh_workflows.exists():
-            for workflow_file in gh_workflows.glob("*.yml"):
-                try:
-                    content = workflow_file.read_text(encoding="utf-8", errors="ignore")
-                    if "actions/cache" in content or "cache:" in content:
-                        found.append(f"GitHub Actions ({workflow_file.name})")
-                        break
-                except Exception:
-                    pass
+        gh_workflows = index.subdir(".github").subdir("workflows")
+        for name in sorted(gh_workflows.files):
+            if not name.endswith((".yml", ".yaml")):
+                continue
+            if file_matches(os.path.join(gh_workflows.path, name), _GITHUB_CACHE_RE):
+                found.append(f"GitHub Actions ({name})")
+                break
 
         # Check GitLab CI
-        gitlab_ci = target_dir / ".gitlab-ci.yml"
-        if gitlab_ci.exists():
-            try:
-                content = gitlab_ci.read_text(encoding="utf-8", errors="ignore")
-                if "cache:" in content:
-                    found.append("GitLab CI")
-            except Exception:
-                pass
+        if ".gitlab-ci.yml" in index.files and file_matches(
+            target_dir / ".gitlab-ci.yml", _GITLAB_CACHE_RE
+        ):
+            found.append("GitLab CI")
 
         # Check CircleCI
-        circleci_config = target_dir / ".circleci" / "config.yml"
-        if circleci_config.exists():
-            try:
-                content = circleci_config.read_text(encoding="utf-8", errors="ignore")
-                if "save_cache" in content or "restore_cache" in content:
-                    found.append("CircleCI")
-            except Exception:
-                pass
+        if "config.yml" in index.subdir(".circleci").files and file_matches(
+            target_dir / ".circleci" / "config.yml", _CIRCLECI_CACHE_RE
+        ):
+            found.append("CircleCI")
 
         if found:
             return CheckResult(
@@ -357,27 +409,32 @@ class BuildPillar(Pillar):
                 level=4,
             )
 
-    def _check_containerization(self, target_dir: Path) -> CheckResult:
+    def _check_containerization(
+        self, target_dir: Path, index: DirIndex | None = None
+    ) -> CheckResult:
         """Check if containerization is configured (repository-wide).
 
         Args:
             target_dir: Directory to scan
+            index: Listing of target_dir; listed here when omitted
 
         Returns:
             Single CheckResult for the repository
         """
+        if index is None:
+            index = DirIndex.scan(target_dir)
         found = []
 
-        if (target_dir / "Dockerfile").exists():
+        if "Dockerfile" in index.files:
             found.append("Dockerfile")
 
-        if (target_dir / "Containerfile").exists():
+        if "Containerfile" in index.files:
             found.append("Containerfile")
 
-        if (target_dir / ".devcontainer" / "devcontainer.json").exists():
+        if "devcontainer.json" in index.subdir(".devcontainer").files:
             found.append("devcontainer")
 
-        if (target_dir / "docker-compose.yml").exists():
+        if "docker-compose.yml" in index.files:
             found.append("docker-compose.yml")
 
         if found:
@@ -397,26 +454,31 @@ class BuildPillar(Pillar):
                 level=4,
             )
 
-    def _check_dependency_automation(self, target_dir: Path) -> CheckResult:
+    def _check_dependency_automation(
+        self, target_dir: Path, index: DirIndex | None = None
+    ) -> CheckResult:
         """Check if automatic dependency updates are configured (repository-wide).
 
         Args:
             target_dir: Directory to scan
+            index: Listing of target_dir; listed here when omitted
 
         Returns:
             Single CheckResult for the repository
         """
+        if index is None:
+            index = DirIndex.scan(target_dir)
         found = []
 
-        if (target_dir / ".github" / "dependabot.yml").exists():
+        github = index.subdir(".github")
+
+        if "dependabot.yml" in github.files:
             found.append("Dependabot")
 
-        if (target_dir / "renovate.json").exists() or (
-            target_dir / ".renovaterc"
-        ).exists():
+        if "renovate.json" in index.files or ".renovaterc" in index.files:
             found.append("Renovate")
 
-        if (target_dir / ".github" / "renovate.json").exists():
+        if "renovate.json" in github.files:
             found.append("Renovate")
 
         if found:
@@ -437,31 +499,27 @@ class BuildPillar(Pillar):
             )
 
     def _check_reproducible_builds(
-        self, target_dir: Path, languages: set[str]
+        self, target_dir: Path, languages: set[str], index: DirIndex | None = None
     ) -> CheckResult:
         """Check if reproducible builds are configured (repository-wide).
 
         Args:
             target_dir: Directory to scan
             languages: Set of detected languages
+            index: Listing of target_dir; listed here when omitted
 
         Returns:
             Single CheckResult for the repository
         """
+        if index is None:
+            index = DirIndex.scan(target_dir)
         criteria = []
 
         # Check if all languages have lock files
-        lock_files = {
-            "python": ["poetry.lock", "Pipfile.lock", "requirements.lock"],
-            "javascript": ["package-lock.json", "yarn.lock", "pnpm-lock.yaml"],
-            "rust": ["Cargo.lock"],
-            "go": ["go.sum"],
-        }
-
         all_have_locks = True
         for lang in languages:
-            files = lock_files.get(lang, [])
-            if not any((target_dir / f).exists() for f in files):
+            files = _LOCK_FILES.get(lang, ())
+            if not any(f in index.files for f in files):
                 all_have_locks = False
                 break
 
@@ -474,7 +532,7 @@ class BuildPillar(Pillar):
 
         for doc in doc_files:
             doc_path = target_dir / doc
-            if doc_path.exists():
+            if doc in index.files:
                 try:
                     content = doc_path.read_text(encoding="utf-8", errors="ignore").lower()
                     if any(keyword in content for keyword in reproducibility_keywords):
@@ -1,11 +1,58 @@
 """Debugging and Observability pillar implementation."""
 
 import re
+from dataclasses import dataclass
 from pathlib import Path
 
+from agent_readiness.fs import walk_files
 from agent_readiness.pillar import Pillar
 from agent_readiness.models import CheckResult, Severity
 
+# Patterns applied to every Python source, compiled once at import
+_FUNCTION_DEF_RE = re.compile(r"def \w+\(")
+_RAISE_CALL_RE = re.compile(r"raise \w+\((.*?)\)")
+_RAISE_FROM_RE = re.compile(r"raise.*from\s+\w+")
+
+# Source keywords that indicate custom metrics
+_METRICS_KEYWORDS = ("prometheus", "statsd", "metric", "gauge", "counter", "histogram")
+
+
+@dataclass
+class _PythonSignals:
+    """What the checks look for in the repository's Python sources.
+
+    Attributes:
+        logging_library: Last logging library seen imported, if any
+        structlog: Whether structlog is used
+        function_count: Number of function definitions
+        error_handling_count: Number of try/except keywords
+        health_check_endpoint: First file mentioning a health check
+        raise_count: Number of raise statements with a call
+        descriptive_raise_count: How many of those format their message
+        json_logging: Whether logs are serialized as JSON
+        health_route: Whether a /health route is declared
+        request_logging: Whether requests are logged
+        timing: Whether durations are measured
+        error_chaining: Whether exceptions are raised from a cause
+        custom_metrics: Whether custom metrics are recorded
+        resource_monitoring: Whether memory or CPU usage is monitored
+    """
+
+    logging_library: str | None = None
+    structlog: bool = False
+    function_count: int = 0
+    error_handling_count: int = 0
+    health_check_endpoint: Path | None = None
+    raise_count: int = 0
+    descriptive_raise_count: int = 0
+    json_logging: bool = False
+    health_route: bool = False
+    request_logging: bool = False
+    timing: bool = False
+    error_chaining: bool = False
+    custom_metrics: bool = False
+    resource_monitoring: bool = False
+
 
 class DebuggingObservabilityPillar(Pillar):
     """Evaluates debugging and observability infrastructure."""
@@ -59,13 +106,11 @@ class DebuggingObservabilityPillar(Pillar):
             target_dir: Directory to scan
 
         Returns:
-            Dict with observability configuration information
+            Dict with observability configuration information, including the
+            signals found in the Python sources
         """
         logger_config_files = []
         logging_library_found = {}
-        error_handling_count = 0
-        total_functions = 0
-        health_check_endpoint = None
         structured_logging = {}
         monitoring_config = []
         tracing_config = None
@@ -90,18 +135,12 @@ class DebuggingObservabilityPillar(Pillar):
             if "logging" in content.lower():
                 logger_config_files.append(target_dir / "pyproject.toml")
 
-        # Find logging libraries in source
-        for py_file in target_dir.rglob("*.py"):
-            try:
-                content = py_file.read_text(errors="ignore")
-                if "import logging" in content:
-                    logging_library_found["python"] = "logging"
-                if "structlog" in content:
-                    structured_logging["python"] = "structlog"
-                if "loguru" in content:
-                    logging_library_found["python"] = "loguru"
-            except Exception:
-                pass
+        # Read every Python file once, keeping only the signals the checks need
+        python_signals = self._scan_python_sources(target_dir)
+        if python_signals.logging_library:
+            logging_library_found["python"] = python_signals.logging_library
+        if python_signals.structlog:
+            structured_logging["python"] = "structlog"
 
         # Check package.json for logging libraries
         if (target_dir / "package.json").exists():
@@ -111,27 +150,9 @@ class DebuggingObservabilityPillar(Pillar):
                     logging_library_found["node"] = lib
                     structured_logging["node"] = lib
 
-        # Scan for error handling patterns
-        for py_file in target_dir.rglob("*.py"):
-            try:
-                content = py_file.read_text(errors="ignore")
-                # Count function definitions
-                total_functions += len(re.findall(r"def \w+\(", content))
-                # Count error handling
-                error_handling_count += content.count("except")
-                error_handling_count += content.count("try:")
-            except Exception:
-                pass
-
-        # Look for health check endpoint
-        for src_file in target_dir.rglob("*.py"):
-            try:
-                content = src_file.read_text(errors="ignore").lower()
-                if "/health" in content or "healthz" in content or "health_check" in content:
-                    health_check_endpoint = src_file
-                    break
-            except Exception:
-                pass
+        error_handling_count = python_signals.error_handling_count
+        total_functions = python_signals.function_count
+        health_check_endpoint = python_signals.health_check_endpoint
 
         # Find monitoring config files
         for config in [
@@ -145,11 +166,11 @@ class DebuggingObservabilityPillar(Pillar):
                 monitoring_config.append(target_dir / config)
 
         # Check for tracing config
-        for file in target_dir.rglob("*"):
-            if "otel" in file.name.lower() or "tracing" in file.name.lower():
-                if file.is_file():
-                    tracing_config = file
-                    break
+        for entry in walk_files(target_dir):
+            name = entry.name.lower()
+            if "otel" in name or "tracing" in name:
+                tracing_config = Path(entry.path)
+                break
 
         # Look for metrics libraries
         if (target_dir / "pyproject.toml").exists():
@@ -181,8 +202,76 @@ class DebuggingObservabilityPillar(Pillar):
             "metrics_libraries": metrics_libraries,
             "readme_content": readme_content,
             "agents_content": agents_content,
+            "python_signals": python_signals,
         }
 
+    def _scan_python_sources(self, target_dir: Path) -> _PythonSignals:
+        """Read each Python file once and record what the checks look for.
+
+        Vendored and generated directories (fs.PRUNE_DIRS) are skipped, and no
+        file contents are kept.
+
+        Args:
+            target_dir: Directory to scan
+
+        Returns:
+            Counts, flags and the first health check file found
+        """
+        signals = _PythonSignals()
+        for entry in walk_files(target_dir):
+            if not entry.name.endswith(".py"):
+                continue
+            try:
+                with open(entry.path, encoding="utf-8", errors="ignore") as f:
+                    content = f.read()
+            except OSError:
+                continue
+
+            if "import logging" in content:
+                signals.logging_library = "logging"
+            if "loguru" in content:
+                signals.logging_library = "loguru"
+            if "structlog" in content:
+                signals.structlog = True
+
+            signals.function_count += len(_FUNCTION_DEF_RE.findall(content))
+            signals.error_handling_count += content.count("except") + content.count("try:")
+
+            lowered = content.lower()
+            if signals.health_check_endpoint is None and (
+                "/health" in lowered or "healthz" in lowered or "health_check" in lowered
+            ):
+                signals.health_check_endpoint = Path(entry.path)
+
+            raises = _RAISE_CALL_RE.findall(content)
+            signals.raise_count += len(raises)
+            signals.descriptive_raise_count += sum(
+                1 for msg in raises if "{" in msg or 'f"' in msg or "f'" in msg
+            )
+
+            if "json.dumps" in content and "logging" in content:
+                signals.json_logging = True
+            if '"/health"' in content or "'/health'" in content or "/healthz" in content:
+                signals.health_route = True
+            if "access_log" in content or "request_log" in content:
+                signals.request_logging = True
+            if "time.time()" in content or "timeit" in content:
+                signals.timing = True
+            if "raise" in content and "from" in content and _RAISE_FROM_RE.search(content):
+                signals.error_chaining = True
+            if any(keyword in content for keyword in _METRICS_KEYWORDS):
+                signals.custom_metrics = True
+            if "psutil" in content or "resource" in content:
+                signals.resource_monitoring = True
+        return signals
+
+    def _python_signals(self, target_dir: Path, obs: dict) -> _PythonSignals:
+        """Return the Python source signals from discovery, scanning if obs lacks them."""
+        signals = obs.get("python_signals")
+        if signals is None:
+            signals = self._scan_python_sources(target_dir)
+        return signals
+
     # Level 1: Functional
 
     def _check_logging_configuration_exists(
@@ -255,22 +344,9 @@ class DebuggingObservabilityPillar(Pillar):
         self, target_dir: Path, obs: dict
     ) -> CheckResult:
         """Check if error messages are descriptive."""
-        error_count = 0
-        descriptive_count = 0
-
-        for py_file in target_dir.rglob("*.py"):
-            try:
-                content = py_file.read_text(errors="ignore")
-                # Look for raise statements with messages
-                raises = re.findall(r'raise \w+\((.*?)\)', content)
-                error_count += len(raises)
-
-                # Check if they include variables/context
-                for raise_msg in raises:
-                    if "{" in raise_msg or "f\"" in raise_msg or "f'" in raise_msg:
-                        descriptive_count += 1
-            except Exception:
-                pass
+        signals = self._python_signals(target_dir, obs)
+        error_count = signals.raise_count
+        descriptive_count = signals.descriptive_raise_count
 
         if error_count > 0 and descriptive_count / error_count >= 0.5:
             return CheckResult(
@@ -348,19 +424,14 @@ class DebuggingObservabilityPillar(Pillar):
             )
 
         # Check for JSON logging patterns
-        for py_file in target_dir.rglob("*.py"):
-            try:
-                content = py_file.read_text(errors="ignore")
-                if "json.dumps" in content and "logging" in content:
-                    return CheckResult(
-                        name="Structured logging indicators",
-                        passed=True,
-                        message="JSON structured logging detected",
-                        severity=Severity.OPTIONAL,
-                        level=2,
-                    )
-            except Exception:
-                pass
+        if self._python_signals(target_dir, obs).json_logging:
+            return CheckResult(
+                name="Structured logging indicators",
+                passed=True,
+                message="JSON structured logging detected",
+                severity=Severity.OPTIONAL,
+                level=2,
+            )
 
         return CheckResult(
             name="Structured logging indicators",
@@ -384,23 +455,14 @@ class DebuggingObservabilityPillar(Pillar):
             )
 
         # Also check for /health patterns in all Python files
-        for py_file in target_dir.rglob("*.py"):
-            try:
-                content = py_file.read_text(errors="ignore")
-                if (
-                    '"/health"' in content
-                    or "'/health'" in content
-                    or "/healthz" in content
-                ):
-                    return CheckResult(
-                        name="Health check endpoint",
-                        passed=True,
-                        message="Health check endpoint configured",
-                        severity=Severity.OPTIONAL,
-                        level=3,
-                    )
-            except Exception:
-                pass
+        if self._python_signals(target_dir, obs).health_route:
+            return CheckResult(
+                name="Health check endpoint",
+                passed=True,
+                message="Health check endpoint configured",
+                severity=Severity.OPTIONAL,
+                level=3,
+            )
 
         return CheckResult(
             name="Health check endpoint",
@@ -431,19 +493,14 @@ class DebuggingObservabilityPillar(Pillar):
             )
 
         # Check source files
-        for py_file in target_dir.rglob("*.py"):
-            try:
-                file_content = py_file.read_text(errors="ignore")
-                if "access_log" in file_content or "request_log" in file_content:
-                    return CheckResult(
-                        name="Request logging configured",
-                        passed=True,
-                        message="Request logging middleware detected",
-                        severity=Severity.OPTIONAL,
-                        level=3,
-                    )
-            except Exception:
-                pass
+        if self._python_signals(target_dir, obs).request_logging:
+            return CheckResult(
+                name="Request logging configured",
+                passed=True,
+                message="Request logging middleware detected",
+                severity=Severity.OPTIONAL,
+                level=3,
+            )
 
         return CheckResult(
             name="Request logging configured",
@@ -475,19 +532,14 @@ class DebuggingObservabilityPillar(Pillar):
             )
 
         # Check for timing code
-        for py_file in target_dir.rglob("*.py"):
-            try:
-                file_content = py_file.read_text(errors="ignore")
-                if "time.time()" in file_content or "timeit" in file_content:
-                    return CheckResult(
-                        name="Performance metrics configured",
-                        passed=True,
-                        message="Performance metrics detected",
-                        severity=Severity.OPTIONAL,
-                        level=3,
-                    )
-            except Exception:
-                pass
+        if self._python_signals(target_dir, obs).timing:
+            return CheckResult(
+                name="Performance metrics configured",
+                passed=True,
+                message="Performance metrics detected",
+                severity=Severity.OPTIONAL,
+                level=3,
+            )
 
         return CheckResult(
             name="Performance metrics configured",
@@ -501,21 +553,15 @@ class DebuggingObservabilityPillar(Pillar):
         self, target_dir: Path, obs: dict
     ) -> CheckResult:
         """Check if error context is preserved."""
-        for py_file in target_dir.rglob("*.py"):
-            try:
-                content = py_file.read_text(errors="ignore")
-                # Look for exception chaining or wrapping
-                if "raise" in content and "from" in content:
-                    if re.search(r"raise.*from\s+\w+", content):
-                        return CheckResult(
-                            name="Error context preserved",
-                            passed=True,
-                            message="Error context preservation detected",
-                            severity=Severity.OPTIONAL,
-                            level=3,
-                        )
-            except Exception:
-                pass
+        # Look for exception chaining or wrapping
+        if self._python_signals(target_dir, obs).error_chaining:
+            return CheckResult(
+                name="Error context preserved",
+                passed=True,
+                message="Error context preservation detected",
+                severity=Severity.OPTIONAL,
+                level=3,
+            )
 
         return CheckResult(
             name="Error context preserved",
@@ -614,18 +660,10 @@ class DebuggingObservabilityPillar(Pillar):
                 level=4,
             )
 
-        # Look for metrics in code
-        metrics_keywords = [
-            "prometheus",
-            "statsd",
-            "metric",
-            "gauge",
-            "counter",
-            "histogram",
-        ]
+        # Look for metrics in docs, then code
         content = obs["readme_content"] + obs["agents_content"]
 
-        if any(keyword in content for keyword in metrics_keywords):
+        if any(keyword in content for keyword in _METRICS_KEYWORDS):
             return CheckResult(
                 name="Custom metrics present",
                 passed=True,
@@ -635,19 +673,14 @@ class DebuggingObservabilityPillar(Pillar):
             )
 
         # Check source code
-        for py_file in target_dir.rglob("*.py"):
-            try:
-                file_content = py_file.read_text(errors="ignore")
-                if any(keyword in file_content for keyword in metrics_keywords):
-                    return CheckResult(
-                        name="Custom metrics present",
-                        passed=True,
-                        message="Custom metrics detected",
-                        severity=Severity.OPTIONAL,
-                        level=4,
-                    )
-            except Exception:
-                pass
+        if self._python_signals(target_dir, obs).custom_metrics:
+            return CheckResult(
+                name="Custom metrics present",
+                passed=True,
+                message="Custom metrics detected",
+                severity=Severity.OPTIONAL,
+                level=4,
+            )
 
         return CheckResult(
             name="Custom metrics present",
@@ -758,19 +791,14 @@ class DebuggingObservabilityPillar(Pillar):
             )
 
         # Check source code
-        for py_file in target_dir.rglob("*.py"):
-            try:
-                file_content = py_file.read_text(errors="ignore")
-                if "psutil" in file_content or "resource" in file_content:
-                    return CheckResult(
-                        name="Memory/CPU monitoring configured",
-                        passed=True,
-                        message="Memory/CPU monitoring detected",
-                        severity=Severity.OPTIONAL,
-                        level=5,
-                    )
-            except Exception:
-                pass
+        if self._python_signals(target_dir, obs).resource_monitoring:
+            return CheckResult(
+                name="Memory/CPU monitoring configured",
+                passed=True,
+                message="Memory/CPU monitoring detected",
+                severity=Severity.OPTIONAL,
+                level=5,
+            )
 
         return CheckResult(
             name="Memory/CPU monitoring configured",
@@ -1,11 +1,66 @@
 """Security pillar implementation."""
 
+import json
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
 from pathlib import Path
 
+from agent_readiness.fs import compile_pattern, file_matches
 from agent_readiness.pillar import Pillar
 from agent_readiness.models import CheckResult, Severity
 
+_SECRET_TOOLS_RE = compile_pattern(rb"git-secrets|trufflehog|detect-secrets|gitleaks")
+_RUNTIME_RE = compile_pattern(
+    rb"waf|rate_limit|rate-limit|ratelimit|intrusion|security-header|helmet|cors|csrf|ddos",
+    ignore_case=True,
+)
+_THREAT_DOC_RE = compile_pattern(
+    rb"threat|architecture|attack|vulnerability|owasp", ignore_case=True
+)
+
+# Path fragments where runtime protections (WAF, rate limiting, CORS) are usually wired up
+_RUNTIME_PRIORITY_HINTS = ("server", "middleware", "app", "main", "api", "security")
+
+_THREAT_MODEL_FILES = (
+    "THREAT_MODEL.md",
+    "ARCHITECTURE.md",
+    "docs/THREAT_MODEL.md",
+    "docs/ARCHITECTURE.md",
+    "docs/security/THREAT_MODEL.md",
+)
+
+
+def _iter_ci_files(ci_path: Path) -> list[Path]:
+    """Return the CI config files at a path, whether it is a file or a directory."""
+    if ci_path.is_file():
+        return [ci_path]
+    if ci_path.is_dir():
+        return list(ci_path.rglob("*.yml")) + list(ci_path.rglob("*.yaml"))
+    return []
+
+
+def _runtime_priority(path: Path) -> int:
+    """Score how likely a source file is to configure runtime security."""
+    name = f"{path.parent.name}/{path.name}".lower()
+    return sum(hint in name for hint in _RUNTIME_PRIORITY_HINTS)
+
+
+def _any_file_matches(files: list[Path], pattern: re.Pattern[bytes]) -> bool:
+    """Scan files concurrently, stopping at the first match."""
+    if not files:
+        return False
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+        futures = [executor.submit(file_matches, f, pattern) for f in files]
+        try:
+            for future in as_completed(futures):
+                if future.result():
+                    return True
+        finally:
+            for future in futures:
+                future.cancel()
+    return False
+
 
 class SecurityPillar(Pillar):
     """Evaluates security practices and vulnerability management."""
@@ -197,8 +252,6 @@ class SecurityPillar(Pillar):
         # Check package.json/requirements.txt for audit scripts
         if (target_dir / "package.json").exists():
             try:
-                import json
-
                 pkg = json.loads((target_dir / "package.json").read_text())
                 if "scripts" in pkg:
                     for script_name, script in pkg.get("scripts", {}).items():
@@ -227,8 +280,6 @@ class SecurityPillar(Pillar):
         # Check package.json and requirements.txt
         if (target_dir / "package.json").exists():
             try:
-                import json
-
                 pkg = json.loads((target_dir / "package.json").read_text())
                 for dep in list(pkg.get("dependencies", {}).keys()) + list(
                     pkg.get("devDependencies", {}).keys()
@@ -542,8 +593,6 @@ class SecurityPillar(Pillar):
         # Check package.json for audit script
         if (target_dir / "package.json").exists():
             try:
-                import json
-
                 pkg = json.loads((target_dir / "package.json").read_text())
                 if "scripts" in pkg:
                     for script_name, script in pkg.get("scripts", {}).items():
@@ -653,8 +702,6 @@ class SecurityPillar(Pillar):
         # Check package.json
         if (target_dir / "package.json").exists():
             try:
-                import json
-
                 pkg = json.loads((target_dir / "package.json").read_text())
                 for dep in list(pkg.get("dependencies", {}).keys()) + list(
                     pkg.get("devDependencies", {}).keys()
@@ -785,42 +832,13 @@ class SecurityPillar(Pillar):
 
     def _check_secrets_scanning_in_ci(self, target_dir: Path, sec: dict) -> CheckResult:
         """Check if secrets scanning is in CI."""
-        secrets_scanning_found = False
-
-        secret_tools = ["git-secrets", "trufflehog", "detect-secrets", "gitleaks"]
-
-        for ci_file in sec["ci_config"]:
-            ci_path = target_dir / ci_file
-            try:
-                if ci_path.is_file():
-                    content = ci_path.read_text(errors="ignore")
-                    for tool in secret_tools:
-                        if tool in content:
-                            secrets_scanning_found = True
-                            break
-                elif ci_path.is_dir():
-                    for workflow_file in ci_path.rglob("*.yml"):
-                        content = workflow_file.read_text(errors="ignore")
-                        for tool in secret_tools:
-                            if tool in content:
-                                secrets_scanning_found = True
-                                break
-            except Exception:
-                pass
-            if secrets_scanning_found:
-                break
+        ci_files = [p for ci_file in sec["ci_config"] for p in _iter_ci_files(target_dir / ci_file)]
+        secrets_scanning_found = _any_file_matches(ci_files, _SECRET_TOOLS_RE)
 
         # Check .pre-commit-config.yaml
         precommit_path = target_dir / ".pre-commit-config.yaml"
-        if precommit_path.exists():
-            try:
-                content = precommit_path.read_text(errors="ignore")
-                for tool in secret_tools:
-                    if tool in content:
-                        secrets_scanning_found = True
-                        break
-            except Exception:
-                pass
+        if not secrets_scanning_found and precommit_path.exists():
+            secrets_scanning_found = file_matches(precommit_path, _SECRET_TOOLS_RE)
 
         return CheckResult(
             name="Secrets scanning in CI",
@@ -863,40 +881,13 @@ class SecurityPillar(Pillar):
 
     def _check_runtime_security(self, target_dir: Path, sec: dict) -> CheckResult:
         """Check if runtime security measures are indicated."""
-        runtime_indicators = [
-            "waf",
-            "rate_limit",
-            "rate-limit",
-            "ratelimit",
-            "intrusion",
-            "security-header",
-            "helmet",
-            "cors",
-            "csrf",
-            "ddos",
-        ]
-
-        found = False
-
-        # Check source files
-        for source_file in sec["source_files"][:30]:
-            try:
-                content = source_file.read_text(errors="ignore")
-                for indicator in runtime_indicators:
-                    if indicator in content.lower():
-                        found = True
-                        break
-            except Exception:
-                pass
-            if found:
-                break
+        # Check the 30 most promising source files (stable sort keeps discovery order on ties)
+        candidates = sorted(sec["source_files"], key=_runtime_priority, reverse=True)[:30]
+        found = _any_file_matches(candidates, _RUNTIME_RE)
 
         # Check README
-        readme = sec["readme_content"].lower()
-        for indicator in runtime_indicators:
-            if indicator in readme:
-                found = True
-                break
+        if not found and _RUNTIME_RE.search(sec["readme_content"].encode(errors="ignore")):
+            found = True
 
         return CheckResult(
             name="Runtime security measures present",
@@ -912,15 +903,7 @@ class SecurityPillar(Pillar):
     def _check_threat_modeling(self, target_dir: Path, sec: dict) -> CheckResult:
         """Check if threat modeling is documented."""
         threat_model_found = False
-        files_to_check = [
-            "THREAT_MODEL.md",
-            "ARCHITECTURE.md",
-            "docs/THREAT_MODEL.md",
-            "docs/ARCHITECTURE.md",
-            "docs/security/THREAT_MODEL.md",
-        ]
-
-        for file_path in files_to_check:
+        for file_path in _THREAT_MODEL_FILES:
             if (target_dir / file_path).exists():
                 threat_model_found = True
                 break
@@ -929,23 +912,11 @@ class SecurityPillar(Pillar):
         if not threat_model_found:
             docs_dir = target_dir / "docs"
             if docs_dir.exists():
-                for doc_file in docs_dir.rglob("*.md"):
-                    try:
-                        content = doc_file.read_text(errors="ignore")
-                        if any(
-                            phrase in content.lower()
-                            for phrase in [
-                                "threat",
-                                "architecture",
-                                "attack",
-                                "vulnerability",
-                                "owasp",
-                            ]
-                        ):
-                            threat_model_found = True
-                            break
-                    except Exception:
-                        pass
+                # Docs nest at most a couple of levels; avoid walking vendored trees
+                doc_files = chain(
+                    docs_dir.glob("*.md"), docs_dir.glob("*/*.md"), docs_dir.glob("*/*/*.md")
+                )
+                threat_model_found = _any_file_matches(list(doc_files), _THREAT_DOC_RE)
 
         return CheckResult(
             name="Threat modeling documented",
@@ -1,10 +1,80 @@
 """Style & Validation pillar implementation."""
 
+import os
+import re
 from pathlib import Path
 
+from agent_readiness.fs import PRUNE_DIRS, compile_pattern, file_matches, walk_files
 from agent_readiness.models import CheckResult, Severity
 from agent_readiness.pillar import Pillar
 
+_PYPROJECT_LINT_RE = compile_pattern(rb"\[tool\.(?:ruff|pylint|flake8)\]")
+_PYPROJECT_FMT_RE = compile_pattern(rb"\[tool\.black\]|\[tool\.ruff\.format\]")
+_STYLE_DOC_RE = compile_pattern(rb"style|format|lint", ignore_case=True)
+
+_EXT_MAP = {
+    ".py": "python",
+    ".js": "javascript",
+    ".ts": "javascript",
+    ".jsx": "javascript",
+    ".tsx": "javascript",
+    ".go": "go",
+    ".rs": "rust",
+}
+
+_IGNORED_DIRS = PRUNE_DIRS | {"env"}
+
+_LINTER_CONFIGS = {
+    "python": (
+        "ruff.toml",
+        ".ruff.toml",
+        ".flake8",
+        ".pylintrc",
+        "pylint.rc",
+        "pyproject.toml",
+    ),
+    "javascript": (
+        ".eslintrc",
+        ".eslintrc.json",
+        ".eslintrc.js",
+        ".eslintrc.yml",
+        ".eslintrc.yaml",
+        "eslint.config.js",
+    ),
+    "go": (".golangci.yml", ".golangci.yaml"),
+    "rust": ("rustfmt.toml", ".rustfmt.toml"),
+}
+
+_FORMATTER_CONFIGS = {
+    "python": ("pyproject.toml", ".black", "black.toml"),
+    "javascript": (
+        ".prettierrc",
+        ".prettierrc.json",
+        ".prettierrc.js",
+        ".prettierrc.yml",
+        ".prettierrc.yaml",
+        "prettier.config.js",
+    ),
+    "go": ("__builtin__",),  # gofmt is built-in
+    "rust": ("rustfmt.toml", ".rustfmt.toml"),
+}
+
+_CI_CONFIGS = (
+    (".github/workflows", "GitHub Actions"),
+    (".gitlab-ci.yml", "GitLab CI"),
+    (".circleci/config.yml", "CircleCI"),
+    ("azure-pipelines.yml", "Azure Pipelines"),
+    (".travis.yml", "Travis CI"),
+)
+
+_STYLE_GUIDE_FILES = (
+    "STYLE_GUIDE.md",
+    "STYLEGUIDE.md",
+    "docs/STYLE_GUIDE.md",
+    "docs/style-guide.md",
+    "CONTRIBUTING.md",
+)
+
 
 class StylePillar(Pillar):
     """Evaluates code style enforcement and validation tooling."""
@@ -20,6 +90,7 @@ class StylePillar(Pillar):
 
         # Detect languages first
         languages = self._detect_languages(target_dir)
+        top = self._list_top_level(target_dir)
 
         # Level 1: Check for any linter configuration
         results.append(self._check_any_linter_config(target_dir, languages))
@@ -31,7 +102,7 @@ class StylePillar(Pillar):
         results.append(self._check_precommit_hooks(target_dir))
 
         # Level 4: Check for CI integration
-        results.append(self._check_ci_integration(target_dir))
+        results.append(self._check_ci_integration(target_dir, top))
 
         # Level 5: Check for style guide documentation
         results.append(self._check_style_guide_docs(target_dir))
@@ -48,78 +119,59 @@ class StylePillar(Pillar):
             Set of detected language names
         """
         languages = set()
+        all_languages = set(_EXT_MAP.values())
 
-        # Extension to language mapping
-        ext_map = {
-            ".py": "python",
-            ".js": "javascript",
-            ".ts": "javascript",
-            ".jsx": "javascript",
-            ".tsx": "javascript",
-            ".go": "go",
-            ".rs": "rust",
-        }
-
-        # Scan files (limit depth to avoid node_modules, venv, etc.)
-        for ext, lang in ext_map.items():
-            # Check if any files with this extension exist
-            files = list(target_dir.glob(f"**/*{ext}"))
-            # Filter out common ignore patterns
-            files = [
-                f
-                for f in files
-                if not any(
-                    part in f.parts
-                    for part in ["node_modules", "venv", ".venv", "env", ".git", "dist", "build"]
-                )
-            ]
-            if files:
+        # One walk that never enters vendored and build directories (node_modules, venv, etc.)
+        for entry in walk_files(target_dir, _IGNORED_DIRS):
+            lang = _EXT_MAP.get(os.path.splitext(entry.name)[1])
+            if lang is not None:
                 languages.add(lang)
+                if languages == all_languages:
+                    break
 
         return languages
 
+    def _list_top_level(self, target_dir: Path) -> set[str]:
+        """List the entry names directly under the target directory."""
+        try:
+            with os.scandir(target_dir) as entries:
+                return {entry.name for entry in entries}
+        except OSError:
+            return set()
+
+    def _find_config(
+        self, target_dir: Path, config_files: tuple[str, ...], pyproject_section: re.Pattern[bytes]
+    ) -> str | None:
+        """Find the first existing config file for a language.
+
+        Args:
+            target_dir: Directory to scan
+            config_files: Candidate config file names, in priority order
+            pyproject_section: Table header pattern that makes pyproject.toml count
+
+        Returns:
+            Name of the first matching config file, or None
+        """
+        for config_file in config_files:
+            config_path = target_dir / config_file
+            if not config_path.exists():
+                continue
+            if config_file == "pyproject.toml":
+                if pyproject_section.search(config_path.read_bytes()):
+                    return config_file
+            else:
+                return config_file
+        return None
+
     def _check_any_linter_config(self, target_dir: Path, languages: set[str]) -> CheckResult:
         """Check if any linter configuration exists."""
-        linter_configs = {
-            "python": [
-                "ruff.toml",
-                ".ruff.toml",
-                ".flake8",
-                ".pylintrc",
-                "pylint.rc",
-                "pyproject.toml",
-            ],
-            "javascript": [
-                ".eslintrc",
-                ".eslintrc.json",
-                ".eslintrc.js",
-                ".eslintrc.yml",
-                ".eslintrc.yaml",
-                "eslint.config.js",
-            ],
-            "go": [".golangci.yml", ".golangci.yaml"],
-            "rust": ["rustfmt.toml", ".rustfmt.toml"],
-        }
-
         found_configs = []
         for lang in languages:
-            if lang not in linter_configs:
+            if lang not in _LINTER_CONFIGS:
                 continue
-            for config_file in linter_configs[lang]:
-                config_path = target_dir / config_file
-                if config_path.exists():
-                    if config_file == "pyproject.toml":
-                        content = config_path.read_text(encoding="utf-8", errors="ignore")
-                        if (
-                            "[tool.ruff]" in content
-                            or "[tool.pylint]" in content
-                            or "[tool.flake8]" in content
-                        ):
-                            found_configs.append(config_file)
-                            break
-                    else:
-                        found_configs.append(config_file)
-                        break
+            config_file = self._find_config(target_dir, _LINTER_CONFIGS[lang], _PYPROJECT_LINT_RE)
+            if config_file:
+                found_configs.append(config_file)
 
         if found_configs:
             return CheckResult(
@@ -138,23 +190,9 @@ class StylePillar(Pillar):
 
     def _check_formatter_config(self, target_dir: Path, languages: set[str]) -> CheckResult:
         """Check if formatter configuration exists."""
-        formatter_configs = {
-            "python": ["pyproject.toml", ".black", "black.toml"],
-            "javascript": [
-                ".prettierrc",
-                ".prettierrc.json",
-                ".prettierrc.js",
-                ".prettierrc.yml",
-                ".prettierrc.yaml",
-                "prettier.config.js",
-            ],
-            "go": ["__builtin__"],  # gofmt is built-in
-            "rust": ["rustfmt.toml", ".rustfmt.toml"],
-        }
-
         found_configs = []
         for lang in languages:
-            if lang not in formatter_configs:
+            if lang not in _FORMATTER_CONFIGS:
                 continue
 
             # Special case for Go - gofmt is built-in
@@ -162,17 +200,9 @@ class StylePillar(Pillar):
                 found_configs.append("gofmt (built-in)")
                 continue
 
-            for config_file in formatter_configs[lang]:
-                config_path = target_dir / config_file
-                if config_path.exists():
-                    if config_file == "pyproject.toml":
-                        content = config_path.read_text(encoding="utf-8", errors="ignore")
-                        if "[tool.black]" in content or "[tool.ruff.format]" in content:
-                            found_configs.append(config_file)
-                            break
-                    else:
-                        found_configs.append(config_file)
-                        break
+            config_file = self._find_config(target_dir, _FORMATTER_CONFIGS[lang], _PYPROJECT_FMT_RE)
+            if config_file:
+                found_configs.append(config_file)
 
         if found_configs:
             return CheckResult(
@@ -208,20 +238,18 @@ class StylePillar(Pillar):
                 severity=Severity.WARNING,
             )
 
-    def _check_ci_integration(self, target_dir: Path) -> CheckResult:
+    def _check_ci_integration(self, target_dir: Path, top: set[str] | None = None) -> CheckResult:
         """Check if CI integration for linting/formatting exists."""
-        ci_configs = [
-            (".github/workflows", "GitHub Actions"),
-            (".gitlab-ci.yml", "GitLab CI"),
-            (".circleci/config.yml", "CircleCI"),
-            ("azure-pipelines.yml", "Azure Pipelines"),
-            (".travis.yml", "Travis CI"),
-        ]
+        if top is None:
+            top = self._list_top_level(target_dir)
 
         found_ci = []
-        for config_path, ci_name in ci_configs:
-            full_path = target_dir / config_path
-            if full_path.exists():
+        for config_path, ci_name in _CI_CONFIGS:
+            head, _, rest = config_path.partition("/")
+            if head not in top:
+                continue
+            # Nested configs need one extra stat, only when the parent exists
+            if not rest or os.path.exists(os.path.join(target_dir, config_path)):
                 found_ci.append(ci_name)
 
         if found_ci:
@@ -241,22 +269,13 @@ class StylePillar(Pillar):
 
     def _check_style_guide_docs(self, target_dir: Path) -> CheckResult:
         """Check if style guide documentation exists."""
-        style_guide_files = [
-            "STYLE_GUIDE.md",
-            "STYLEGUIDE.md",
-            "docs/STYLE_GUIDE.md",
-            "docs/style-guide.md",
-            "CONTRIBUTING.md",
-        ]
-
         found_docs = []
-        for doc_file in style_guide_files:
+        for doc_file in _STYLE_GUIDE_FILES:
             doc_path = target_dir / doc_file
             if doc_path.exists():
                 # For CONTRIBUTING.md, check if it has style guide content
                 if "CONTRIBUTING" in doc_file:
-                    content = doc_path.read_text(encoding="utf-8", errors="ignore").lower()
-                    if "style" in content or "format" in content or "lint" in content:
+                    if file_matches(doc_path, _STYLE_DOC_RE):
                         found_docs.append(doc_file)
                 else:
                     found_docs.append(doc_file)
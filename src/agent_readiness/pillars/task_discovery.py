@@ -1,11 +1,148 @@
 """Task Discovery pillar implementation."""
 
+import json
+import os
 import re
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
+from agent_readiness.fs import compile_pattern, file_matches, walk_files
 from agent_readiness.pillar import Pillar
 from agent_readiness.models import CheckResult, Severity
 
+# Workflow keywords; the lookahead also reports overlapping hits (e.g. "ml" in "xmlabel")
+_WORKFLOW_KEYWORD_RE = re.compile(
+    rb"(?=(label|add|pull_request|triage|stale|close|archive|release|assign"
+    rb"|comment|feedback|metrics|analytics|status|model|ml))",
+    re.IGNORECASE,
+)
+_TRIAGE_KEYWORDS = frozenset({b"triage", b"stale", b"close", b"archive"})
+_FEEDBACK_KEYWORDS = frozenset({b"comment", b"feedback", b"metrics", b"analytics", b"status"})
+_AUTOMATION_KEYWORDS = frozenset({b"label", b"triage", b"release", b"stale", b"archive"})
+
+# Early-exit file scans (issue templates, TODO comments)
+_LABEL_RE = compile_pattern(rb"label", ignore_case=True)
+_GOOD_FIRST_LABEL_RE = compile_pattern(rb"good-first-issue", ignore_case=True)
+_TODO_RE = compile_pattern(rb"TODO")
+
+# Candidate files, in lookup order
+_CONTRIBUTING_FILES = (
+    "CONTRIBUTING.md",
+    "CONTRIBUTING.rst",
+    ".github/CONTRIBUTING.md",
+    "docs/CONTRIBUTING.md",
+)
+_ROADMAP_FILES = ("ROADMAP.md", "ROADMAP.rst", "docs/ROADMAP.md", "docs/VISION.md", "VISION.md")
+_CI_CONFIGS = (".github/workflows", ".gitlab-ci.yml", ".circleci/config.yml")
+
+# Bytes of package.json/pyproject.toml searched for a version key
+_MANIFEST_HEAD_SIZE = 8192
+
+# README phrases, scanned in one pass; the lookahead reports every phrase even when they
+# overlap, and "contributor" precedes its prefix "contribut" so both families see it
+_README_PHRASE_RE = re.compile(
+    rb"(?=(contributor|contribut|getting involved|how to help|development"
+    rb"|roadmap|vision|plan"
+    rb"|good[- ]first[- ]issue|beginner[- ]friendly|help wanted|starter tasks|easy tasks"
+    rb"|project board|github projects|trello|linear|jira board"
+    rb"|acknowledgments|thanks to|built by"
+    rb"|todo|automated task|error tracking|sentry|bugsnag"
+    rb"|recommend|suggestion|smart match|personalized|machine learning|ai))",
+    re.IGNORECASE,
+)
+# Normalized phrases (lowercase, hyphens as spaces) that set each README flag
+_README_PHRASE_FAMILIES = {
+    "contribution": frozenset(
+        {b"contributor", b"contribut", b"getting involved", b"how to help", b"development"}
+    ),
+    "roadmap": frozenset({b"roadmap", b"vision", b"plan"}),
+    "good_first": frozenset(
+        {
+            b"good first issue",
+            b"beginner friendly",
+            b"help wanted",
+            b"starter tasks",
+            b"easy tasks",
+        }
+    ),
+    "project_board": frozenset(
+        {b"project board", b"github projects", b"trello", b"linear", b"jira board"}
+    ),
+    "contributor": frozenset({b"contributor", b"acknowledgments", b"thanks to", b"built by"}),
+    "task_creation": frozenset(
+        {b"todo", b"automated task", b"error tracking", b"sentry", b"bugsnag"}
+    ),
+    "recommendation": frozenset(
+        {
+            b"recommend",
+            b"suggestion",
+            b"smart match",
+            b"personalized",
+            b"machine learning",
+            b"ai",
+        }
+    ),
+}
+_GOOD_FIRST_RE = compile_pattern(
+    rb"good[- ]first[- ]issue|beginner[- ]friendly|help wanted|starter tasks|easy tasks",
+    ignore_case=True,
+)
+
+
+def _readme_flags(readme: bytes) -> dict[str, bool]:
+    """Scan README bytes once and report which phrase families appear."""
+    phrases = {hit.lower().replace(b"-", b" ") for hit in _README_PHRASE_RE.findall(readme)}
+    return {
+        family: not words.isdisjoint(phrases)
+        for family, words in _README_PHRASE_FAMILIES.items()
+    }
+
+
+def _list_dir(path: str) -> dict[str, os.DirEntry]:
+    """Map the names in a directory to their entries, or {} if it cannot be listed."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
+
+def _workflow_tokens(path: str) -> set[bytes]:
+    """Return the lowercased workflow keywords found in a file."""
+    try:
+        with open(path, "rb") as f:
+            return {hit.lower() for hit in _WORKFLOW_KEYWORD_RE.findall(f.read())}
+    except OSError:
+        return set()
+
+
+def _read_bytes(path: str, limit: int = -1) -> bytes:
+    """Read up to limit raw bytes of a file, returning b"" if it cannot be read."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(limit)
+    except OSError:
+        return b""
+
+
+def _has_version_key(package_json: str) -> bool:
+    """Check whether a package.json declares a top-level version.
+
+    Most manifests without one are rejected from a bounded read of their head;
+    only when "version" appears there is the whole document parsed, so a
+    version string in keywords or a nested object does not count.
+    """
+    if b'"version"' not in _read_bytes(package_json, _MANIFEST_HEAD_SIZE):
+        return False
+    try:
+        data = json.loads(_read_bytes(package_json))
+    except ValueError:
+        return False
+    return isinstance(data, dict) and "version" in data
+
 
 class TaskDiscoveryPillar(Pillar):
     """Evaluates task discovery and issue management infrastructure."""
@@ -15,191 +152,139 @@ class TaskDiscoveryPillar(Pillar):
         """Human-readable name of this pillar."""
         return "Task Discovery"
 
+    def __init__(self) -> None:
+        """Initialize the pillar with an empty discovery cache."""
+        self._discovery_cache: dict[str, Mapping[str, Any]] = {}
+
     def evaluate(self, target_dir: Path) -> list[CheckResult]:
         """Evaluate the target directory for task discovery checks."""
-        results = []
+        # Each evaluation is a fresh scan; caching only spans the checks within it
+        self.clear_cache()
 
-        # Discover task infrastructure
         task = self._discover_task_infrastructure(target_dir)
+        return [check(self, target_dir, task) for check in self._CHECKS]
 
-        # Level 1: Functional
-        results.append(self._check_issue_tracker_present(target_dir, task))
-        results.append(self._check_contributing_guide_exists(target_dir, task))
-
-        # Level 2: Documented
-        results.append(self._check_readme_contribution_section(target_dir, task))
-        results.append(self._check_issues_labeled(target_dir, task))
-        results.append(self._check_roadmap_visible(target_dir, task))
-        results.append(self._check_good_first_issues_marked(target_dir, task))
-
-        # Level 3: Standardized
-        results.append(self._check_issue_templates_exist(target_dir, task))
-        results.append(self._check_pr_templates_exist(target_dir, task))
-        results.append(self._check_project_board_configured(target_dir, task))
-        results.append(self._check_milestones_defined(target_dir, task))
+    def clear_cache(self) -> None:
+        """Forget cached discovery results so the next scan re-reads the repository."""
+        self._discovery_cache.clear()
 
-        # Level 4: Optimized
-        results.append(self._check_automated_issue_labeling(target_dir, task))
-        results.append(self._check_issue_triaging_workflow(target_dir, task))
-        results.append(self._check_release_management(target_dir, task))
-        results.append(self._check_contributor_analytics(target_dir, task))
-
-        # Level 5: Autonomous
-        results.append(self._check_automated_task_creation(target_dir, task))
-        results.append(self._check_intelligent_routing(target_dir, task))
-        results.append(self._check_continuous_feedback(target_dir, task))
-        results.append(self._check_task_recommendations(target_dir, task))
-
-        return results
-
-    def _discover_task_infrastructure(self, target_dir: Path) -> dict:
+    def _discover_task_infrastructure(self, target_dir: Path) -> Mapping[str, Any]:
         """Discover available task and issue management infrastructure.
 
+        Results are cached per resolved target directory: in the scan context's
+        artifacts during a scan, so other pillars can reuse them, and otherwise
+        until clear_cache is called, which evaluate does at the start of every scan.
+
         Args:
             target_dir: Directory to scan
 
         Returns:
-            Dict with task management configuration information
+            Read-only mapping with task management configuration information
         """
+        if self.context is None:
+            cache = self._discovery_cache
+        else:
+            cache = self.context.artifacts.setdefault("task_infrastructure", {})
+        key = os.fspath(target_dir.resolve())
+        task = cache.get(key)
+        if task is None:
+            task = cache[key] = MappingProxyType(self._scan_task_infrastructure(target_dir))
+        return task
+
+    def _scan_task_infrastructure(self, target_dir: Path) -> dict:
+        """Read task and issue management infrastructure from disk."""
         has_github_issues = False
         has_contributing_guide = False
         has_issue_templates = False
         has_pr_templates = False
         has_project_board = False
         has_labels = False
-        has_roadmap = False
         has_milestones = False
-        readme_content = ""
-        contributing_content = ""
+        contributing_bytes = b""
         ci_config = []
-        has_automation = False
         has_codeowners = False
         changelog_found = False
-        github_dir = target_dir / ".github"
+        target_str = os.fspath(target_dir)
+        github_str = os.path.join(target_str, ".github")
+        join = os.path.join
+
+        # List the root and .github once; probes elsewhere fall back to a stat
+        listings = {"": _list_dir(target_str), ".github": _list_dir(github_str)}
+
+        def is_file(rel_path: str) -> bool:
+            parent, _, name = rel_path.rpartition("/")
+            entries = listings.get(parent)
+            if entries is None:
+                return os.path.isfile(join(target_str, rel_path))
+            entry = entries.get(name)
+            return entry is not None and entry.is_file()
+
+        def is_dir(rel_path: str) -> bool:
+            parent, _, name = rel_path.rpartition("/")
+            entry = listings[parent].get(name)
+            return entry is not None and entry.is_dir()
 
         # Check for GitHub Issues
-        if github_dir.exists():
+        if is_dir(".github"):
             has_github_issues = True
 
         # Check for contributing guide
-        for contrib_file in [
-            "CONTRIBUTING.md",
-            "CONTRIBUTING.rst",
-            ".github/CONTRIBUTING.md",
-            "docs/CONTRIBUTING.md",
-        ]:
-            contrib_path = target_dir / contrib_file
-            if contrib_path.exists():
+        for contrib_file in _CONTRIBUTING_FILES:
+            if is_file(contrib_file):
                 has_contributing_guide = True
-                try:
-                    contributing_content = contrib_path.read_text(errors="ignore")
-                except Exception:
-                    pass
+                contributing_bytes = _read_bytes(join(target_str, contrib_file))
                 break
 
         # Check for issue templates
-        if (github_dir / "ISSUE_TEMPLATE").exists():
-            has_issue_templates = True
-        elif (target_dir / "issue_template.md").exists():
+        if is_dir(".github/ISSUE_TEMPLATE") or is_file("issue_template.md"):
             has_issue_templates = True
 
         # Check for PR templates
-        if (github_dir / "pull_request_template.md").exists():
-            has_pr_templates = True
-        elif (github_dir / "PULL_REQUEST_TEMPLATE.md").exists():
-            has_pr_templates = True
-        elif (github_dir / "PULL_REQUEST_TEMPLATE").exists():
+        if (
+            is_file(".github/pull_request_template.md")
+            or is_file(".github/PULL_REQUEST_TEMPLATE.md")
+            or is_dir(".github/PULL_REQUEST_TEMPLATE")
+        ):
             has_pr_templates = True
 
         # Check for project board config
-        if (github_dir / "project.yml").exists() or (
-            github_dir / "projects.yml"
-        ).exists():
+        if is_file(".github/project.yml") or is_file(".github/projects.yml"):
             has_project_board = True
 
         # Check for labels
-        if (github_dir / "labels.json").exists():
+        if is_file(".github/labels.json"):
             has_labels = True
 
         # Check for roadmap
-        for roadmap_file in [
-            "ROADMAP.md",
-            "ROADMAP.rst",
-            "docs/ROADMAP.md",
-            "docs/VISION.md",
-            "VISION.md",
-        ]:
-            if (target_dir / roadmap_file).exists():
-                has_roadmap = True
-                break
+        has_roadmap = any(is_file(roadmap_file) for roadmap_file in _ROADMAP_FILES)
 
         # Check for milestones/versions
-        if (target_dir / "CHANGELOG.md").exists() or (
-            target_dir / "CHANGELOG.rst"
-        ).exists():
+        if is_file("CHANGELOG.md") or is_file("CHANGELOG.rst"):
             has_milestones = True
             changelog_found = True
 
-        # Check package.json or pyproject.toml for version info
-        if (target_dir / "package.json").exists():
-            try:
-                import json
-
-                pkg = json.loads((target_dir / "package.json").read_text())
-                if "version" in pkg:
-                    has_milestones = True
-            except Exception:
-                pass
-
-        if (target_dir / "pyproject.toml").exists():
-            try:
-                content = (target_dir / "pyproject.toml").read_text(errors="ignore")
-                if "version" in content.lower():
-                    has_milestones = True
-            except Exception:
-                pass
-
-        # Check for README
-        readme_path = target_dir / "README.md"
-        if readme_path.exists():
-            try:
-                readme_content = readme_path.read_text(errors="ignore")
-            except Exception:
-                pass
+        # Check package.json or pyproject.toml for version info; the key sits near the top
+        if _has_version_key(join(target_str, "package.json")):
+            has_milestones = True
+
+        pyproject_head = _read_bytes(join(target_str, "pyproject.toml"), _MANIFEST_HEAD_SIZE)
+        if b"version" in pyproject_head.lower():
+            has_milestones = True
+
+        # Read the README, if any
+        readme_bytes = _read_bytes(join(target_str, "README.md"))
 
         # Check for CI config
-        for ci_file in [
-            ".github/workflows",
-            ".gitlab-ci.yml",
-            ".circleci/config.yml",
-        ]:
-            ci_path = target_dir / ci_file
-            if ci_path.exists():
+        for ci_file in _CI_CONFIGS:
+            if os.path.exists(join(target_str, ci_file)):
                 ci_config.append(ci_file)
 
-                # Check for automation in workflows
-                if ci_path.is_dir():
-                    for workflow in ci_path.rglob("*.yml"):
-                        try:
-                            content = workflow.read_text(errors="ignore")
-                            if any(
-                                keyword in content.lower()
-                                for keyword in [
-                                    "label",
-                                    "triage",
-                                    "release",
-                                    "stale",
-                                    "archive",
-                                ]
-                            ):
-                                has_automation = True
-                        except Exception:
-                            pass
+        # Scan workflows once; the Level 4/5 checks read the resulting flags
+        workflow_flags = self._scan_workflows(join(github_str, "workflows"))
+        has_automation = workflow_flags["has_automation"]
 
         # Check for CODEOWNERS
-        if (github_dir / "CODEOWNERS").exists():
-            has_codeowners = True
-        elif (target_dir / "CODEOWNERS").exists():
+        if is_file(".github/CODEOWNERS") or is_file("CODEOWNERS"):
             has_codeowners = True
 
         return {
@@ -211,17 +296,76 @@ class TaskDiscoveryPillar(Pillar):
             "has_labels": has_labels,
             "has_roadmap": has_roadmap,
             "has_milestones": has_milestones,
-            "readme_content": readme_content,
-            "contributing_content": contributing_content,
+            "readme_bytes": readme_bytes,
+            "readme_flags": _readme_flags(readme_bytes),
+            "contributing_bytes": contributing_bytes,
             "ci_config": ci_config,
             "has_automation": has_automation,
+            "workflow_flags": workflow_flags,
             "has_codeowners": has_codeowners,
             "changelog_found": changelog_found,
+            "root_names": frozenset(listings[""]),
         }
 
+    def _scan_workflows(self, workflows_dir: str) -> dict:
+        """Read each GitHub workflow once and record which automation it configures.
+
+        Args:
+            workflows_dir: The .github/workflows directory
+
+        Returns:
+            Dict of boolean flags consumed by the workflow-based checks
+        """
+        flags = {
+            "has_automation": False,
+            "has_label_add": False,
+            "has_triage": False,
+            "has_release_workflow": False,
+            "has_assign": False,
+            "has_feedback": False,
+            "has_ml": False,
+        }
+        try:
+            with os.scandir(workflows_dir) as entries:
+                workflows = [
+                    entry
+                    for entry in entries
+                    if entry.name.endswith((".yml", ".yaml")) and entry.is_file()
+                ]
+        except OSError:
+            return flags
+
+        # Overlap the reads when there are enough workflows to amortize the pool
+        paths = [entry.path for entry in workflows]
+        if len(workflows) > 2:
+            with ThreadPoolExecutor(max_workers=min(8, len(workflows))) as executor:
+                scanned = list(executor.map(_workflow_tokens, paths))
+        else:
+            scanned = [_workflow_tokens(path) for path in paths]
+
+        for entry, tokens in zip(workflows, scanned):
+            if tokens & _AUTOMATION_KEYWORDS:
+                flags["has_automation"] = True
+            if b"label" in tokens and (b"add" in tokens or b"pull_request" in tokens):
+                flags["has_label_add"] = True
+            if tokens & _TRIAGE_KEYWORDS:
+                flags["has_triage"] = True
+            if "release" in entry.name and b"release" in tokens:
+                flags["has_release_workflow"] = True
+            if b"assign" in tokens:
+                flags["has_assign"] = True
+            if tokens & _FEEDBACK_KEYWORDS:
+                flags["has_feedback"] = True
+            if b"ml" in tokens or b"model" in tokens:
+                flags["has_ml"] = True
+
+        return flags
+
     # Level 1: Functional
 
-    def _check_issue_tracker_present(self, target_dir: Path, task: dict) -> CheckResult:
+    def _check_issue_tracker_present(
+        self, target_dir: Path, task: Mapping[str, Any]
+    ) -> CheckResult:
         """Check if an issue tracker is configured."""
         passed = task["has_github_issues"]
         return CheckResult(
@@ -235,7 +379,9 @@ class TaskDiscoveryPillar(Pillar):
             metadata={"github_issues": task["has_github_issues"]},
         )
 
-    def _check_contributing_guide_exists(self, target_dir: Path, task: dict) -> CheckResult:
+    def _check_contributing_guide_exists(
+        self, target_dir: Path, task: Mapping[str, Any]
+    ) -> CheckResult:
         """Check if a contributing guide exists."""
         passed = task["has_contributing_guide"]
         return CheckResult(
@@ -246,18 +392,15 @@ class TaskDiscoveryPillar(Pillar):
             else "No contribution guide found",
             severity=Severity.REQUIRED,
             level=1,
-            metadata={},
         )
 
     # Level 2: Documented
 
-    def _check_readme_contribution_section(self, target_dir: Path, task: dict) -> CheckResult:
+    def _check_readme_contribution_section(
+        self, target_dir: Path, task: Mapping[str, Any]
+    ) -> CheckResult:
         """Check if README has contribution section."""
-        readme = task["readme_content"].lower()
-        passed = any(
-            phrase in readme
-            for phrase in ["contribut", "getting involved", "how to help", "development"]
-        )
+        passed = task["readme_flags"]["contribution"]
 
         return CheckResult(
             name="README contribution section",
@@ -267,23 +410,16 @@ class TaskDiscoveryPillar(Pillar):
             else "No contribution section in README",
             severity=Severity.RECOMMENDED,
             level=2,
-            metadata={},
         )
 
-    def _check_issues_labeled(self, target_dir: Path, task: dict) -> CheckResult:
+    def _check_issues_labeled(self, target_dir: Path, task: Mapping[str, Any]) -> CheckResult:
         """Check if issues are labeled."""
         passed = task["has_labels"]
 
         # Also check for label references in templates
-        if not passed and (target_dir / ".github" / "ISSUE_TEMPLATE").exists():
-            for template in (target_dir / ".github" / "ISSUE_TEMPLATE").glob("*.md"):
-                try:
-                    content = template.read_text(errors="ignore")
-                    if "label" in content.lower():
-                        passed = True
-                        break
-                except Exception:
-                    pass
+        if not passed:
+            templates = (target_dir / ".github" / "ISSUE_TEMPLATE").glob("*.md")
+            passed = any(file_matches(template, _LABEL_RE) for template in templates)
 
         return CheckResult(
             name="Issues labeled",
@@ -296,15 +432,13 @@ class TaskDiscoveryPillar(Pillar):
             metadata={"has_labels": task["has_labels"]},
         )
 
-    def _check_roadmap_visible(self, target_dir: Path, task: dict) -> CheckResult:
+    def _check_roadmap_visible(self, target_dir: Path, task: Mapping[str, Any]) -> CheckResult:
         """Check if roadmap or vision is visible."""
         passed = task["has_roadmap"]
 
         # Also check README for roadmap section
         if not passed:
-            readme = task["readme_content"].lower()
-            if "roadmap" in readme or "vision" in readme or "plan" in readme:
-                passed = True
+            passed = task["readme_flags"]["roadmap"]
 
         return CheckResult(
             name="Roadmap visible",
@@ -317,53 +451,19 @@ class TaskDiscoveryPillar(Pillar):
             metadata={"roadmap_file": task["has_roadmap"]},
         )
 
-    def _check_good_first_issues_marked(self, target_dir: Path, task: dict) -> CheckResult:
+    def _check_good_first_issues_marked(
+        self, target_dir: Path, task: Mapping[str, Any]
+    ) -> CheckResult:
         """Check if good-first-issue labels are indicated."""
-        passed = False
-
-        # Check contributing guide
-        contrib = task["contributing_content"].lower()
-        if any(
-            phrase in contrib
-            for phrase in [
-                "good-first-issue",
-                "good first issue",
-                "beginner-friendly",
-                "beginner friendly",
-                "help wanted",
-                "starter tasks",
-                "easy tasks",
-            ]
-        ):
-            passed = True
-
-        # Check README
+        # Check contributing guide, then README
+        passed = bool(_GOOD_FIRST_RE.search(task["contributing_bytes"]))
         if not passed:
-            readme = task["readme_content"].lower()
-            if any(
-                phrase in readme
-                for phrase in [
-                    "good-first-issue",
-                    "good first issue",
-                    "beginner-friendly",
-                    "help wanted",
-                    "starter tasks",
-                ]
-            ):
-                passed = True
+            passed = task["readme_flags"]["good_first"]
 
         # Check for good-first-issue label mentions in templates
         if not passed:
-            for template in (target_dir / ".github" / "ISSUE_TEMPLATE").glob(
-                "*.md"
-            ) if (target_dir / ".github" / "ISSUE_TEMPLATE").exists() else []:
-                try:
-                    content = template.read_text(errors="ignore")
-                    if "good-first-issue" in content.lower():
-                        passed = True
-                        break
-                except Exception:
-                    pass
+            templates = (target_dir / ".github" / "ISSUE_TEMPLATE").glob("*.md")
+            passed = any(file_matches(template, _GOOD_FIRST_LABEL_RE) for template in templates)
 
         return CheckResult(
             name="Good-first-issues marked",
@@ -373,12 +473,13 @@ class TaskDiscoveryPillar(Pillar):
             else "No good-first-issue labels or guidance",
             severity=Severity.RECOMMENDED,
             level=2,
-            metadata={},
         )
 
     # Level 3: Standardized
 
-    def _check_issue_templates_exist(self, target_dir: Path, task: dict) -> CheckResult:
+    def _check_issue_templates_exist(
+        self, target_dir: Path, task: Mapping[str, Any]
+    ) -> CheckResult:
         """Check if issue templates exist."""
         passed = task["has_issue_templates"]
         return CheckResult(
@@ -392,7 +493,7 @@ class TaskDiscoveryPillar(Pillar):
             metadata={"has_templates": task["has_issue_templates"]},
         )
 
-    def _check_pr_templates_exist(self, target_dir: Path, task: dict) -> CheckResult:
+    def _check_pr_templates_exist(self, target_dir: Path, task: Mapping[str, Any]) -> CheckResult:
         """Check if PR template exists."""
         passed = task["has_pr_templates"]
         return CheckResult(
@@ -406,24 +507,15 @@ class TaskDiscoveryPillar(Pillar):
             metadata={"has_template": task["has_pr_templates"]},
         )
 
-    def _check_project_board_configured(self, target_dir: Path, task: dict) -> CheckResult:
+    def _check_project_board_configured(
+        self, target_dir: Path, task: Mapping[str, Any]
+    ) -> CheckResult:
         """Check if project board is configured."""
         passed = task["has_project_board"]
 
         # Also check README for project board mentions
         if not passed:
-            readme = task["readme_content"].lower()
-            if any(
-                phrase in readme
-                for phrase in [
-                    "project board",
-                    "github projects",
-                    "trello",
-                    "linear",
-                    "jira board",
-                ]
-            ):
-                passed = True
+            passed = task["readme_flags"]["project_board"]
 
         return CheckResult(
             name="Project board configured",
@@ -433,18 +525,15 @@ class TaskDiscoveryPillar(Pillar):
             else "No project board configured",
             severity=Severity.RECOMMENDED,
             level=3,
-            metadata={},
         )
 
-    def _check_milestones_defined(self, target_dir: Path, task: dict) -> CheckResult:
+    def _check_milestones_defined(self, target_dir: Path, task: Mapping[str, Any]) -> CheckResult:
         """Check if milestones or release plan is defined."""
         passed = task["has_milestones"]
 
         # Also check for tags or versions in git
         if not passed:
-            git_dir = target_dir / ".git"
-            if git_dir.exists():
-                passed = True
+            passed = ".git" in task["root_names"]
 
         return CheckResult(
             name="Milestones defined",
@@ -462,24 +551,11 @@ class TaskDiscoveryPillar(Pillar):
 
     # Level 4: Optimized
 
-    def _check_automated_issue_labeling(self, target_dir: Path, task: dict) -> CheckResult:
+    def _check_automated_issue_labeling(
+        self, target_dir: Path, task: Mapping[str, Any]
+    ) -> CheckResult:
         """Check if automated issue labeling is configured."""
-        passed = False
-
-        # Check for labeling workflows
-        for ci_file in task["ci_config"]:
-            ci_path = target_dir / ci_file
-            if ci_path.is_dir():
-                for workflow in ci_path.rglob("*.yml"):
-                    try:
-                        content = workflow.read_text(errors="ignore")
-                        if "label" in content.lower() and ("add" in content.lower() or "pull_request" in content):
-                            passed = True
-                            break
-                    except Exception:
-                        pass
-            if passed:
-                break
+        passed = task["workflow_flags"]["has_label_add"]
 
         return CheckResult(
             name="Automated issue labeling",
@@ -489,30 +565,13 @@ class TaskDiscoveryPillar(Pillar):
             else "No automated issue labeling configured",
             severity=Severity.OPTIONAL,
             level=4,
-            metadata={},
         )
 
-    def _check_issue_triaging_workflow(self, target_dir: Path, task: dict) -> CheckResult:
+    def _check_issue_triaging_workflow(
+        self, target_dir: Path, task: Mapping[str, Any]
+    ) -> CheckResult:
         """Check if issue triaging workflow exists."""
-        passed = False
-
-        # Check for triage/stale workflows
-        for ci_file in task["ci_config"]:
-            ci_path = target_dir / ci_file
-            if ci_path.is_dir():
-                for workflow in ci_path.rglob("*.yml"):
-                    try:
-                        content = workflow.read_text(errors="ignore")
-                        if any(
-                            keyword in content.lower()
-                            for keyword in ["triage", "stale", "close", "archive"]
-                        ):
-                            passed = True
-                            break
-                    except Exception:
-                        pass
-            if passed:
-                break
+        passed = task["workflow_flags"]["has_triage"]
 
         return CheckResult(
             name="Issue triaging workflow",
@@ -522,28 +581,15 @@ class TaskDiscoveryPillar(Pillar):
             else "No issue triaging workflow",
             severity=Severity.OPTIONAL,
             level=4,
-            metadata={},
         )
 
-    def _check_release_management(self, target_dir: Path, task: dict) -> CheckResult:
+    def _check_release_management(self, target_dir: Path, task: Mapping[str, Any]) -> CheckResult:
         """Check if release management is configured."""
         passed = task["changelog_found"]
 
         # Check for release workflow
         if not passed:
-            for ci_file in task["ci_config"]:
-                ci_path = target_dir / ci_file
-                if ci_path.is_dir():
-                    for workflow in ci_path.rglob("*release*.yml"):
-                        try:
-                            content = workflow.read_text(errors="ignore")
-                            if "release" in content.lower():
-                                passed = True
-                                break
-                        except Exception:
-                            pass
-                if passed:
-                    break
+            passed = task["workflow_flags"]["has_release_workflow"]
 
         return CheckResult(
             name="Release management",
@@ -553,32 +599,21 @@ class TaskDiscoveryPillar(Pillar):
             else "No release management configured",
             severity=Severity.OPTIONAL,
             level=4,
-            metadata={},
         )
 
-    def _check_contributor_analytics(self, target_dir: Path, task: dict) -> CheckResult:
+    def _check_contributor_analytics(
+        self, target_dir: Path, task: Mapping[str, Any]
+    ) -> CheckResult:
         """Check if contributor analytics or recognition exists."""
         passed = False
 
         # Check for ALL_CONTRIBUTORS
-        if (target_dir / "ALL_CONTRIBUTORS.md").exists() or (
-            target_dir / ".all-contributorsrc"
-        ).exists():
+        if not task["root_names"].isdisjoint(("ALL_CONTRIBUTORS.md", ".all-contributorsrc")):
             passed = True
 
         # Check README for contributor section
         if not passed:
-            readme = task["readme_content"].lower()
-            if any(
-                phrase in readme
-                for phrase in [
-                    "contributor",
-                    "acknowledgments",
-                    "thanks to",
-                    "built by",
-                ]
-            ):
-                passed = True
+            passed = task["readme_flags"]["contributor"]
 
         return CheckResult(
             name="Contributor analytics",
@@ -588,41 +623,21 @@ class TaskDiscoveryPillar(Pillar):
             else "No contributor analytics or tracking",
             severity=Severity.OPTIONAL,
             level=4,
-            metadata={},
         )
 
     # Level 5: Autonomous
 
-    def _check_automated_task_creation(self, target_dir: Path, task: dict) -> CheckResult:
+    def _check_automated_task_creation(
+        self, target_dir: Path, task: Mapping[str, Any]
+    ) -> CheckResult:
         """Check if automated task creation is configured."""
-        passed = False
-
         # Check for TODO detection or error tracking integration
-        readme = task["readme_content"].lower()
-        if any(
-            phrase in readme
-            for phrase in [
-                "todo",
-                "automated task",
-                "error tracking",
-                "sentry",
-                "bugsnag",
-            ]
-        ):
-            passed = True
+        passed = task["readme_flags"]["task_creation"]
 
         # Check for TODO comments in source code
         if not passed:
-            for py_file in (target_dir / "src").rglob("*.py") if (
-                target_dir / "src"
-            ).exists() else []:
-                try:
-                    content = py_file.read_text(errors="ignore")
-                    if "TODO" in content:
-                        passed = True
-                        break
-                except Exception:
-                    pass
+            py_files = (e.path for e in walk_files(target_dir / "src") if e.name.endswith(".py"))
+            passed = any(file_matches(py_file, _TODO_RE) for py_file in py_files)
 
         return CheckResult(
             name="Automated task creation",
@@ -632,28 +647,15 @@ class TaskDiscoveryPillar(Pillar):
             else "No automated task creation",
             severity=Severity.OPTIONAL,
             level=5,
-            metadata={},
         )
 
-    def _check_intelligent_routing(self, target_dir: Path, task: dict) -> CheckResult:
+    def _check_intelligent_routing(self, target_dir: Path, task: Mapping[str, Any]) -> CheckResult:
         """Check if intelligent task routing is configured."""
         passed = task["has_codeowners"]
 
         # Also check for team assignments in workflows
         if not passed:
-            for ci_file in task["ci_config"]:
-                ci_path = target_dir / ci_file
-                if ci_path.is_dir():
-                    for workflow in ci_path.rglob("*.yml"):
-                        try:
-                            content = workflow.read_text(errors="ignore")
-                            if "assignees" in content.lower() or "assign" in content.lower():
-                                passed = True
-                                break
-                        except Exception:
-                            pass
-                if passed:
-                    break
+            passed = task["workflow_flags"]["has_assign"]
 
         return CheckResult(
             name="Intelligent task routing",
@@ -666,33 +668,9 @@ class TaskDiscoveryPillar(Pillar):
             metadata={"has_codeowners": task["has_codeowners"]},
         )
 
-    def _check_continuous_feedback(self, target_dir: Path, task: dict) -> CheckResult:
+    def _check_continuous_feedback(self, target_dir: Path, task: Mapping[str, Any]) -> CheckResult:
         """Check if continuous feedback loops are configured."""
-        passed = False
-
-        # Check for feedback mechanisms in workflows
-        for ci_file in task["ci_config"]:
-            ci_path = target_dir / ci_file
-            if ci_path.is_dir():
-                for workflow in ci_path.rglob("*.yml"):
-                    try:
-                        content = workflow.read_text(errors="ignore")
-                        if any(
-                            keyword in content.lower()
-                            for keyword in [
-                                "comment",
-                                "feedback",
-                                "metrics",
-                                "analytics",
-                                "status",
-                            ]
-                        ):
-                            passed = True
-                            break
-                    except Exception:
-                        pass
-            if passed:
-                break
+        passed = task["workflow_flags"]["has_feedback"]
 
         return CheckResult(
             name="Continuous feedback loops",
@@ -702,43 +680,16 @@ class TaskDiscoveryPillar(Pillar):
             else "No continuous feedback loops",
             severity=Severity.OPTIONAL,
             level=5,
-            metadata={},
         )
 
-    def _check_task_recommendations(self, target_dir: Path, task: dict) -> CheckResult:
+    def _check_task_recommendations(self, target_dir: Path, task: Mapping[str, Any]) -> CheckResult:
         """Check if task recommendation system is indicated."""
-        passed = False
-
         # Check for recommendation system hints
-        readme = task["readme_content"].lower()
-        if any(
-            phrase in readme
-            for phrase in [
-                "recommend",
-                "suggestion",
-                "smart match",
-                "personalized",
-                "machine learning",
-                "ai",
-            ]
-        ):
-            passed = True
+        passed = task["readme_flags"]["recommendation"]
 
         # Check for ML workflows
         if not passed:
-            for ci_file in task["ci_config"]:
-                ci_path = target_dir / ci_file
-                if ci_path.is_dir():
-                    for workflow in ci_path.rglob("*.yml"):
-                        try:
-                            content = workflow.read_text(errors="ignore")
-                            if "ml" in content.lower() or "model" in content.lower():
-                                passed = True
-                                break
-                        except Exception:
-                            pass
-                if passed:
-                    break
+            passed = task["workflow_flags"]["has_ml"]
 
         return CheckResult(
             name="Task recommendations",
@@ -748,5 +699,31 @@ class TaskDiscoveryPillar(Pillar):
             else "No task recommendation system",
             severity=Severity.OPTIONAL,
             level=5,
-            metadata={},
         )
+
+    # Checks run by evaluate, in report order
+    _CHECKS = (
+        # Level 1: Functional
+        _check_issue_tracker_present,
+        _check_contributing_guide_exists,
+        # Level 2: Documented
+        _check_readme_contribution_section,
+        _check_issues_labeled,
+        _check_roadmap_visible,
+        _check_good_first_issues_marked,
+        # Level 3: Standardized
+        _check_issue_templates_exist,
+        _check_pr_templates_exist,
+        _check_project_board_configured,
+        _check_milestones_defined,
+        # Level 4: Optimized
+        _check_automated_issue_labeling,
+        _check_issue_triaging_workflow,
+        _check_release_management,
+        _check_contributor_analytics,
+        # Level 5: Autonomous
+        _check_automated_task_creation,
+        _check_intelligent_routing,
+        _check_continuous_feedback,
+        _check_task_recommendations,
+    )
@@ -1,14 +1,215 @@
 """Testing pillar implementation."""
 
+import json
+import os
+import re
+from collections.abc import Hashable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatchcase
 from pathlib import Path
+from types import MappingProxyType
 
+from agent_readiness.fs import PRUNE_DIRS, compile_pattern, file_matches, walk
 from agent_readiness.pillar import Pillar
 from agent_readiness.models import CheckResult, Severity
 
+# Test file names by language; the matching group's name is the language
+_TEST_FILE_RE = re.compile(
+    r"(?s)(?P<python>test_.*\.py|.*_test\.py)"
+    r"|(?P<javascript>.*\.(?:test|spec)\.[jt]s)"
+    r"|(?P<go>.*_test\.go)"
+    r"|(?P<rust>.*_test\.rs)"
+)
+_TEST_LANGUAGES = ("python", "javascript", "go", "rust")
+
+# Standard test directory names at the repository root, in reporting order
+_TEST_DIR_NAMES = ("tests", "test", "__tests__", "spec")
+
+# Top-level directories searched for nested test/ directories, and how deep
+_NESTED_TEST_DIR_BASES = ("src", "lib")
+_NESTED_TEST_DIR_DEPTH = 6
+
+# Commands that run a test suite, looked for in the README and CI configs
+_TEST_COMMANDS = ("pytest", "npm test", "go test", "cargo test", "make test")
+
+# Leading bytes of the README searched for a documented test command
+_README_SCAN_BYTES = 64 * 1024
+
+# One alternation finds any test command in a single pass over README or CI text
+_TEST_COMMAND_RE = re.compile("|".join(map(re.escape, _TEST_COMMANDS)), re.IGNORECASE)
+
+# Coverage configuration markers in pyproject.toml and JavaScript configs
+_PYTHON_COVERAGE_RE = re.compile(r"--cov|\[tool\.coverage")
+_JAVASCRIPT_COVERAGE_RE = re.compile(r"collectCoverage|coverage")
+
+# package.json dependency tables and coverage tools named in them or in scripts
+_PACKAGE_DEPENDENCY_KEYS = ("dependencies", "devDependencies")
+_JAVASCRIPT_COVERAGE_TOOLS = ("nyc", "c8")
+
+# CI configuration locations: (path, glob for directories, CI name)
+_CI_CONFIGS = (
+    (".github/workflows", "*.yml", "GitHub Actions"),
+    (".github/workflows", "*.yaml", "GitHub Actions"),
+    (".gitlab-ci.yml", None, "GitLab CI"),
+    (".circleci/config.yml", None, "CircleCI"),
+)
+
+# Workflow file name hints, most likely to run tests first
+_CI_FILE_HINTS = ("test", "ci")
+
+_VITEST_CONFIGS = ("vitest.config.js", "vitest.config.ts")
+
+# Source markers of test isolation (fixtures, mocks) by language
+_PYTHON_ISOLATION_PATTERNS = ("@pytest.fixture", "unittest.mock", "from unittest import mock")
+_JAVASCRIPT_ISOLATION_PATTERNS = ("jest.mock", "vi.mock")
+
+# Test files searched per language by the isolation checks
+_ISOLATION_SAMPLE_SIZE = 10
+
+# Bytes alternations so test files are searched without decoding, via mmap when large
+_PYTHON_ISOLATION_RE = compile_pattern(
+    b"|".join(re.escape(p.encode()) for p in _PYTHON_ISOLATION_PATTERNS)
+)
+_JAVASCRIPT_ISOLATION_RE = compile_pattern(
+    b"|".join(re.escape(p.encode()) for p in _JAVASCRIPT_ISOLATION_PATTERNS)
+)
+
+# Vendored, generated and tool directories that never hold project tests
+_SKIP_DIRS = PRUNE_DIRS | {"target", "vendor", ".pytest_cache"}
+
+
+def _table(data: object, *keys: str) -> dict:
+    """Return the nested table at keys, or an empty dict if any level is missing.
+
+    Args:
+        data: Parsed TOML or JSON document
+        keys: Keys to follow from the top level
+
+    Returns:
+        The nested mapping, or {} when a key is absent or not a table
+    """
+    for key in keys:
+        data = data.get(key) if isinstance(data, dict) else None
+    return data if isinstance(data, dict) else {}
+
+
+def _mentions_javascript_coverage(package: dict) -> bool:
+    """Check whether a parsed package.json configures coverage.
+
+    Args:
+        package: Parsed package.json
+
+    Returns:
+        True if jest collects coverage, a script runs coverage, or a coverage
+        tool is a dependency
+    """
+    jest = _table(package, "jest")
+    if jest.get("collectCoverage") or "coverageThreshold" in jest:
+        return True
+    for script in _table(package, "scripts").values():
+        if isinstance(script, str) and (
+            "coverage" in script or script.split(" ", 1)[0] in _JAVASCRIPT_COVERAGE_TOOLS
+        ):
+            return True
+    return any(
+        "coverage" in name or name in _JAVASCRIPT_COVERAGE_TOOLS
+        for key in _PACKAGE_DEPENDENCY_KEYS
+        for name in _table(package, key)
+    )
+
+
+def _ci_file_priority(path: Path) -> tuple[int, str]:
+    """Sort key placing workflow files named like test or CI jobs first.
+
+    Args:
+        path: Workflow file
+
+    Returns:
+        Index of the first hint in the lowercased name (or the number of
+        hints if none match), then the name for a stable order
+    """
+    name = path.name.lower()
+    rank = next((i for i, hint in enumerate(_CI_FILE_HINTS) if hint in name), len(_CI_FILE_HINTS))
+    return rank, name
+
+
+def _classify_test_file(name: str) -> str | None:
+    """Return the language of a test file name, or None if it is not a test file."""
+    match = _TEST_FILE_RE.fullmatch(name)
+    return match.lastgroup if match else None
+
+
+def _find_nested_test_dirs(base: str) -> list[Path]:
+    """Find test/ directories below base, without descending into them.
+
+    Hidden and vendored directories are skipped, and the search stops
+    _NESTED_TEST_DIR_DEPTH levels below base.
+    """
+    found = []
+    stack = [(base, 1)]
+    while stack:
+        path, depth = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                subdirs = [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            continue
+        for entry in subdirs:
+            if entry.name == "test":
+                found.append(Path(entry.path))
+            elif (
+                depth < _NESTED_TEST_DIR_DEPTH
+                and not entry.name.startswith(".")
+                and entry.name not in _SKIP_DIRS
+            ):
+                stack.append((entry.path, depth + 1))
+    return found
+
+
+def _collect_test_files(test_dir: Path) -> list[tuple[str, str, Hashable]]:
+    """Walk a test directory and return (language, path, identity) per test file, in walk order.
+
+    The identity is the test directory's st_dev paired with DirEntry.inode(),
+    which scandir reports without a stat call on POSIX. Filesystems that report
+    no inode number fall back to the file's real path.
+    """
+    found: list[tuple[str, str, Hashable]] = []
+    try:
+        device = os.stat(test_dir).st_dev
+    except OSError:
+        return found
+    # Classify the name before asking for the entry type; most entries are not test files
+    for entry in walk(test_dir, _SKIP_DIRS):
+        lang = _classify_test_file(entry.name)
+        if lang is None:
+            continue
+        try:
+            if not entry.is_file():
+                continue
+            inode = entry.inode()
+        except OSError:
+            continue
+        identity: Hashable = (device, inode) if inode else os.path.realpath(entry.path)
+        found.append((lang, entry.path, identity))
+    return found
+
+
+def _outermost_dirs(dirs: list[Path]) -> list[Path]:
+    """Drop directories nested inside another listed directory, keeping order."""
+    prefixes = [os.path.join(d, "") for d in dirs]
+    return [
+        d
+        for d, prefix in zip(dirs, prefixes)
+        if not any(prefix != other and prefix.startswith(other) for other in prefixes)
+    ]
+
 
 class TestingPillar(Pillar):
     """Evaluates test infrastructure and coverage."""
 
+    # Not a pytest test class, despite the name
+    __test__ = False
+
     @property
     def name(self) -> str:
         """Human-readable name of this pillar."""
@@ -18,22 +219,25 @@ class TestingPillar(Pillar):
         """Evaluate the target directory for testing checks."""
         results = []
 
-        # Detect test infrastructure and languages
+        # Each evaluation is a fresh scan; caching only spans the checks within it
+        self.clear_cache()
+
+        # Detect test infrastructure and languages once; the checks reuse it
         test_info = self._detect_test_infrastructure(target_dir)
         languages = test_info["languages"]
 
         # Level 1: Tests exist
-        results.append(self._check_tests_exist(target_dir))
+        results.append(self._check_tests_exist(target_dir, test_info))
 
         # Level 2: Directory structure and documentation
-        results.append(self._check_test_directory_structure(target_dir))
+        results.append(self._check_test_directory_structure(target_dir, test_info))
         results.append(self._check_test_command_documented(target_dir))
 
         # Level 3: CI integration, coverage config, test isolation
         results.append(self._check_tests_in_ci(target_dir))
         if languages:
-            results.extend(self._check_coverage_measured(target_dir))
-            results.extend(self._check_unit_tests_isolated(target_dir, languages))
+            results.extend(self._check_coverage_measured(target_dir, test_info))
+            results.extend(self._check_unit_tests_isolated(target_dir, languages, test_info))
 
         # Level 4: Parallel config, coverage threshold
         if languages:
@@ -48,69 +252,244 @@ class TestingPillar(Pillar):
 
         return results
 
-    def _detect_test_infrastructure(self, target_dir: Path) -> dict:
+    def __init__(self) -> None:
+        """Initialize the pillar with empty detection and file content caches."""
+        self._infra_cache: dict[str, Mapping] = {}
+        self._readme_cache: dict[str, str | None] = {}
+        self._content_cache: dict[str, str | None] = {}
+        self._parsed_cache: dict[str, dict | None] = {}
+        self._listing_cache: dict[str, Mapping[str, os.DirEntry]] = {}
+
+    def clear_cache(self) -> None:
+        """Forget cached results so the next scan re-reads the repository."""
+        self._infra_cache.clear()
+        self._readme_cache.clear()
+        self._content_cache.clear()
+        self._parsed_cache.clear()
+        self._listing_cache.clear()
+
+    def _list_dir(self, path: str) -> Mapping[str, os.DirEntry]:
+        """Return a directory's entries by name, listing each directory once per scan.
+
+        Checks probe the same handful of config files, so one os.scandir of
+        their directory answers every existence question about it.
+
+        Args:
+            path: Directory to list
+
+        Returns:
+            Read-only mapping of entry name to os.DirEntry; empty if the
+            directory is missing or unreadable
+        """
+        if self.context is None:
+            cache = self._listing_cache
+        else:
+            cache = self.context.artifacts.setdefault("dir_listings", {})
+        listing = cache.get(path)
+        if listing is None:
+            try:
+                with os.scandir(path) as entries:
+                    listing = MappingProxyType({entry.name: entry for entry in entries})
+            except OSError:
+                listing = MappingProxyType({})
+            cache[path] = listing
+        return listing
+
+    def _read_text(self, path: Path) -> str | None:
+        """Return a config file's text, reading each path at most once per scan.
+
+        Several checks inspect the same manifests (pyproject.toml, package.json,
+        Cargo.toml, CI workflows), so the decoded text is memoized. During a
+        scan the memo is the scan context's, shared with the other pillars;
+        otherwise it lasts until clear_cache is called.
+
+        Args:
+            path: File to read
+
+        Returns:
+            File text, or None if it is missing or unreadable
+        """
+        cache = self._content_cache if self.context is None else self.context.file_cache
+        key = os.fspath(path)
+        if key not in cache:
+            directory, name = os.path.split(key)
+            content = None
+            # Files absent from their directory's listing are never opened
+            if name in self._list_dir(directory):
+                try:
+                    with open(key, "rb") as f:
+                        content = f.read().decode("utf-8", errors="ignore")
+                except OSError:
+                    pass
+            cache[key] = content
+        return cache[key]
+
+    def _read_toml(self, path: Path) -> dict | None:
+        """Return a parsed TOML file, parsing each path at most once per scan.
+
+        tomllib is imported on first use, so importing the pillar stays cheap
+        for scans that never meet a pyproject.toml.
+
+        Args:
+            path: File to parse
+
+        Returns:
+            Parsed document, or None if the file is missing, invalid, or
+            tomllib is unavailable
+        """
+        cache = self._parsed_cache if self.context is None else self.context.parsed_cache
+        key = os.fspath(path)
+        if key not in cache:
+            content = self._read_text(path)
+            data = None
+            if content is not None:
+                try:
+                    import tomllib
+
+                    data = tomllib.loads(content)
+                except (ImportError, ValueError):
+                    # Python 3.10 has no tomllib; TOMLDecodeError is a ValueError
+                    pass
+            cache[key] = data
+        return cache[key]
+
+    def _read_json(self, path: Path) -> dict | None:
+        """Return a parsed JSON object file, parsing each path at most once per scan.
+
+        Args:
+            path: File to parse
+
+        Returns:
+            Parsed object, or None if the file is missing, invalid, or not an object
+        """
+        cache = self._parsed_cache if self.context is None else self.context.parsed_cache
+        key = os.fspath(path)
+        if key not in cache:
+            content = self._read_text(path)
+            data = None
+            if content is not None:
+                try:
+                    data = json.loads(content)
+                except ValueError:
+                    pass
+            cache[key] = data if isinstance(data, dict) else None
+        return cache[key]
+
+    def _read_readme(self, target_dir: Path) -> str | None:
+        """Return the start of the README.md text, cached per target directory.
+
+        Only the first _README_SCAN_BYTES are read; test instructions sit well
+        within that in practice.
+
+        Args:
+            target_dir: Directory containing the README
+
+        Returns:
+            README text, or None if there is no README.md
+
+        Raises:
+            OSError: If the README exists but cannot be read
+        """
+        key = os.fspath(target_dir.resolve())
+        if key not in self._readme_cache:
+            try:
+                with open(os.path.join(key, "README.md"), "rb") as f:
+                    head = f.read(_README_SCAN_BYTES)
+            except FileNotFoundError:
+                content = None
+            else:
+                content = head.decode("utf-8", errors="ignore")
+            self._readme_cache[key] = content
+        return self._readme_cache[key]
+
+    def _detect_test_infrastructure(self, target_dir: Path) -> Mapping:
         """Detect test directories and infer languages.
 
+        Results are cached per resolved target directory: in the scan context's
+        artifacts during a scan, so other pillars can reuse them, and otherwise
+        until clear_cache is called, which evaluate does at the start of every scan.
+
         Args:
             target_dir: Directory to scan
 
         Returns:
-            Dict with keys: languages (set), test_dirs (list), test_files (dict)
+            Read-only mapping with keys: languages (set), test_dirs (list),
+            test_files (dict of language to file path strings), total_files (int)
         """
+        if self.context is None:
+            cache = self._infra_cache
+        else:
+            cache = self.context.artifacts.setdefault("test_infrastructure", {})
+        key = os.fspath(target_dir.resolve())
+        test_info = cache.get(key)
+        if test_info is None:
+            test_info = MappingProxyType(self._scan_test_infrastructure(target_dir))
+            cache[key] = test_info
+        return test_info
+
+    def _scan_test_infrastructure(self, target_dir: Path) -> dict:
+        """Walk the repository for test directories and test files."""
         test_dirs = []
-        test_files = {"python": [], "javascript": [], "go": [], "rust": []}
+        test_files = {lang: [] for lang in _TEST_LANGUAGES}
         languages = set()
 
-        # Standard test directory names
-        test_dir_names = ["tests", "test", "__tests__", "spec"]
-
-        # Find test directories
-        for dir_name in test_dir_names:
-            test_dir = target_dir / dir_name
-            if test_dir.exists() and test_dir.is_dir():
-                test_dirs.append(test_dir)
+        # Find standard test directories from a single listing of the root, only
+        # asking the entry type of names that could be one
+        try:
+            with os.scandir(target_dir) as entries:
+                root_dirs = {
+                    entry.name
+                    for entry in entries
+                    if entry.name in _TEST_DIR_NAMES and entry.is_dir()
+                }
+        except OSError:
+            root_dirs = set()
+        for dir_name in _TEST_DIR_NAMES:
+            if dir_name in root_dirs:
+                test_dirs.append(target_dir / dir_name)
 
         # Also check for src/**/test/, lib/**/test/ patterns
-        for pattern in ["src/**/test", "lib/**/test"]:
-            for test_dir in target_dir.glob(pattern):
-                if test_dir.is_dir():
-                    test_dirs.append(test_dir)
-
-        # Scan all found test directories for test files
-        test_patterns = {
-            "python": ["test_*.py", "*_test.py"],
-            "javascript": ["*.test.js", "*.spec.js", "*.test.ts", "*.spec.ts"],
-            "go": ["*_test.go"],
-            "rust": ["*_test.rs"],
-        }
+        for base in _NESTED_TEST_DIR_BASES:
+            test_dirs.extend(_find_nested_test_dirs(os.path.join(target_dir, base)))
+
+        # Walk each outermost test directory once, overlapping the walks when there are several
+        test_dirs = _outermost_dirs(test_dirs)
+        if len(test_dirs) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(test_dirs))) as executor:
+                found = list(executor.map(_collect_test_files, test_dirs))
+        else:
+            found = [_collect_test_files(test_dir) for test_dir in test_dirs]
 
+        # A symlinked test directory can expose the same files twice; keep the first sighting
         seen_files = set()
-        for test_dir in test_dirs:
-            for lang, patterns in test_patterns.items():
-                for pattern in patterns:
-                    for test_file in test_dir.rglob(pattern):
-                        if test_file.is_file() and str(test_file) not in seen_files:
-                            test_files[lang].append(test_file)
-                            languages.add(lang)
-                            seen_files.add(str(test_file))
+        for dir_files in found:
+            for lang, path, identity in dir_files:
+                if identity in seen_files:
+                    continue
+                seen_files.add(identity)
+                test_files[lang].append(path)
+                languages.add(lang)
 
         return {
             "languages": languages,
             "test_dirs": test_dirs,
             "test_files": test_files,
+            "total_files": len(seen_files),
         }
 
-    def _check_tests_exist(self, target_dir: Path) -> CheckResult:
+    def _check_tests_exist(self, target_dir: Path, test_info: Mapping | None = None) -> CheckResult:
         """Check if any tests exist in the repository.
 
         Args:
             target_dir: Directory to scan
+            test_info: Result of _detect_test_infrastructure; detected when omitted
 
         Returns:
             Single CheckResult for the repository
         """
-        test_info = self._detect_test_infrastructure(target_dir)
-        total_files = sum(len(files) for files in test_info["test_files"].values())
+        if test_info is None:
+            test_info = self._detect_test_infrastructure(target_dir)
+        total_files = test_info["total_files"]
 
         if total_files > 0:
             num_dirs = len(test_info["test_dirs"])
@@ -132,17 +511,21 @@ class TestingPillar(Pillar):
                 level=1,
             )
 
-    def _check_test_directory_structure(self, target_dir: Path) -> CheckResult:
+    def _check_test_directory_structure(
+        self, target_dir: Path, test_info: Mapping | None = None
+    ) -> CheckResult:
         """Check if tests are organized in standard directory structure.
 
         Args:
             target_dir: Directory to scan
+            test_info: Result of _detect_test_infrastructure; detected when omitted
 
         Returns:
             Single CheckResult for the repository
         """
-        test_info = self._detect_test_infrastructure(target_dir)
-        total_files = sum(len(files) for files in test_info["test_files"].values())
+        if test_info is None:
+            test_info = self._detect_test_infrastructure(target_dir)
+        total_files = test_info["total_files"]
 
         if total_files == 0:
             return CheckResult(
@@ -153,20 +536,10 @@ class TestingPillar(Pillar):
                 level=2,
             )
 
-        # Count files in standard directories
-        files_in_standard_dirs = 0
-        for test_dir in test_info["test_dirs"]:
-            for lang_files in test_info["test_files"].values():
-                for test_file in lang_files:
-                    try:
-                        test_file.relative_to(test_dir)
-                        files_in_standard_dirs += 1
-                    except ValueError:
-                        pass
+        # Detection only walks the standard test directories, so every file found lies in one
+        files_in_standard_dirs = total_files
 
-        percentage = (files_in_standard_dirs / total_files) * 100 if total_files > 0 else 0
-
-        if percentage >= 50 and len(test_info["test_dirs"]) > 0:
+        if test_info["test_dirs"]:
             return CheckResult(
                 name="Test directory structure",
                 passed=True,
@@ -195,36 +568,34 @@ class TestingPillar(Pillar):
         Returns:
             Single CheckResult for the repository
         """
-        readme_path = target_dir / "README.md"
-        if not readme_path.exists():
+        try:
+            content = self._read_readme(target_dir)
+        except OSError:
             return CheckResult(
                 name="Test command documented",
                 passed=False,
-                message="No README.md found",
+                message="Could not read README.md",
                 severity=Severity.RECOMMENDED,
                 level=2,
             )
 
-        try:
-            content = readme_path.read_text(encoding="utf-8", errors="ignore").lower()
-        except Exception:
+        if content is None:
             return CheckResult(
                 name="Test command documented",
                 passed=False,
-                message="Could not read README.md",
+                message="No README.md found",
                 severity=Severity.RECOMMENDED,
                 level=2,
             )
 
         # Look for test commands
-        test_commands = ["pytest", "npm test", "go test", "cargo test", "make test"]
-        found_commands = [cmd for cmd in test_commands if cmd in content]
+        match = _TEST_COMMAND_RE.search(content)
 
-        if found_commands:
+        if match:
             return CheckResult(
                 name="Test command documented",
                 passed=True,
-                message=f"Test command documented in README.md: '{found_commands[0]}'",
+                message=f"Test command documented in README.md: '{match.group(0).lower()}'",
                 severity=Severity.RECOMMENDED,
                 level=2,
             )
@@ -246,53 +617,31 @@ class TestingPillar(Pillar):
         Returns:
             Single CheckResult for the repository
         """
-        # CI configuration locations to check
-        ci_configs = [
-            (".github/workflows", "*.yml", "GitHub Actions"),
-            (".github/workflows", "*.yaml", "GitHub Actions"),
-            (".gitlab-ci.yml", None, "GitLab CI"),
-            (".circleci/config.yml", None, "CircleCI"),
-        ]
-
-        # Test commands to look for
-        test_commands = ["pytest", "npm test", "go test", "cargo test", "make test"]
-
-        for config_path, pattern, ci_name in ci_configs:
+        for config_path, pattern, ci_name in _CI_CONFIGS:
             if pattern:
-                # Directory with multiple files
+                # Directory with multiple files; likely test workflows are read first
                 ci_dir = target_dir / config_path
-                if ci_dir.exists() and ci_dir.is_dir():
-                    for ci_file in ci_dir.glob(pattern):
-                        try:
-                            content = ci_file.read_text(encoding="utf-8", errors="ignore").lower()
-                            for cmd in test_commands:
-                                if cmd in content:
-                                    return CheckResult(
-                                        name="Tests in CI",
-                                        passed=True,
-                                        message=f"Tests run in CI: {ci_name} ({ci_file.name})",
-                                        severity=Severity.RECOMMENDED,
-                                        level=3,
-                                    )
-                        except Exception:
-                            continue
+                ci_files = sorted(
+                    (
+                        ci_dir / name
+                        for name in self._list_dir(os.fspath(ci_dir))
+                        if fnmatchcase(name, pattern)
+                    ),
+                    key=_ci_file_priority,
+                )
             else:
                 # Single file
-                ci_file = target_dir / config_path
-                if ci_file.exists():
-                    try:
-                        content = ci_file.read_text(encoding="utf-8", errors="ignore").lower()
-                        for cmd in test_commands:
-                            if cmd in content:
-                                return CheckResult(
-                                    name="Tests in CI",
-                                    passed=True,
-                                    message=f"Tests run in CI: {ci_name} ({ci_file.name})",
-                                    severity=Severity.RECOMMENDED,
-                                    level=3,
-                                )
-                    except Exception:
-                        continue
+                ci_files = [target_dir / config_path]
+            for ci_file in ci_files:
+                content = self._read_text(ci_file)
+                if content is not None and _TEST_COMMAND_RE.search(content):
+                    return CheckResult(
+                        name="Tests in CI",
+                        passed=True,
+                        message=f"Tests run in CI: {ci_name} ({ci_file.name})",
+                        severity=Severity.RECOMMENDED,
+                        level=3,
+                    )
 
         return CheckResult(
             name="Tests in CI",
@@ -302,16 +651,20 @@ class TestingPillar(Pillar):
             level=3,
         )
 
-    def _check_coverage_measured(self, target_dir: Path) -> list[CheckResult]:
+    def _check_coverage_measured(
+        self, target_dir: Path, test_info: Mapping | None = None
+    ) -> list[CheckResult]:
         """Check if test coverage is being measured for each language.
 
         Args:
             target_dir: Directory to scan
+            test_info: Result of _detect_test_infrastructure; detected when omitted
 
         Returns:
             List of CheckResult, one per detected language
         """
-        test_info = self._detect_test_infrastructure(target_dir)
+        if test_info is None:
+            test_info = self._detect_test_infrastructure(target_dir)
         results = []
 
         if not test_info["languages"]:
@@ -350,26 +703,29 @@ class TestingPillar(Pillar):
         Returns:
             CheckResult for Python coverage
         """
-        # Check pyproject.toml
+        # Check pyproject.toml for pytest-cov in addopts or a coverage tool section
         pyproject_path = target_dir / "pyproject.toml"
-        if pyproject_path.exists():
-            try:
-                content = pyproject_path.read_text(encoding="utf-8", errors="ignore")
-                # Check for pytest-cov in addopts or coverage tool section
-                if "--cov" in content or "[tool.coverage" in content:
-                    return CheckResult(
-                        name="Coverage measured (python)",
-                        passed=True,
-                        message="Python coverage measured (pytest-cov configured)",
-                        severity=Severity.RECOMMENDED,
-                        level=3,
-                    )
-            except Exception:
-                pass
+        pyproject = self._read_toml(pyproject_path)
+        if pyproject is not None:
+            tool = _table(pyproject, "tool")
+            addopts = _table(tool, "pytest", "ini_options").get("addopts", "")
+            if not isinstance(addopts, str):
+                addopts = " ".join(map(str, addopts))
+            configured = "coverage" in tool or "--cov" in addopts
+        else:
+            content = self._read_text(pyproject_path)
+            configured = bool(content is not None and _PYTHON_COVERAGE_RE.search(content))
+        if configured:
+            return CheckResult(
+                name="Coverage measured (python)",
+                passed=True,
+                message="Python coverage measured (pytest-cov configured)",
+                severity=Severity.RECOMMENDED,
+                level=3,
+            )
 
         # Check .coveragerc
-        coveragerc_path = target_dir / ".coveragerc"
-        if coveragerc_path.exists():
+        if ".coveragerc" in self._list_dir(os.fspath(target_dir)):
             return CheckResult(
                 name="Coverage measured (python)",
                 passed=True,
@@ -380,19 +736,15 @@ class TestingPillar(Pillar):
 
         # Check pytest.ini
         pytest_ini_path = target_dir / "pytest.ini"
-        if pytest_ini_path.exists():
-            try:
-                content = pytest_ini_path.read_text(encoding="utf-8", errors="ignore")
-                if "--cov" in content or "coverage" in content:
-                    return CheckResult(
-                        name="Coverage measured (python)",
-                        passed=True,
-                        message="Python coverage measured (pytest.ini configured)",
-                        severity=Severity.RECOMMENDED,
-                        level=3,
-                    )
-            except Exception:
-                pass
+        content = self._read_text(pytest_ini_path)
+        if content is not None and ("--cov" in content or "coverage" in content):
+            return CheckResult(
+                name="Coverage measured (python)",
+                passed=True,
+                message="Python coverage measured (pytest.ini configured)",
+                severity=Severity.RECOMMENDED,
+                level=3,
+            )
 
         # Not configured
         return CheckResult(
@@ -419,52 +771,45 @@ class TestingPillar(Pillar):
         """
         # Check package.json
         package_json_path = target_dir / "package.json"
-        if package_json_path.exists():
-            try:
-                content = package_json_path.read_text(encoding="utf-8", errors="ignore")
-                if "collectCoverage" in content or "coverage" in content:
-                    return CheckResult(
-                        name="Coverage measured (javascript)",
-                        passed=True,
-                        message="JavaScript coverage measured (package.json configured)",
-                        severity=Severity.RECOMMENDED,
-                        level=3,
-                    )
-            except Exception:
-                pass
+        package = self._read_json(package_json_path)
+        if package is not None:
+            configured = _mentions_javascript_coverage(package)
+        else:
+            content = self._read_text(package_json_path)
+            configured = bool(content is not None and _JAVASCRIPT_COVERAGE_RE.search(content))
+        if configured:
+            return CheckResult(
+                name="Coverage measured (javascript)",
+                passed=True,
+                message="JavaScript coverage measured (package.json configured)",
+                severity=Severity.RECOMMENDED,
+                level=3,
+            )
 
         # Check jest.config.js
         jest_config_path = target_dir / "jest.config.js"
-        if jest_config_path.exists():
-            try:
-                content = jest_config_path.read_text(encoding="utf-8", errors="ignore")
-                if "collectCoverage" in content or "coverage" in content:
-                    return CheckResult(
-                        name="Coverage measured (javascript)",
-                        passed=True,
-                        message="JavaScript coverage measured (jest.config.js configured)",
-                        severity=Severity.RECOMMENDED,
-                        level=3,
-                    )
-            except Exception:
-                pass
+        content = self._read_text(jest_config_path)
+        if content is not None and _JAVASCRIPT_COVERAGE_RE.search(content):
+            return CheckResult(
+                name="Coverage measured (javascript)",
+                passed=True,
+                message="JavaScript coverage measured (jest.config.js configured)",
+                severity=Severity.RECOMMENDED,
+                level=3,
+            )
 
         # Check vitest.config
-        for vitest_config in ["vitest.config.js", "vitest.config.ts"]:
+        for vitest_config in _VITEST_CONFIGS:
             vitest_config_path = target_dir / vitest_config
-            if vitest_config_path.exists():
-                try:
-                    content = vitest_config_path.read_text(encoding="utf-8", errors="ignore")
-                    if "coverage" in content:
-                        return CheckResult(
-                            name="Coverage measured (javascript)",
-                            passed=True,
-                            message="JavaScript coverage measured (vitest configured)",
-                            severity=Severity.RECOMMENDED,
-                            level=3,
-                        )
-                except Exception:
-                    pass
+            content = self._read_text(vitest_config_path)
+            if content is not None and "coverage" in content:
+                return CheckResult(
+                    name="Coverage measured (javascript)",
+                    passed=True,
+                    message="JavaScript coverage measured (vitest configured)",
+                    severity=Severity.RECOMMENDED,
+                    level=3,
+                )
 
         # Not configured
         return CheckResult(
@@ -509,19 +854,15 @@ class TestingPillar(Pillar):
         """
         # Check Cargo.toml for tarpaulin or llvm-cov
         cargo_toml_path = target_dir / "Cargo.toml"
-        if cargo_toml_path.exists():
-            try:
-                content = cargo_toml_path.read_text(encoding="utf-8", errors="ignore")
-                if "tarpaulin" in content or "llvm-cov" in content:
-                    return CheckResult(
-                        name="Coverage measured (rust)",
-                        passed=True,
-                        message="Rust coverage measured (tarpaulin/llvm-cov configured)",
-                        severity=Severity.RECOMMENDED,
-                        level=3,
-                    )
-            except Exception:
-                pass
+        content = self._read_text(cargo_toml_path)
+        if content is not None and ("tarpaulin" in content or "llvm-cov" in content):
+            return CheckResult(
+                name="Coverage measured (rust)",
+                passed=True,
+                message="Rust coverage measured (tarpaulin/llvm-cov configured)",
+                severity=Severity.RECOMMENDED,
+                level=3,
+            )
 
         # Not configured
         return CheckResult(
@@ -533,7 +874,7 @@ class TestingPillar(Pillar):
         )
 
     def _check_unit_tests_isolated(
-        self, target_dir: Path, languages: set
+        self, target_dir: Path, languages: set, test_info: Mapping | None = None
     ) -> list[CheckResult]:
         """Check if unit tests use isolation patterns (fixtures, mocks).
 
@@ -546,6 +887,7 @@ class TestingPillar(Pillar):
         Args:
             target_dir: Directory to scan
             languages: Set of languages to check
+            test_info: Result of _detect_test_infrastructure; detected when omitted
 
         Returns:
             List of CheckResult, one per language
@@ -554,9 +896,9 @@ class TestingPillar(Pillar):
 
         for language in sorted(languages):
             if language == "python":
-                result = self._check_python_isolation(target_dir)
+                result = self._check_python_isolation(target_dir, test_info)
             elif language == "javascript":
-                result = self._check_javascript_isolation(target_dir)
+                result = self._check_javascript_isolation(target_dir, test_info)
             elif language == "go":
                 result = self._check_go_isolation(target_dir)
             elif language == "rust":
@@ -569,18 +911,51 @@ class TestingPillar(Pillar):
 
         return results
 
-    def _check_python_isolation(self, target_dir: Path) -> CheckResult:
+    def _sample_test_files(self, target_dir: Path, test_files: list[str]) -> list[str]:
+        """Pick the test files whose contents the isolation checks search.
+
+        During an incremental scan the changed test files are sampled, so the
+        check reflects the files under review; otherwise the first ones found.
+
+        This is the only use of the changed files: detection and the other
+        checks still walk the whole tree, since scores such as "tests exist"
+        describe the repository rather than the diff. An incremental scan is
+        therefore no faster, and its isolation result can differ from a full
+        scan's.
+
+        Args:
+            target_dir: Directory being scanned
+            test_files: Detected test file paths for one language
+
+        Returns:
+            Up to _ISOLATION_SAMPLE_SIZE file paths
+        """
+        if self.changed_files:
+            changed = [
+                test_file
+                for test_file in test_files
+                if Path(os.path.relpath(test_file, target_dir)).as_posix() in self.changed_files
+            ]
+            if changed:
+                return changed[:_ISOLATION_SAMPLE_SIZE]
+        return test_files[:_ISOLATION_SAMPLE_SIZE]
+
+    def _check_python_isolation(
+        self, target_dir: Path, test_info: Mapping | None = None
+    ) -> CheckResult:
         """Check if Python tests use isolation patterns (fixtures, mocks).
 
         Looks for @pytest.fixture or unittest.mock in test files.
 
         Args:
             target_dir: Directory to scan
+            test_info: Result of _detect_test_infrastructure; detected when omitted
 
         Returns:
             CheckResult for Python isolation
         """
-        test_info = self._detect_test_infrastructure(target_dir)
+        if test_info is None:
+            test_info = self._detect_test_infrastructure(target_dir)
         test_files = test_info["test_files"]["python"]
 
         if not test_files:
@@ -592,23 +967,12 @@ class TestingPillar(Pillar):
                 level=3,
             )
 
-        # Sample first 10 files to avoid scanning everything
-        files_to_check = test_files[:10]
-
-        isolation_patterns = ["@pytest.fixture", "unittest.mock", "from unittest import mock"]
-        found_patterns = False
+        # Sample 10 files to avoid scanning everything; stop at the first match
+        files_to_check = self._sample_test_files(target_dir, test_files)
 
-        for test_file in files_to_check:
-            try:
-                content = test_file.read_text(encoding="utf-8", errors="ignore")
-                for pattern in isolation_patterns:
-                    if pattern in content:
-                        found_patterns = True
-                        break
-                if found_patterns:
-                    break
-            except Exception:
-                continue
+        found_patterns = any(
+            file_matches(test_file, _PYTHON_ISOLATION_RE) for test_file in files_to_check
+        )
 
         if found_patterns:
             return CheckResult(
@@ -627,18 +991,22 @@ class TestingPillar(Pillar):
                 level=3,
             )
 
-    def _check_javascript_isolation(self, target_dir: Path) -> CheckResult:
+    def _check_javascript_isolation(
+        self, target_dir: Path, test_info: Mapping | None = None
+    ) -> CheckResult:
         """Check if JavaScript tests use isolation patterns (mocks).
 
         Looks for jest.mock or vi.mock in test files.
 
         Args:
             target_dir: Directory to scan
+            test_info: Result of _detect_test_infrastructure; detected when omitted
 
         Returns:
             CheckResult for JavaScript isolation
         """
-        test_info = self._detect_test_infrastructure(target_dir)
+        if test_info is None:
+            test_info = self._detect_test_infrastructure(target_dir)
         test_files = test_info["test_files"]["javascript"]
 
         if not test_files:
@@ -650,23 +1018,12 @@ class TestingPillar(Pillar):
                 level=3,
             )
 
-        # Sample first 10 files to avoid scanning everything
-        files_to_check = test_files[:10]
-
-        isolation_patterns = ["jest.mock", "vi.mock"]
-        found_patterns = False
+        # Sample 10 files to avoid scanning everything; stop at the first match
+        files_to_check = self._sample_test_files(target_dir, test_files)
 
-        for test_file in files_to_check:
-            try:
-                content = test_file.read_text(encoding="utf-8", errors="ignore")
-                for pattern in isolation_patterns:
-                    if pattern in content:
-                        found_patterns = True
-                        break
-                if found_patterns:
-                    break
-            except Exception:
-                continue
+        found_patterns = any(
+            file_matches(test_file, _JAVASCRIPT_ISOLATION_RE) for test_file in files_to_check
+        )
 
         if found_patterns:
             return CheckResult(
@@ -743,13 +1100,11 @@ class TestingPillar(Pillar):
                 # Check for pytest-xdist
                 has_config = False
                 pyproject = target_dir / "pyproject.toml"
-                if pyproject.exists():
-                    try:
-                        content = pyproject.read_text(encoding="utf-8", errors="ignore")
-                        if "pytest-xdist" in content or "-n auto" in content or "-n " in content:
-                            has_config = True
-                    except Exception:
-                        pass
+                content = self._read_text(pyproject)
+                if content is not None and (
+                    "pytest-xdist" in content or "-n auto" in content or "-n " in content
+                ):
+                    has_config = True
 
                 if has_config:
                     results.append(
@@ -776,14 +1131,9 @@ class TestingPillar(Pillar):
                 # Check for jest maxWorkers
                 package_json = target_dir / "package.json"
                 has_config = False
-                if package_json.exists():
-                    try:
-                        import json
-                        data = json.loads(package_json.read_text(encoding="utf-8"))
-                        if "jest" in data and "maxWorkers" in str(data.get("jest", {})):
-                            has_config = True
-                    except Exception:
-                        pass
+                data = self._read_json(package_json)
+                if data is not None and "maxWorkers" in str(data.get("jest", {})):
+                    has_config = True
 
                 if has_config:
                     results.append(
@@ -832,9 +1182,7 @@ class TestingPillar(Pillar):
 
         return results
 
-    def _check_coverage_threshold(
-        self, target_dir: Path, languages: set[str]
-    ) -> list[CheckResult]:
+    def _check_coverage_threshold(self, target_dir: Path, languages: set[str]) -> list[CheckResult]:
         """Check if coverage threshold >=70% is enforced.
 
         Args:
@@ -853,55 +1201,51 @@ class TestingPillar(Pillar):
             if lang == "python":
                 # Check pyproject.toml for coverage threshold
                 pyproject = target_dir / "pyproject.toml"
-                if pyproject.exists():
-                    try:
-                        content = pyproject.read_text(encoding="utf-8", errors="ignore")
-                        if "fail_under" in content:
-                            # Try to extract number
-                            for line in content.split("\n"):
-                                if "fail_under" in line and "=" in line:
-                                    try:
-                                        threshold = int(line.split("=")[1].strip())
-                                        source = "config"
-                                    except ValueError:
-                                        pass
-                    except Exception:
-                        pass
+                data = self._read_toml(pyproject)
+                if data is not None:
+                    fail_under = _table(data, "tool", "coverage", "report").get("fail_under")
+                    if isinstance(fail_under, (int, float)) and not isinstance(fail_under, bool):
+                        threshold = fail_under
+                        source = "config"
+                else:
+                    content = self._read_text(pyproject)
+                    if content is not None and "fail_under" in content:
+                        # Try to extract number
+                        for line in content.split("\n"):
+                            if "fail_under" in line and "=" in line:
+                                try:
+                                    threshold = int(line.split("=")[1].strip())
+                                    source = "config"
+                                except ValueError:
+                                    pass
 
                 # Check .coveragerc
                 if threshold is None:
                     coveragerc = target_dir / ".coveragerc"
-                    if coveragerc.exists():
-                        try:
-                            content = coveragerc.read_text(encoding="utf-8", errors="ignore")
-                            if "fail_under" in content:
-                                for line in content.split("\n"):
-                                    if "fail_under" in line and "=" in line:
-                                        try:
-                                            threshold = int(line.split("=")[1].strip())
-                                            source = "config"
-                                        except ValueError:
-                                            pass
-                        except Exception:
-                            pass
+                    content = self._read_text(coveragerc)
+                    if content is not None and "fail_under" in content:
+                        for line in content.split("\n"):
+                            if "fail_under" in line and "=" in line:
+                                try:
+                                    threshold = int(line.split("=")[1].strip())
+                                    source = "config"
+                                except ValueError:
+                                    pass
 
             elif lang == "javascript":
                 # Check package.json for coverage threshold
                 package_json = target_dir / "package.json"
-                if package_json.exists():
-                    try:
-                        import json
-                        data = json.loads(package_json.read_text(encoding="utf-8"))
-                        jest_config = data.get("jest", {})
-                        coverage_threshold = jest_config.get("coverageThreshold", {})
-                        if coverage_threshold:
-                            # Extract global threshold
-                            global_threshold = coverage_threshold.get("global", {})
-                            if global_threshold:
-                                threshold = min(global_threshold.values())
-                                source = "config"
-                    except Exception:
-                        pass
+                data = self._read_json(package_json)
+                global_threshold = _table(data, "jest", "coverageThreshold", "global")
+                # Extract the lowest global threshold
+                values = [
+                    value
+                    for value in global_threshold.values()
+                    if isinstance(value, (int, float)) and not isinstance(value, bool)
+                ]
+                if values:
+                    threshold = min(values)
+                    source = "config"
 
             if threshold is not None and threshold >= 70:
                 results.append(
@@ -941,35 +1285,24 @@ class TestingPillar(Pillar):
 
         # Check for pre-commit hooks
         pre_commit_config = target_dir / ".pre-commit-config.yaml"
-        if pre_commit_config.exists():
-            try:
-                content = pre_commit_config.read_text(encoding="utf-8", errors="ignore")
-                if "pytest" in content or "test" in content:
-                    checks.append("pre-commit hooks")
-            except Exception:
-                pass
+        content = self._read_text(pre_commit_config)
+        if content is not None and ("pytest" in content or "test" in content):
+            checks.append("pre-commit hooks")
 
         # Check for git hooks
         git_hooks = target_dir / ".git" / "hooks" / "pre-commit"
-        if git_hooks.exists():
-            try:
-                content = git_hooks.read_text(encoding="utf-8", errors="ignore")
-                if "test" in content or "pytest" in content:
-                    checks.append("git hooks")
-            except Exception:
-                pass
+        content = self._read_text(git_hooks)
+        if content is not None and ("test" in content or "pytest" in content):
+            checks.append("git hooks")
 
         # Check CI for PR triggers
         gh_workflows = target_dir / ".github" / "workflows"
-        if gh_workflows.exists():
-            for workflow_file in gh_workflows.glob("*.yml"):
-                try:
-                    content = workflow_file.read_text(encoding="utf-8", errors="ignore")
-                    if "pull_request" in content and "test" in content.lower():
-                        checks.append("CI on PR")
-                        break
-                except Exception:
-                    pass
+        for name in sorted(self._list_dir(os.fspath(gh_workflows))):
+            if name.endswith(".yml"):
+                content = self._read_text(gh_workflows / name)
+                if content is not None and "pull_request" in content and "test" in content.lower():
+                    checks.append("CI on PR")
+                    break
 
         if checks:
             return CheckResult(
@@ -1008,24 +1341,18 @@ class TestingPillar(Pillar):
             if lang == "python":
                 # Check for pytest-flaky or pytest-rerunfailures
                 pyproject = target_dir / "pyproject.toml"
-                if pyproject.exists():
-                    try:
-                        content = pyproject.read_text(encoding="utf-8", errors="ignore")
-                        if "pytest-flaky" in content or "pytest-rerunfailures" in content:
-                            has_flaky = True
-                    except Exception:
-                        pass
+                content = self._read_text(pyproject)
+                if content is not None and (
+                    "pytest-flaky" in content or "pytest-rerunfailures" in content
+                ):
+                    has_flaky = True
 
             elif lang == "javascript":
                 # Check for jest-retry
                 package_json = target_dir / "package.json"
-                if package_json.exists():
-                    try:
-                        content = package_json.read_text(encoding="utf-8", errors="ignore")
-                        if "jest-retry" in content or "@vitest/retry" in content:
-                            has_flaky = True
-                    except Exception:
-                        pass
+                content = self._read_text(package_json)
+                if content is not None and ("jest-retry" in content or "@vitest/retry" in content):
+                    has_flaky = True
 
             if has_flaky:
                 results.append(
@@ -1070,46 +1397,30 @@ class TestingPillar(Pillar):
             if lang == "python":
                 # Check for hypothesis
                 pyproject = target_dir / "pyproject.toml"
-                if pyproject.exists():
-                    try:
-                        content = pyproject.read_text(encoding="utf-8", errors="ignore")
-                        if "hypothesis" in content:
-                            has_property_testing = True
-                    except Exception:
-                        pass
+                content = self._read_text(pyproject)
+                if content is not None and "hypothesis" in content:
+                    has_property_testing = True
 
             elif lang == "javascript":
                 # Check for fast-check
                 package_json = target_dir / "package.json"
-                if package_json.exists():
-                    try:
-                        content = package_json.read_text(encoding="utf-8", errors="ignore")
-                        if "fast-check" in content:
-                            has_property_testing = True
-                    except Exception:
-                        pass
+                content = self._read_text(package_json)
+                if content is not None and "fast-check" in content:
+                    has_property_testing = True
 
             elif lang == "go":
                 # Check for gopter or rapid in go.mod
                 go_mod = target_dir / "go.mod"
-                if go_mod.exists():
-                    try:
-                        content = go_mod.read_text(encoding="utf-8", errors="ignore")
-                        if "gopter" in content or "rapid" in content:
-                            has_property_testing = True
-                    except Exception:
-                        pass
+                content = self._read_text(go_mod)
+                if content is not None and ("gopter" in content or "rapid" in content):
+                    has_property_testing = True
 
             elif lang == "rust":
                 # Check for proptest or quickcheck
                 cargo_toml = target_dir / "Cargo.toml"
-                if cargo_toml.exists():
-                    try:
-                        content = cargo_toml.read_text(encoding="utf-8", errors="ignore")
-                        if "proptest" in content or "quickcheck" in content:
-                            has_property_testing = True
-                    except Exception:
-                        pass
+                content = self._read_text(cargo_toml)
+                if content is not None and ("proptest" in content or "quickcheck" in content):
+                    has_property_testing = True
 
             if has_property_testing:
                 results.append(
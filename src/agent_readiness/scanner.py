@@ -1,10 +1,103 @@
 """Scanner orchestration class that runs all pillars and aggregates results."""
 
+import copy
+import os
+import subprocess
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from .models import ScanResult
+from .fs import walk_files
+from .models import PillarResult, ScanContext, ScanResult
 from .pillar import Pillar
 
+# Upper bound on pillars evaluated concurrently
+_MAX_WORKERS = 8
+
+# Lowest overall score of maturity levels 2 through 5
+_MATURITY_CUTS = (40, 60, 80, 95)
+
+# Above this many changed files an incremental scan falls back to a full scan
+_INCREMENTAL_MAX_CHANGED = 500
+
+
+def _changed_files(target_path: Path, base_ref: str) -> frozenset[str] | None:
+    """List files changed between base_ref and the working tree.
+
+    Args:
+        target_path: Directory inside a git work tree
+        base_ref: Git revision to compare against
+
+    Returns:
+        POSIX paths relative to target_path, or None when git cannot answer
+        or too many files changed for an incremental scan to pay off
+    """
+    try:
+        proc = subprocess.run(
+            ["git", "-C", str(target_path), "diff", "--name-only", "--relative", base_ref],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    changed = frozenset(line for line in proc.stdout.splitlines() if line)
+    if len(changed) > _INCREMENTAL_MAX_CHANGED:
+        return None
+    return changed
+
+
+def _dir_stats(path: str) -> tuple:
+    """Return (name, mtime_ns, size) for each entry of a directory, sorted by name."""
+    stats = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                stats.append((entry.name, st.st_mtime_ns, st.st_size))
+    except OSError:
+        pass
+    return tuple(sorted(stats))
+
+
+def _tree_stats(root: str) -> tuple:
+    """Return (relative path, mtime_ns, size) for every file below root, sorted by path.
+
+    Pruned directories (VCS metadata, virtualenvs, node_modules, build output)
+    are skipped, as they are by the pillars' own walks.
+    """
+    stats = []
+    for entry in walk_files(root):
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        stats.append((os.path.relpath(entry.path, root), st.st_mtime_ns, st.st_size))
+    return tuple(sorted(stats))
+
+
+def _signature(target_path: Path) -> tuple:
+    """Summarize the state of a repository for the result cache.
+
+    Every top-level entry is included, so creating or deleting a vendored
+    directory such as node_modules changes the signature, as does editing any
+    file the pillars can read: sources, tests, nested READMEs and CI configs.
+    Only stat metadata is compared, which costs one walk of the tree rather
+    than reading every file.
+
+    Args:
+        target_path: Directory being scanned
+
+    Returns:
+        The resolved root, a tuple of (name, mtime_ns, size) per top-level
+        entry, and a tuple of (relative path, mtime_ns, size) per file
+    """
+    root = os.path.realpath(target_path)
+    return (root, _dir_stats(root), _tree_stats(root))
+
 
 class Scanner:
     """Orchestrates pillar evaluation and aggregates results.
@@ -18,8 +111,13 @@ class Scanner:
     """
 
     def __init__(self) -> None:
-        """Initialize scanner with empty pillar registry."""
+        """Initialize scanner with empty pillar registry and result cache."""
         self._pillars: list[Pillar] = []
+        self._result_cache: dict[tuple, ScanResult] = {}
+
+    def clear_cache(self) -> None:
+        """Forget cached scan results."""
+        self._result_cache.clear()
 
     def register_pillar(self, pillar: Pillar) -> None:
         """Register a pillar for evaluation.
@@ -28,6 +126,7 @@ class Scanner:
             pillar: Pillar instance to register
         """
         self._pillars.append(pillar)
+        self.clear_cache()
 
     def register_pillars(self, pillars: list[Pillar]) -> None:
         """Register multiple pillars at once.
@@ -36,12 +135,23 @@ class Scanner:
             pillars: List of pillar instances to register
         """
         self._pillars.extend(pillars)
+        self.clear_cache()
 
-    def scan(self, target_dir: str | Path) -> ScanResult:
+    def scan(
+        self, target_dir: str | Path, base_ref: str | None = None, use_cache: bool = False
+    ) -> ScanResult:
         """Scan a directory with all registered pillars.
 
         Args:
             target_dir: Path to directory to scan
+            base_ref: Git revision for an incremental scan; pillars are told
+                which files changed since it through ScanContext.changed_files.
+                Only the testing pillar's isolation sample uses them so far;
+                every pillar still walks the whole tree. Falls back to a full
+                scan if git fails or too much changed.
+            use_cache: Return a copy of the previous result for this directory
+                while no file in it has changed size or modification time.
+                Ignored for incremental scans.
 
         Returns:
             ScanResult with all pillar results, overall score, and maturity level
@@ -59,8 +169,31 @@ class Scanner:
         if not target_path.is_dir():
             raise ValueError(f"Target path is not a directory: {target_dir}")
 
-        # Run all pillars
-        pillar_results = [pillar.run(target_path) for pillar in self._pillars]
+        use_cache = use_cache and base_ref is None
+        if use_cache:
+            cache_key = _signature(target_path)
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                # Results are mutable, so callers never get the cached instance
+                return copy.deepcopy(cached)
+
+        # One context per scan lets pillars share file reads and parsed manifests
+        context = ScanContext(
+            root=target_path,
+            changed_files=_changed_files(target_path, base_ref) if base_ref is not None else None,
+        )
+
+        # Run all pillars; their checks are I/O-bound, so threads overlap the
+        # filesystem waits. map keeps results in registration order.
+        def run(pillar: Pillar) -> PillarResult:
+            return pillar.run(target_path, context)
+
+        if len(self._pillars) > 1:
+            workers = min(_MAX_WORKERS, len(self._pillars))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pillar_results = list(executor.map(run, self._pillars))
+        else:
+            pillar_results = [run(pillar) for pillar in self._pillars]
 
         # Calculate weighted overall score
         overall_score = self._calculate_overall_score(pillar_results)
@@ -68,12 +201,15 @@ class Scanner:
         # Determine maturity level
         maturity_level = self._determine_maturity_level(overall_score)
 
-        return ScanResult(
+        result = ScanResult(
             pillars=pillar_results,
             overall_score=overall_score,
             maturity_level=maturity_level,
             target_directory=str(target_path.resolve()),
         )
+        if use_cache:
+            self._result_cache[cache_key] = copy.deepcopy(result)
+        return result
 
     def _calculate_overall_score(self, pillar_results: list) -> float:
         """Calculate weighted average score across all pillars.
@@ -84,14 +220,16 @@ class Scanner:
         Returns:
             Weighted average score (0-100)
         """
-        if not pillar_results:
-            return 0.0
+        total_weight = 0.0
+        weighted_sum = 0.0
+        for pillar_result in pillar_results:
+            weight = pillar_result.weight
+            total_weight += weight
+            weighted_sum += pillar_result.score * weight
 
-        total_weight = sum(p.weight for p in pillar_results)
         if total_weight == 0:
             return 0.0
 
-        weighted_sum = sum(p.score * p.weight for p in pillar_results)
         return weighted_sum / total_weight
 
     def _determine_maturity_level(self, score: float) -> int:
@@ -110,13 +248,4 @@ class Scanner:
         Returns:
             Maturity level (1-5)
         """
-        if score < 40:
-            return 1
-        elif score < 60:
-            return 2
-        elif score < 80:
-            return 3
-        elif score < 95:
-            return 4
-        else:
-            return 5
+        return bisect_right(_MATURITY_CUTS, score) + 1
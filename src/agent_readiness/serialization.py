@@ -0,0 +1,28 @@
+"""JSON serialization helpers shared by the CLI and the MCP server."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Serialize obj as JSON indented by two spaces, preferring orjson when installed.
+
+    Both encoders produce the same document, but not the same text: orjson
+    writes non-ASCII characters as raw UTF-8 where json.dumps escapes them,
+    and non-str dict keys are converted to strings by both.
+
+    Args:
+        obj: JSON-compatible value, such as the output of ScanResult.to_dict
+
+    Returns:
+        The JSON text
+    """
+    if orjson is not None:
+        data: bytes = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        return data.decode()
+    return json.dumps(obj, indent=2)
@@ -1,8 +1,10 @@
 """Quick test of core scanning framework."""
 
+import sys
 from pathlib import Path
 
 from agent_readiness import CheckResult, Pillar, Scanner
+from agent_readiness.serialization import dumps_pretty
 from agent_readiness.models import Severity
 
 
@@ -17,27 +19,31 @@ class DemoPillar(Pillar):
     def weight(self) -> float:
         return 1.0
 
+    # (check name, marker file, severity, message) for each demo check
+    _SPECS = (
+        ("Has README", "README.md", Severity.WARNING, "Project has README.md file"),
+        ("Has pyproject.toml", "pyproject.toml", Severity.ERROR, "Project has pyproject.toml file"),
+    )
+
     def evaluate(self, target_dir: Path) -> list[CheckResult]:
         """Run some demo checks."""
         return [
             CheckResult(
-                name="Has README",
-                passed=(target_dir / "README.md").exists(),
-                message="Project has README.md file",
-                severity=Severity.WARNING,
-            ),
-            CheckResult(
-                name="Has pyproject.toml",
-                passed=(target_dir / "pyproject.toml").exists(),
-                message="Project has pyproject.toml file",
-                severity=Severity.ERROR,
-            ),
+                name=name,
+                passed=(target_dir / marker).exists(),
+                message=message,
+                severity=severity,
+            )
+            for name, marker, severity, message in self._SPECS
         ]
 
 
 def main() -> None:
-    """Test the core framework."""
-    print("Testing Agent Readiness Score Core Framework\n")
+    """Test the core framework.
+
+    Pass --json to print only the JSON report.
+    """
+    json_only = "--json" in sys.argv[1:]
 
     # Create scanner and register demo pillar
     scanner = Scanner()
@@ -46,26 +52,31 @@ def main() -> None:
     # Scan current directory
     result = scanner.scan(".")
 
-    # Display results
-    print(f"Target: {result.target_directory}")
-    print(f"Overall Score: {result.overall_score:.1f}%")
-    print(f"Maturity Level: {result.maturity_level} - {result.get_maturity_label()}")
-    print()
-
-    for pillar in result.pillars:
-        print(f"Pillar: {pillar.name}")
-        print(f"Score: {pillar.score:.1f}%")
-        print(f"Checks: {len(pillar.checks)} total")
-        for check in pillar.checks:
-            status = "✓" if check.passed else "✗"
-            print(f"  {status} {check.name}: {check.message}")
-        print()
-
-    # Test JSON output
-    import json
-
-    print("JSON Output:")
-    print(json.dumps(result.to_dict(), indent=2))
+    # Collect the report and write it in one go
+    lines = []
+    if not json_only:
+        lines.append("Testing Agent Readiness Score Core Framework\n")
+
+        # Display results
+        lines.append(f"Target: {result.target_directory}")
+        lines.append(f"Overall Score: {result.overall_score:.1f}%")
+        lines.append(f"Maturity Level: {result.maturity_level} - {result.get_maturity_label()}")
+        lines.append("")
+
+        for pillar in result.pillars:
+            lines.append(f"Pillar: {pillar.name}")
+            lines.append(f"Score: {pillar.score:.1f}%")
+            lines.append(f"Checks: {len(pillar.checks)} total")
+            for check in pillar.checks:
+                status = "✓" if check.passed else "✗"
+                lines.append(f"  {status} {check.name}: {check.message}")
+            lines.append("")
+
+        # Test JSON output
+        lines.append("JSON Output:")
+
+    lines.append(dumps_pretty(result.to_dict()))
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -1,11 +1,37 @@
 """Application with complete observability."""
 
 import logging
+import logging.config
 import time
-from logging.config import fileConfig
 
-# Configure logging
-fileConfig("logging.conf")
+# Mirrors logging.conf, inlined so importing the module does no file I/O
+_LOG_CONFIG = {
+    "version": 1,
+    "formatters": {
+        "standardFormatter": {
+            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        },
+    },
+    "handlers": {
+        "consoleHandler": {
+            "class": "logging.StreamHandler",
+            "level": "DEBUG",
+            "formatter": "standardFormatter",
+            "stream": "ext://sys.stdout",
+        },
+        "fileHandler": {
+            "class": "logging.FileHandler",
+            "level": "DEBUG",
+            "formatter": "standardFormatter",
+            "filename": "app.log",
+        },
+    },
+    "root": {"level": "DEBUG", "handlers": ["consoleHandler", "fileHandler"]},
+}
+
+# Configure logging once, however often the module is imported
+if not logging.getLogger().handlers:
+    logging.config.dictConfig(_LOG_CONFIG)
 logger = logging.getLogger(__name__)
 
 
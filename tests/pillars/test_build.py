@@ -1,15 +1,43 @@
 """Tests for Build System pillar."""
 
 import json
+import os
+from collections.abc import Callable
 from pathlib import Path
+from types import SimpleNamespace
 
+import pytest
+
+from agent_readiness.models import ScanContext
 from agent_readiness.pillars.build import BuildPillar
 
+Touch = Callable[[str], None]
+
+# Never touched on disk: marker checks read the injected index instead
+ROOT = Path("/repo")
+
+
+@pytest.fixture
+def touch_fast(tmp_path: Path) -> Touch:
+    """Create a helper that makes empty files under tmp_path without setting times."""
+
+    def touch(name: str) -> None:
+        os.close(os.open(tmp_path / name, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o644))
+
+    return touch
+
+
+@pytest.fixture
+def fake_dir() -> SimpleNamespace:
+    """Create an empty in-memory root index for marker checks."""
+    return SimpleNamespace(files=set(), dirs=set())
+
 
 def test_build_pillar_name() -> None:
     """Test BuildPillar has correct name."""
     pillar = BuildPillar()
     assert pillar.name == "Build System"
+    assert BuildPillar.name == "Build System"
 
 
 def test_build_pillar_weight() -> None:
@@ -18,81 +46,112 @@ def test_build_pillar_weight() -> None:
     assert pillar.weight == 1.0
 
 
-def test_detect_languages_python_pyproject(tmp_path: Path) -> None:
+def test_detect_languages_python_pyproject(fake_dir: SimpleNamespace) -> None:
     """Test detecting Python via pyproject.toml."""
-    (tmp_path / "pyproject.toml").touch()
+    fake_dir.files.add("pyproject.toml")
 
     pillar = BuildPillar()
-    languages = pillar._detect_languages(tmp_path)
+    languages = pillar._detect_languages(ROOT, index=fake_dir)
 
     assert "python" in languages
 
 
-def test_detect_languages_python_setup(tmp_path: Path) -> None:
+def test_detect_languages_python_setup(fake_dir: SimpleNamespace) -> None:
     """Test detecting Python via setup.py."""
-    (tmp_path / "setup.py").touch()
+    fake_dir.files.add("setup.py")
 
     pillar = BuildPillar()
-    languages = pillar._detect_languages(tmp_path)
+    languages = pillar._detect_languages(ROOT, index=fake_dir)
 
     assert "python" in languages
 
 
-def test_detect_languages_javascript(tmp_path: Path) -> None:
+def test_detect_languages_javascript(fake_dir: SimpleNamespace) -> None:
     """Test detecting JavaScript via package.json."""
-    (tmp_path / "package.json").touch()
+    fake_dir.files.add("package.json")
 
     pillar = BuildPillar()
-    languages = pillar._detect_languages(tmp_path)
+    languages = pillar._detect_languages(ROOT, index=fake_dir)
 
     assert "javascript" in languages
 
 
-def test_detect_languages_rust(tmp_path: Path) -> None:
+def test_detect_languages_rust(fake_dir: SimpleNamespace) -> None:
     """Test detecting Rust via Cargo.toml."""
-    (tmp_path / "Cargo.toml").touch()
+    fake_dir.files.add("Cargo.toml")
 
     pillar = BuildPillar()
-    languages = pillar._detect_languages(tmp_path)
+    languages = pillar._detect_languages(ROOT, index=fake_dir)
 
     assert "rust" in languages
 
 
-def test_detect_languages_go(tmp_path: Path) -> None:
+def test_detect_languages_go(fake_dir: SimpleNamespace) -> None:
     """Test detecting Go via go.mod."""
-    (tmp_path / "go.mod").touch()
+    fake_dir.files.add("go.mod")
 
     pillar = BuildPillar()
-    languages = pillar._detect_languages(tmp_path)
+    languages = pillar._detect_languages(ROOT, index=fake_dir)
 
     assert "go" in languages
 
 
-def test_detect_languages_multiple(tmp_path: Path) -> None:
+def test_detect_languages_multiple(fake_dir: SimpleNamespace) -> None:
     """Test detecting multiple languages."""
-    (tmp_path / "pyproject.toml").touch()
-    (tmp_path / "package.json").touch()
+    fake_dir.files.add("pyproject.toml")
+    fake_dir.files.add("package.json")
 
     pillar = BuildPillar()
-    languages = pillar._detect_languages(tmp_path)
+    languages = pillar._detect_languages(ROOT, index=fake_dir)
 
     assert languages == {"python", "javascript"}
 
 
-def test_detect_languages_none(tmp_path: Path) -> None:
+def test_detect_languages_requirements_only(tmp_path: Path, touch_fast: Touch) -> None:
+    """Test detecting Python via requirements.txt alone."""
+    touch_fast("requirements.txt")
+    touch_fast("README.md")
+
+    pillar = BuildPillar()
+
+    assert pillar._detect_languages(tmp_path) == {"python"}
+
+
+def test_detect_languages_missing_dir(tmp_path: Path) -> None:
+    """Test that a missing directory has no languages."""
+    pillar = BuildPillar()
+
+    assert pillar._detect_languages(tmp_path / "missing") == set()
+
+
+def test_detect_languages_shared_per_scan(tmp_path: Path, touch_fast: Touch) -> None:
+    """Test that languages are detected once per scan context."""
+    touch_fast("go.mod")
+    context = ScanContext(root=tmp_path)
+
+    first = BuildPillar().run(tmp_path, context)
+    (tmp_path / "go.mod").unlink()
+    touch_fast("package.json")
+    second = BuildPillar().run(tmp_path, context)
+
+    assert context.artifacts["build_languages"] == {str(tmp_path.resolve()): {"go"}}
+    assert [c.name for c in second.checks] == [c.name for c in first.checks]
+
+
+def test_detect_languages_none(fake_dir: SimpleNamespace) -> None:
     """Test detecting no languages."""
     pillar = BuildPillar()
-    languages = pillar._detect_languages(tmp_path)
+    languages = pillar._detect_languages(ROOT, index=fake_dir)
 
     assert languages == set()
 
 
-def test_check_package_manager_python_pyproject(tmp_path: Path) -> None:
+def test_check_package_manager_python_pyproject(fake_dir: SimpleNamespace) -> None:
     """Test detecting Python package manager via pyproject.toml."""
-    (tmp_path / "pyproject.toml").touch()
+    fake_dir.files.add("pyproject.toml")
 
     pillar = BuildPillar()
-    results = pillar._check_package_manager_exists(tmp_path, {"python"})
+    results = pillar._check_package_manager_exists(ROOT, {"python"}, index=fake_dir)
 
     assert len(results) == 1
     assert results[0].passed
@@ -100,45 +159,45 @@ def test_check_package_manager_python_pyproject(tmp_path: Path) -> None:
     assert "pyproject.toml" in results[0].message
 
 
-def test_check_package_manager_javascript(tmp_path: Path) -> None:
+def test_check_package_manager_javascript(fake_dir: SimpleNamespace) -> None:
     """Test detecting JavaScript package manager via package.json."""
-    (tmp_path / "package.json").touch()
+    fake_dir.files.add("package.json")
 
     pillar = BuildPillar()
-    results = pillar._check_package_manager_exists(tmp_path, {"javascript"})
+    results = pillar._check_package_manager_exists(ROOT, {"javascript"}, index=fake_dir)
 
     assert len(results) == 1
     assert results[0].passed
     assert "javascript" in results[0].message.lower()
 
 
-def test_check_package_manager_multiple_languages(tmp_path: Path) -> None:
+def test_check_package_manager_multiple_languages(fake_dir: SimpleNamespace) -> None:
     """Test detecting package managers for multiple languages."""
-    (tmp_path / "pyproject.toml").touch()
-    (tmp_path / "package.json").touch()
+    fake_dir.files.add("pyproject.toml")
+    fake_dir.files.add("package.json")
 
     pillar = BuildPillar()
-    results = pillar._check_package_manager_exists(tmp_path, {"python", "javascript"})
+    results = pillar._check_package_manager_exists(ROOT, {"python", "javascript"}, index=fake_dir)
 
     assert len(results) == 2
     assert all(r.passed for r in results)
 
 
-def test_check_package_manager_missing(tmp_path: Path) -> None:
+def test_check_package_manager_missing(fake_dir: SimpleNamespace) -> None:
     """Test package manager check fails when files missing."""
     pillar = BuildPillar()
-    results = pillar._check_package_manager_exists(tmp_path, {"python"})
+    results = pillar._check_package_manager_exists(ROOT, {"python"}, index=fake_dir)
 
     assert len(results) == 1
     assert not results[0].passed
 
 
-def test_check_lock_file_python(tmp_path: Path) -> None:
+def test_check_lock_file_python(fake_dir: SimpleNamespace) -> None:
     """Test detecting Python lock file."""
-    (tmp_path / "poetry.lock").touch()
+    fake_dir.files.add("poetry.lock")
 
     pillar = BuildPillar()
-    results = pillar._check_lock_file_exists(tmp_path, {"python"})
+    results = pillar._check_lock_file_exists(ROOT, {"python"}, index=fake_dir)
 
     assert len(results) == 1
     assert results[0].passed
@@ -146,43 +205,43 @@ def test_check_lock_file_python(tmp_path: Path) -> None:
     assert "poetry.lock" in results[0].message
 
 
-def test_check_lock_file_javascript(tmp_path: Path) -> None:
+def test_check_lock_file_javascript(fake_dir: SimpleNamespace) -> None:
     """Test detecting JavaScript lock file."""
-    (tmp_path / "package-lock.json").touch()
+    fake_dir.files.add("package-lock.json")
 
     pillar = BuildPillar()
-    results = pillar._check_lock_file_exists(tmp_path, {"javascript"})
+    results = pillar._check_lock_file_exists(ROOT, {"javascript"}, index=fake_dir)
 
     assert len(results) == 1
     assert results[0].passed
 
 
-def test_check_lock_file_rust(tmp_path: Path) -> None:
+def test_check_lock_file_rust(fake_dir: SimpleNamespace) -> None:
     """Test detecting Rust lock file."""
-    (tmp_path / "Cargo.lock").touch()
+    fake_dir.files.add("Cargo.lock")
 
     pillar = BuildPillar()
-    results = pillar._check_lock_file_exists(tmp_path, {"rust"})
+    results = pillar._check_lock_file_exists(ROOT, {"rust"}, index=fake_dir)
 
     assert len(results) == 1
     assert results[0].passed
 
 
-def test_check_lock_file_go(tmp_path: Path) -> None:
+def test_check_lock_file_go(fake_dir: SimpleNamespace) -> None:
     """Test detecting Go lock file."""
-    (tmp_path / "go.sum").touch()
+    fake_dir.files.add("go.sum")
 
     pillar = BuildPillar()
-    results = pillar._check_lock_file_exists(tmp_path, {"go"})
+    results = pillar._check_lock_file_exists(ROOT, {"go"}, index=fake_dir)
 
     assert len(results) == 1
     assert results[0].passed
 
 
-def test_check_lock_file_missing(tmp_path: Path) -> None:
+def test_check_lock_file_missing(fake_dir: SimpleNamespace) -> None:
     """Test lock file check fails when missing."""
     pillar = BuildPillar()
-    results = pillar._check_lock_file_exists(tmp_path, {"python"})
+    results = pillar._check_lock_file_exists(ROOT, {"python"}, index=fake_dir)
 
     assert len(results) == 1
     assert not results[0].passed
@@ -212,6 +271,40 @@ def test_check_build_script_javascript(tmp_path: Path) -> None:
     assert results[0].passed
 
 
+def test_check_build_script_javascript_brace_in_script(tmp_path: Path) -> None:
+    """Test a build script after a script containing a brace."""
+    package_json = tmp_path / "package.json"
+    package_json.write_text(json.dumps({"scripts": {"lint": "eslint {src,test}", "build": "tsc"}}))
+
+    pillar = BuildPillar()
+    results = pillar._check_build_script_exists(tmp_path, {"javascript"})
+
+    assert results[0].passed
+
+
+def test_check_build_script_javascript_build_outside_scripts(tmp_path: Path) -> None:
+    """Test that a build key outside scripts does not count."""
+    package_json = tmp_path / "package.json"
+    package_json.write_text(json.dumps({"scripts": {"test": "jest"}, "build": {"out": "dist"}}))
+
+    pillar = BuildPillar()
+    results = pillar._check_build_script_exists(tmp_path, {"javascript"})
+
+    assert not results[0].passed
+
+
+def test_check_build_script_javascript_large_package(tmp_path: Path) -> None:
+    """Test a build script beyond the probed head of a large package.json."""
+    package = {"dependencies": {f"dep-{i}": "^1.0.0" for i in range(5000)}}
+    package["scripts"] = {"build": "tsc"}
+    (tmp_path / "package.json").write_text(json.dumps(package))
+
+    pillar = BuildPillar()
+    results = pillar._check_build_script_exists(tmp_path, {"javascript"})
+
+    assert results[0].passed
+
+
 def test_check_build_script_rust_default(tmp_path: Path) -> None:
     """Test Rust always passes (cargo build is default)."""
     pillar = BuildPillar()
@@ -254,6 +347,47 @@ def test_check_build_caching_github_actions(tmp_path: Path) -> None:
     assert "cache" in result.message.lower()
 
 
+def test_check_build_caching_yaml_workflow(tmp_path: Path) -> None:
+    """Test detecting build caching in a .yaml workflow after a cacheless one."""
+    workflows = tmp_path / ".github" / "workflows"
+    workflows.mkdir(parents=True)
+    (workflows / "lint.yml").write_text("- run: ruff check .\n")
+    (workflows / "release.yaml").write_text(
+        "- uses: actions/setup-node@v4\n  with:\n    cache: npm\n"
+    )
+
+    pillar = BuildPillar()
+    result = pillar._check_build_caching(tmp_path)
+
+    assert result.passed
+    assert "release.yaml" in result.message
+
+
+def test_check_build_caching_gitlab_and_circleci(tmp_path: Path) -> None:
+    """Test detecting build caching in GitLab CI and CircleCI configs."""
+    (tmp_path / ".gitlab-ci.yml").write_text("cache:\n  paths:\n    - .venv/\n")
+    (tmp_path / ".circleci").mkdir()
+    (tmp_path / ".circleci" / "config.yml").write_text("- restore_cache:\n    keys: [deps]\n")
+
+    pillar = BuildPillar()
+    result = pillar._check_build_caching(tmp_path)
+
+    assert result.passed
+    assert "GitLab CI, CircleCI" in result.message
+
+
+def test_check_build_caching_markers_are_per_ci(tmp_path: Path) -> None:
+    """Test that each CI system only counts its own cache markers."""
+    (tmp_path / ".gitlab-ci.yml").write_text("- restore_cache\n")
+    (tmp_path / ".circleci").mkdir()
+    (tmp_path / ".circleci" / "config.yml").write_text("cache: true\n")
+
+    pillar = BuildPillar()
+    result = pillar._check_build_caching(tmp_path)
+
+    assert not result.passed
+
+
 def test_check_build_caching_not_found(tmp_path: Path) -> None:
     """Test build caching check fails when not configured."""
     pillar = BuildPillar()
@@ -262,9 +396,9 @@ def test_check_build_caching_not_found(tmp_path: Path) -> None:
     assert not result.passed
 
 
-def test_check_containerization_dockerfile(tmp_path: Path) -> None:
+def test_check_containerization_dockerfile(tmp_path: Path, touch_fast: Touch) -> None:
     """Test detecting Dockerfile."""
-    (tmp_path / "Dockerfile").touch()
+    touch_fast("Dockerfile")
 
     pillar = BuildPillar()
     result = pillar._check_containerization(tmp_path)
@@ -273,10 +407,10 @@ def test_check_containerization_dockerfile(tmp_path: Path) -> None:
     assert "Dockerfile" in result.message
 
 
-def test_check_containerization_devcontainer(tmp_path: Path) -> None:
+def test_check_containerization_devcontainer(tmp_path: Path, touch_fast: Touch) -> None:
     """Test detecting devcontainer."""
     (tmp_path / ".devcontainer").mkdir()
-    (tmp_path / ".devcontainer" / "devcontainer.json").touch()
+    touch_fast(".devcontainer/devcontainer.json")
 
     pillar = BuildPillar()
     result = pillar._check_containerization(tmp_path)
@@ -292,10 +426,10 @@ def test_check_containerization_not_found(tmp_path: Path) -> None:
     assert not result.passed
 
 
-def test_check_dependency_automation_dependabot(tmp_path: Path) -> None:
+def test_check_dependency_automation_dependabot(tmp_path: Path, touch_fast: Touch) -> None:
     """Test detecting Dependabot configuration."""
     (tmp_path / ".github").mkdir()
-    (tmp_path / ".github" / "dependabot.yml").touch()
+    touch_fast(".github/dependabot.yml")
 
     pillar = BuildPillar()
     result = pillar._check_dependency_automation(tmp_path)
@@ -304,9 +438,9 @@ def test_check_dependency_automation_dependabot(tmp_path: Path) -> None:
     assert "dependabot" in result.message.lower()
 
 
-def test_check_dependency_automation_renovate(tmp_path: Path) -> None:
+def test_check_dependency_automation_renovate(tmp_path: Path, touch_fast: Touch) -> None:
     """Test detecting Renovate configuration."""
-    (tmp_path / "renovate.json").touch()
+    touch_fast("renovate.json")
 
     pillar = BuildPillar()
     result = pillar._check_dependency_automation(tmp_path)
@@ -323,9 +457,9 @@ def test_check_dependency_automation_not_found(tmp_path: Path) -> None:
     assert not result.passed
 
 
-def test_check_reproducible_builds_with_lock_files(tmp_path: Path) -> None:
+def test_check_reproducible_builds_with_lock_files(tmp_path: Path, touch_fast: Touch) -> None:
     """Test reproducible builds check passes with lock files."""
-    (tmp_path / "poetry.lock").touch()
+    touch_fast("poetry.lock")
     readme = tmp_path / "README.md"
     readme.write_text("We use lock files for reproducible builds.")
 
@@ -344,10 +478,10 @@ def test_check_reproducible_builds_missing_lock_files(tmp_path: Path) -> None:
     assert not result.passed
 
 
-def test_evaluate_full_python_setup(tmp_path: Path) -> None:
+def test_evaluate_full_python_setup(tmp_path: Path, touch_fast: Touch) -> None:
     """Test evaluation of Python project with all features."""
-    (tmp_path / "pyproject.toml").touch()
-    (tmp_path / "poetry.lock").touch()
+    touch_fast("pyproject.toml")
+    touch_fast("poetry.lock")
     makefile = tmp_path / "Makefile"
     makefile.write_text("build:\n\tpython -m build\n")
 
@@ -362,9 +496,9 @@ def test_evaluate_full_python_setup(tmp_path: Path) -> None:
     assert any(r.passed and "build script" in r.name.lower() for r in results)
 
 
-def test_evaluate_minimal_setup(tmp_path: Path) -> None:
+def test_evaluate_minimal_setup(tmp_path: Path, touch_fast: Touch) -> None:
     """Test evaluation of minimal project."""
-    (tmp_path / "package.json").touch()
+    touch_fast("package.json")
 
     pillar = BuildPillar()
     results = pillar.evaluate(tmp_path)
@@ -380,3 +514,4 @@ def test_build_pillar_importable() -> None:
 
     pillar = BuildPillar()
     assert pillar.name == "Build System"
+    assert BuildPillar.name == "Build System"
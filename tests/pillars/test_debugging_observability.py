@@ -44,6 +44,34 @@ def test_discover_observability_setup_none_found(tmp_path: Path) -> None:
     assert len(obs["monitoring_config"]) == 0
 
 
+def test_checks_reuse_discovered_signals(tmp_path: Path) -> None:
+    """Test that checks answer from discovery's source signals without re-reading."""
+    app = tmp_path / "app.py"
+    app.write_text('app.route("/healthz")\n')
+
+    pillar = DebuggingObservabilityPillar()
+    obs = pillar._discover_observability_setup(tmp_path)
+    app.unlink()
+
+    assert obs["python_signals"].health_route
+    assert pillar._check_health_check_endpoint(tmp_path, obs).passed
+
+
+def test_discover_observability_setup_skips_vendored_dirs(tmp_path: Path) -> None:
+    """Test that virtualenvs and node_modules are not scanned."""
+    (tmp_path / ".venv" / "lib").mkdir(parents=True)
+    (tmp_path / ".venv" / "lib" / "psutil.py").write_text("import psutil\n")
+    (tmp_path / "node_modules" / "otel").mkdir(parents=True)
+    (tmp_path / "node_modules" / "otel" / "tracing.js").touch()
+
+    pillar = DebuggingObservabilityPillar()
+    obs = pillar._discover_observability_setup(tmp_path)
+
+    assert not obs["python_signals"].resource_monitoring
+    assert obs["tracing_config"] is None
+    assert not pillar._check_memory_cpu_monitoring(tmp_path, obs).passed
+
+
 def test_check_logging_configuration_exists_found(tmp_path: Path) -> None:
     """Test logging config check when found."""
     (tmp_path / "logging.conf").touch()
@@ -445,6 +445,23 @@ jobs:
     assert result.passed is True
 
 
+def test_check_secrets_scanning_in_ci_yaml_extension(tmp_path, security_pillar):
+    """Test secrets scanning in CI with a .yaml workflow file."""
+    workflows_dir = tmp_path / ".github" / "workflows"
+    workflows_dir.mkdir(parents=True)
+    (workflows_dir / "secrets.yaml").write_text(
+        """
+jobs:
+  secrets:
+    steps:
+      - uses: gitleaks/gitleaks-action@v2
+    """
+    )
+    sec = security_pillar._discover_security_setup(tmp_path)
+    result = security_pillar._check_secrets_scanning_in_ci(tmp_path, sec)
+    assert result.passed is True
+
+
 def test_check_secrets_scanning_in_ci_precommit(tmp_path, security_pillar):
     """Test secrets scanning with pre-commit hooks."""
     (tmp_path / ".pre-commit-config.yaml").write_text(
@@ -524,6 +541,34 @@ def test_check_runtime_security_not_found(tmp_path, security_pillar):
     assert result.passed is False
 
 
+def test_check_runtime_security_ignores_binary_files(tmp_path, security_pillar):
+    """Test runtime security detection skips files with binary content."""
+    (tmp_path / "blob.py").write_bytes(b"\x00\x01\x02 helmet csrf")
+    sec = security_pillar._discover_security_setup(tmp_path)
+    result = security_pillar._check_runtime_security(tmp_path, sec)
+    assert result.passed is False
+
+
+def test_check_runtime_security_prioritizes_server_files(tmp_path, security_pillar):
+    """Test runtime security detection beyond the first 30 discovered files."""
+    for i in range(40):
+        (tmp_path / f"a_{i:02d}.py").write_text("print('hello')")
+    (tmp_path / "server.py").write_text("app.use(helmet())")
+    sec = security_pillar._discover_security_setup(tmp_path)
+    result = security_pillar._check_runtime_security(tmp_path, sec)
+    assert result.passed is True
+
+
+def test_check_runtime_security_found_among_many_files(tmp_path, security_pillar):
+    """Test runtime security detection when only one of many sources matches."""
+    for i in range(20):
+        (tmp_path / f"module_{i}.py").write_text("print('hello')")
+    (tmp_path / "middleware.py").write_text("app.use(CSRFProtect())")
+    sec = security_pillar._discover_security_setup(tmp_path)
+    result = security_pillar._check_runtime_security(tmp_path, sec)
+    assert result.passed is True
+
+
 def test_check_threat_modeling_found(tmp_path, security_pillar):
     """Test threat model detection when present."""
     (tmp_path / "THREAT_MODEL.md").write_text("# Threat Model\n\nOWASP Top 10 analysis")
@@ -544,6 +589,16 @@ def test_check_threat_modeling_architecture_doc(tmp_path, security_pillar):
     assert result.passed is True
 
 
+def test_check_threat_modeling_nested_doc(tmp_path, security_pillar):
+    """Test threat model detection in a doc nested under docs/."""
+    nested_dir = tmp_path / "docs" / "design" / "security"
+    nested_dir.mkdir(parents=True)
+    (nested_dir / "overview.md").write_text("# Overview\n\nOWASP review notes.")
+    sec = security_pillar._discover_security_setup(tmp_path)
+    result = security_pillar._check_threat_modeling(tmp_path, sec)
+    assert result.passed is True
+
+
 def test_check_threat_modeling_not_found(tmp_path, security_pillar):
     """Test threat model detection when absent."""
     sec = security_pillar._discover_security_setup(tmp_path)
@@ -44,6 +44,30 @@ def test_detect_languages_multiple(tmp_path: Path) -> None:
     assert len(languages) == 3
 
 
+def test_detect_languages_ignores_vendored_dirs(tmp_path: Path) -> None:
+    """Test that files under node_modules or venv are ignored."""
+    (tmp_path / "main.py").touch()
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg" / "index.js").touch()
+
+    pillar = StylePillar()
+    languages = pillar._detect_languages(tmp_path)
+
+    assert languages == {"python"}
+
+
+def test_detect_languages_repo_inside_ignored_name(tmp_path: Path) -> None:
+    """Test that ignore names above the target directory do not hide files."""
+    repo = tmp_path / "build" / "repo"
+    repo.mkdir(parents=True)
+    (repo / "main.py").touch()
+
+    pillar = StylePillar()
+    languages = pillar._detect_languages(repo)
+
+    assert languages == {"python"}
+
+
 def test_check_any_linter_config_python_ruff(tmp_path: Path) -> None:
     """Test detecting ruff.toml for Python."""
     (tmp_path / "main.py").touch()
@@ -69,6 +93,18 @@ def test_check_any_linter_config_python_pyproject(tmp_path: Path) -> None:
     assert "pyproject.toml" in result.message
 
 
+def test_check_any_linter_config_pyproject_without_tool_section(tmp_path: Path) -> None:
+    """Test that pyproject.toml without linter sections is not a linter config."""
+    (tmp_path / "main.py").touch()
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text("[project]\nname = 'demo'\n\n[tool.black]\nline-length = 100\n")
+
+    pillar = StylePillar()
+    result = pillar._check_any_linter_config(tmp_path, {"python"})
+
+    assert not result.passed
+
+
 def test_check_any_linter_config_javascript_eslint(tmp_path: Path) -> None:
     """Test detecting .eslintrc for JavaScript."""
     (tmp_path / "app.js").touch()
@@ -187,6 +223,17 @@ def test_check_ci_integration_gitlab_ci(tmp_path: Path) -> None:
     assert "GitLab CI" in result.message
 
 
+def test_check_ci_integration_github_without_workflows(tmp_path: Path) -> None:
+    """Test that a .github directory without workflows is not CI integration."""
+    (tmp_path / ".github").mkdir()
+    (tmp_path / ".github" / "CODEOWNERS").write_text("* @team\n")
+
+    pillar = StylePillar()
+    result = pillar._check_ci_integration(tmp_path, pillar._list_top_level(tmp_path))
+
+    assert not result.passed
+
+
 def test_check_ci_integration_not_found(tmp_path: Path) -> None:
     """Test when no CI integration is found."""
     pillar = StylePillar()
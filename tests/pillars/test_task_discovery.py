@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from agent_readiness.models import Severity
+from agent_readiness.models import ScanContext, Severity
 from agent_readiness.pillars.task_discovery import TaskDiscoveryPillar
 
 
@@ -46,6 +46,62 @@ def test_discover_task_infrastructure_with_contributing(tmp_path, task_discovery
     assert result["has_contributing_guide"] is True
 
 
+def test_discover_task_infrastructure_nested_candidates(tmp_path, task_discovery_pillar):
+    """Test discovery of files under .github and docs."""
+    (tmp_path / ".github" / "PULL_REQUEST_TEMPLATE").mkdir(parents=True)
+    (tmp_path / ".github" / "CODEOWNERS").write_text("* @maintainers")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "CONTRIBUTING.md").write_text("# Contributing")
+    result = task_discovery_pillar._discover_task_infrastructure(tmp_path)
+    assert result["has_pr_templates"] is True
+    assert result["has_codeowners"] is True
+    assert result["has_contributing_guide"] is True
+    assert result["has_issue_templates"] is False
+
+
+def test_discover_task_infrastructure_github_file(tmp_path, task_discovery_pillar):
+    """Test that a .github file is not mistaken for the directory."""
+    (tmp_path / ".github").write_text("")
+    result = task_discovery_pillar._discover_task_infrastructure(tmp_path)
+    assert result["has_github_issues"] is False
+
+
+def test_discover_task_infrastructure_cached(tmp_path, task_discovery_pillar):
+    """Test discovery results are cached until clear_cache is called."""
+    first = task_discovery_pillar._discover_task_infrastructure(tmp_path)
+    (tmp_path / "CONTRIBUTING.md").write_text("# Contributing")
+
+    assert task_discovery_pillar._discover_task_infrastructure(tmp_path) is first
+    with pytest.raises(TypeError):
+        first["has_contributing_guide"] = True
+
+    task_discovery_pillar.clear_cache()
+    refreshed = task_discovery_pillar._discover_task_infrastructure(tmp_path)
+    assert refreshed["has_contributing_guide"] is True
+
+
+def test_discover_task_infrastructure_shared_through_context(tmp_path):
+    """Test that discovery is stored in the scan context and reused by later runs."""
+    context = ScanContext(root=tmp_path)
+
+    first = TaskDiscoveryPillar().run(tmp_path, context)
+    (tmp_path / "CONTRIBUTING.md").write_text("# Contributing")
+    second = TaskDiscoveryPillar().run(tmp_path, context)
+
+    assert "task_infrastructure" in context.artifacts
+    assert [c.to_dict() for c in second.checks] == [c.to_dict() for c in first.checks]
+
+
+def test_evaluate_rediscovers_each_scan(tmp_path, task_discovery_pillar):
+    """Test that a reused pillar sees files added since its last evaluation."""
+    task_discovery_pillar.evaluate(tmp_path)
+    (tmp_path / "CONTRIBUTING.md").write_text("# Contributing")
+
+    results = task_discovery_pillar.evaluate(tmp_path)
+
+    assert next(r for r in results if r.name == "Contributing guide exists").passed
+
+
 # Level 1 Tests
 
 def test_check_issue_tracker_present_found(tmp_path, task_discovery_pillar):
@@ -97,6 +153,14 @@ def test_check_readme_contribution_section_not_found(tmp_path, task_discovery_pi
     assert result.passed is False
 
 
+def test_check_readme_contribution_section_non_utf8(tmp_path, task_discovery_pillar):
+    """Test README contribution section detection in a README with invalid UTF-8."""
+    (tmp_path / "README.md").write_bytes(b"# Caf\xe9\n\n## HOW TO HELP\n")
+    task = task_discovery_pillar._discover_task_infrastructure(tmp_path)
+    result = task_discovery_pillar._check_readme_contribution_section(tmp_path, task)
+    assert result.passed is True
+
+
 def test_check_issues_labeled_found(tmp_path, task_discovery_pillar):
     """Test issues labeled detection."""
     (tmp_path / ".github").mkdir()
@@ -136,6 +200,14 @@ def test_check_roadmap_visible_not_found(tmp_path, task_discovery_pillar):
     assert result.passed is False
 
 
+def test_check_good_first_issues_marked_mixed_case(tmp_path, task_discovery_pillar):
+    """Test good-first-issue detection in a mixed-case README."""
+    (tmp_path / "README.md").write_text("# Project\n\nNew here? Try a Good First Issue.")
+    task = task_discovery_pillar._discover_task_infrastructure(tmp_path)
+    result = task_discovery_pillar._check_good_first_issues_marked(tmp_path, task)
+    assert result.passed is True
+
+
 def test_check_good_first_issues_marked_in_contributing(tmp_path, task_discovery_pillar):
     """Test good-first-issue detection in CONTRIBUTING."""
     (tmp_path / "CONTRIBUTING.md").write_text(
@@ -231,6 +303,42 @@ def test_check_milestones_defined_git(tmp_path, task_discovery_pillar):
     assert result.passed is True
 
 
+def test_check_milestones_defined_package_json(tmp_path, task_discovery_pillar):
+    """Test milestones detection from a versioned package.json."""
+    (tmp_path / "package.json").write_text('{"name": "app", "version": "1.2.0"}')
+    task = task_discovery_pillar._discover_task_infrastructure(tmp_path)
+    result = task_discovery_pillar._check_milestones_defined(tmp_path, task)
+    assert result.passed is True
+
+
+def test_check_milestones_defined_malformed_package_json(tmp_path, task_discovery_pillar):
+    """Test that malformed or non-object package.json files are ignored."""
+    (tmp_path / "package.json").write_text('["version"]')
+    task = task_discovery_pillar._discover_task_infrastructure(tmp_path)
+    assert task["has_milestones"] is False
+
+    (tmp_path / "package.json").write_text("{not json")
+    task_discovery_pillar.clear_cache()
+    task = task_discovery_pillar._discover_task_infrastructure(tmp_path)
+    assert task["has_milestones"] is False
+
+
+def test_check_milestones_defined_nested_version(tmp_path, task_discovery_pillar):
+    """Test that "version" outside the top-level keys is not a milestone."""
+    (tmp_path / "package.json").write_text(
+        '{"name": "app", "keywords": ["version"], "engines": {"version": "18"}}'
+    )
+    task = task_discovery_pillar._discover_task_infrastructure(tmp_path)
+    assert task["has_milestones"] is False
+
+
+def test_check_milestones_defined_unversioned_package_json(tmp_path, task_discovery_pillar):
+    """Test that a package.json without a version key is not a milestone."""
+    (tmp_path / "package.json").write_text('{"name": "app", "private": true}')
+    task = task_discovery_pillar._discover_task_infrastructure(tmp_path)
+    assert task["has_milestones"] is False
+
+
 # Level 4 Tests
 
 def test_check_automated_issue_labeling_found(tmp_path, task_discovery_pillar):
@@ -291,6 +399,35 @@ def test_check_release_management_found(tmp_path, task_discovery_pillar):
     assert result.passed is True
 
 
+def test_check_release_management_workflow(tmp_path, task_discovery_pillar):
+    """Test release management detection from a release workflow."""
+    workflows_dir = tmp_path / ".github" / "workflows"
+    workflows_dir.mkdir(parents=True)
+    (workflows_dir / "release.yaml").write_text(
+        "on:\n  push:\n    tags: ['v*']\njobs:\n  release:\n    runs-on: ubuntu-latest\n"
+    )
+    task = task_discovery_pillar._discover_task_infrastructure(tmp_path)
+    result = task_discovery_pillar._check_release_management(tmp_path, task)
+    assert result.passed is True
+    assert task["has_automation"] is True
+
+
+def test_scan_workflows_many_files(tmp_path, task_discovery_pillar):
+    """Test that flags from every workflow are combined when reads run in parallel."""
+    workflows_dir = tmp_path / ".github" / "workflows"
+    workflows_dir.mkdir(parents=True)
+    (workflows_dir / "ci.yml").write_text("jobs:\n  test:\n    runs-on: ubuntu-latest\n")
+    (workflows_dir / "assign.yml").write_text("uses: kentaro-m/auto-assign-action@v2\n")
+    (workflows_dir / "stale.yml").write_text("uses: actions/stale@v9\n")
+    (workflows_dir / "notes.txt").write_text("feedback")
+
+    flags = task_discovery_pillar._scan_workflows(str(workflows_dir))
+
+    assert flags["has_assign"] is True
+    assert flags["has_triage"] is True
+    assert flags["has_feedback"] is False
+
+
 def test_check_release_management_not_found(tmp_path, task_discovery_pillar):
     """Test release management detection when absent."""
     task = task_discovery_pillar._discover_task_infrastructure(tmp_path)
@@ -316,6 +453,15 @@ def test_check_contributor_analytics_in_readme(tmp_path, task_discovery_pillar):
     assert result.passed is True
 
 
+def test_readme_flags_overlapping_phrases(tmp_path, task_discovery_pillar):
+    """Test that one README phrase can satisfy several checks."""
+    (tmp_path / "README.md").write_text("# Project\n\nBuilt by our CONTRIBUTORS.")
+    task = task_discovery_pillar._discover_task_infrastructure(tmp_path)
+    assert task["readme_flags"]["contribution"] is True
+    assert task["readme_flags"]["contributor"] is True
+    assert task["readme_flags"]["roadmap"] is False
+
+
 def test_check_contributor_analytics_not_found(tmp_path, task_discovery_pillar):
     """Test contributor analytics detection when absent."""
     task = task_discovery_pillar._discover_task_infrastructure(tmp_path)
@@ -335,6 +481,16 @@ def test_check_automated_task_creation_found(tmp_path, task_discovery_pillar):
     assert result.passed is True
 
 
+def test_check_automated_task_creation_todo_in_source(tmp_path, task_discovery_pillar):
+    """Test automated task creation detection from TODO comments in src/."""
+    pkg_dir = tmp_path / "src" / "pkg"
+    pkg_dir.mkdir(parents=True)
+    (pkg_dir / "core.py").write_text("def run():\n    pass  # TODO: handle retries\n")
+    task = task_discovery_pillar._discover_task_infrastructure(tmp_path)
+    result = task_discovery_pillar._check_automated_task_creation(tmp_path, task)
+    assert result.passed is True
+
+
 def test_check_automated_task_creation_not_found(tmp_path, task_discovery_pillar):
     """Test automated task creation detection when absent."""
     task = task_discovery_pillar._discover_task_infrastructure(tmp_path)
@@ -464,3 +620,13 @@ def test_evaluate_returns_correct_structure(task_discovery_pillar, tmp_path):
         assert isinstance(result.passed, bool)
         assert isinstance(result.severity, Severity)
         assert result.level in [1, 2, 3, 4, 5]
+
+
+def test_evaluate_reports_checks_in_level_order(task_discovery_pillar, tmp_path):
+    """Test that evaluate reports each check once, ordered by level."""
+    results = task_discovery_pillar.evaluate(tmp_path)
+
+    levels = [result.level for result in results]
+    assert levels == sorted(levels)
+    assert len({result.name for result in results}) == 18
+    assert results[0].name == "Issue tracker present"
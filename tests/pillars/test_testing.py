@@ -1,9 +1,12 @@
 """Tests for Testing pillar."""
 
+import os
 from pathlib import Path
 
+import pytest
+
 from agent_readiness.pillars.testing import TestingPillar
-from agent_readiness.models import Severity
+from agent_readiness.models import ScanContext, Severity
 
 
 def test_testing_pillar_name() -> None:
@@ -82,6 +85,193 @@ def test_detect_test_infrastructure_no_duplicates(tmp_path: Path) -> None:
     assert len(test_info["test_files"]["python"]) == 1
 
 
+def test_detect_test_infrastructure_all_suffixes(tmp_path: Path) -> None:
+    """Test that every supported test file naming convention is classified."""
+    test_dir = tmp_path / "tests"
+    test_dir.mkdir()
+    for name in (
+        "test_api.py",
+        "api_test.py",
+        "api.test.js",
+        "api.spec.ts",
+        "api_test.go",
+        "api_test.rs",
+        "conftest.py",
+        "helpers.js",
+    ):
+        (test_dir / name).touch()
+
+    pillar = TestingPillar()
+    test_info = pillar._detect_test_infrastructure(tmp_path)
+
+    counts = {lang: len(files) for lang, files in test_info["test_files"].items()}
+    assert counts == {"python": 2, "javascript": 2, "go": 1, "rust": 1}
+
+
+def test_detect_test_infrastructure_nested_files(tmp_path: Path) -> None:
+    """Test files in nested test subdirectories are found as path strings."""
+    nested = tmp_path / "tests" / "unit" / "api"
+    nested.mkdir(parents=True)
+    (nested / "handlers_test.go").touch()
+    (nested / "helpers.py").touch()
+
+    pillar = TestingPillar()
+    test_info = pillar._detect_test_infrastructure(tmp_path)
+
+    assert test_info["languages"] == {"go"}
+    assert test_info["test_files"]["go"] == [str(nested / "handlers_test.go")]
+
+
+def test_detect_test_infrastructure_src_test_dir(tmp_path: Path) -> None:
+    """Test detecting test directories nested under src/."""
+    test_dir = tmp_path / "src" / "pkg" / "test"
+    test_dir.mkdir(parents=True)
+    (test_dir / "test_core.py").touch()
+    vendored = tmp_path / "tests" / "node_modules" / "dep"
+    vendored.mkdir(parents=True)
+    (vendored / "index.test.js").touch()
+
+    pillar = TestingPillar()
+    test_info = pillar._detect_test_infrastructure(tmp_path)
+
+    assert test_dir in test_info["test_dirs"]
+    assert test_info["languages"] == {"python"}
+
+
+def test_detect_test_infrastructure_nested_test_dirs(tmp_path: Path) -> None:
+    """Test that a test directory inside another is walked only once."""
+    outer = tmp_path / "src" / "test"
+    inner = outer / "fixtures" / "test"
+    inner.mkdir(parents=True)
+    (outer / "test_outer.py").touch()
+    (inner / "test_inner.py").touch()
+
+    pillar = TestingPillar()
+    test_info = pillar._detect_test_infrastructure(tmp_path)
+
+    assert test_info["test_dirs"] == [outer]
+    assert len(test_info["test_files"]["python"]) == 2
+
+
+def test_detect_test_infrastructure_many_dirs_ordered(tmp_path: Path) -> None:
+    """Test that files from several test directories are merged in directory order."""
+    for dir_name in ("tests", "test", "spec"):
+        (tmp_path / dir_name).mkdir()
+        (tmp_path / dir_name / f"test_{dir_name}.py").touch()
+
+    pillar = TestingPillar()
+    test_info = pillar._detect_test_infrastructure(tmp_path)
+
+    names = [Path(f).name for f in test_info["test_files"]["python"]]
+    assert names == ["test_tests.py", "test_test.py", "test_spec.py"]
+
+
+def test_detect_test_infrastructure_ignores_test_named_files(tmp_path: Path) -> None:
+    """Test that root files named like test directories are not treated as directories."""
+    (tmp_path / "test").write_text("not a directory")
+    (tmp_path / "spec").mkdir()
+    (tmp_path / "spec" / "app.spec.js").touch()
+
+    pillar = TestingPillar()
+    test_info = pillar._detect_test_infrastructure(tmp_path)
+
+    assert test_info["test_dirs"] == [tmp_path / "spec"]
+
+
+def test_detect_test_infrastructure_skips_hidden_and_vendor_dirs(tmp_path: Path) -> None:
+    """Test that nested test/ directories in hidden or vendored trees are ignored."""
+    for parent in (".cache", "target", "vendor/dep"):
+        hidden = tmp_path / "src" / parent / "test"
+        hidden.mkdir(parents=True)
+        (hidden / "test_generated.py").touch()
+
+    pillar = TestingPillar()
+    test_info = pillar._detect_test_infrastructure(tmp_path)
+
+    assert test_info["test_dirs"] == []
+
+
+def test_detect_test_infrastructure_skips_build_output(tmp_path: Path) -> None:
+    """Test that build output inside a test directory is not counted."""
+    (tmp_path / "tests" / "target" / "debug").mkdir(parents=True)
+    (tmp_path / "tests" / "target" / "debug" / "lib_test.rs").touch()
+    (tmp_path / "tests" / "api_test.rs").touch()
+
+    pillar = TestingPillar()
+    test_info = pillar._detect_test_infrastructure(tmp_path)
+
+    assert test_info["test_files"]["rust"] == [str(tmp_path / "tests" / "api_test.rs")]
+
+
+def test_detect_test_infrastructure_symlinked_test_dir(tmp_path: Path) -> None:
+    """Test that files reachable through a symlinked test directory are counted once."""
+    real = tmp_path / "src" / "pkg" / "test"
+    real.mkdir(parents=True)
+    (real / "test_core.py").touch()
+    (tmp_path / "tests").symlink_to(real, target_is_directory=True)
+
+    pillar = TestingPillar()
+    test_info = pillar._detect_test_infrastructure(tmp_path)
+
+    assert len(test_info["test_dirs"]) == 2
+    assert len(test_info["test_files"]["python"]) == 1
+
+
+def test_detect_test_infrastructure_ignores_test_named_dirs(tmp_path: Path) -> None:
+    """Test that directories with test-file names are not counted as test files."""
+    (tmp_path / "tests" / "test_data.py").mkdir(parents=True)
+    (tmp_path / "tests" / "test_data.py" / "test_inner.py").touch()
+
+    pillar = TestingPillar()
+    test_info = pillar._detect_test_infrastructure(tmp_path)
+
+    assert [Path(f).name for f in test_info["test_files"]["python"]] == ["test_inner.py"]
+
+
+def test_detect_test_infrastructure_cached(tmp_path: Path) -> None:
+    """Test that detection is cached until clear_cache is called."""
+    (tmp_path / "tests").mkdir()
+    pillar = TestingPillar()
+    first = pillar._detect_test_infrastructure(tmp_path)
+    (tmp_path / "tests" / "test_late.py").touch()
+
+    assert pillar._detect_test_infrastructure(tmp_path) is first
+    with pytest.raises(TypeError):
+        first["languages"] = {"python"}
+
+    pillar.clear_cache()
+    assert pillar._detect_test_infrastructure(tmp_path)["languages"] == {"python"}
+
+
+def test_evaluate_rescans_each_call(tmp_path: Path) -> None:
+    """Test that each evaluate call sees the current repository contents."""
+    pillar = TestingPillar()
+    assert not pillar.evaluate(tmp_path)[0].passed
+
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_app.py").touch()
+
+    assert pillar.evaluate(tmp_path)[0].passed
+
+
+def test_run_shares_scan_context(tmp_path: Path) -> None:
+    """Test that pillars run with one scan context reuse its reads and detection."""
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_app.py").touch()
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text("[tool.coverage.run]\n")
+    context = ScanContext(root=tmp_path)
+
+    first = TestingPillar().run(tmp_path, context)
+    pyproject.unlink()
+    (tmp_path / "tests" / "test_new.py").touch()
+    second = TestingPillar().run(tmp_path, context)
+
+    assert os.fspath(pyproject) in context.file_cache
+    assert "test_infrastructure" in context.artifacts
+    assert [c.to_dict() for c in second.checks] == [c.to_dict() for c in first.checks]
+
+
 def test_check_tests_exist_found(tmp_path: Path) -> None:
     """Test tests exist check passes when tests found."""
     (tmp_path / "tests").mkdir()
@@ -105,6 +295,22 @@ def test_check_tests_exist_not_found(tmp_path: Path) -> None:
     assert "No test" in result.message
 
 
+def test_check_tests_exist_uses_given_test_info(tmp_path: Path) -> None:
+    """Test that a precomputed detection result is used instead of re-scanning."""
+    test_info = {
+        "languages": {"go"},
+        "test_dirs": [tmp_path / "test"],
+        "test_files": {"python": [], "javascript": [], "go": ["a_test.go"], "rust": []},
+        "total_files": 1,
+    }
+
+    pillar = TestingPillar()
+    result = pillar._check_tests_exist(tmp_path, test_info)
+
+    assert result.passed
+    assert "1 test file" in result.message
+
+
 def test_check_test_directory_structure_organized(tmp_path: Path) -> None:
     """Test directory structure check passes when organized."""
     test_dir = tmp_path / "tests"
@@ -152,6 +358,50 @@ def test_check_test_command_documented_not_found(tmp_path: Path) -> None:
     assert not result.passed
 
 
+def test_check_test_command_documented_mixed_case(tmp_path: Path) -> None:
+    """Test command documentation check matches regardless of case."""
+    (tmp_path / "README.md").write_text("## Testing\n\nRun `Cargo Test` locally.")
+
+    pillar = TestingPillar()
+    result = pillar._check_test_command_documented(tmp_path)
+
+    assert result.passed
+    assert "'cargo test'" in result.message
+
+
+def test_check_test_command_documented_reads_leading_bytes(tmp_path: Path) -> None:
+    """Test that only the start of a very large README is searched."""
+    (tmp_path / "README.md").write_text("x" * (64 * 1024) + "\npytest\n")
+
+    pillar = TestingPillar()
+    result = pillar._check_test_command_documented(tmp_path)
+
+    assert not result.passed
+
+
+def test_check_test_command_documented_no_readme(tmp_path: Path) -> None:
+    """Test command documentation check fails without a README."""
+    pillar = TestingPillar()
+    result = pillar._check_test_command_documented(tmp_path)
+
+    assert not result.passed
+    assert "No README.md" in result.message
+
+
+def test_check_test_command_documented_cached(tmp_path: Path) -> None:
+    """Test that the README is read once until clear_cache is called."""
+    readme = tmp_path / "README.md"
+    readme.write_text("# Project")
+    pillar = TestingPillar()
+    assert not pillar._check_test_command_documented(tmp_path).passed
+
+    readme.write_text("Run `make test`.")
+    assert not pillar._check_test_command_documented(tmp_path).passed
+
+    pillar.clear_cache()
+    assert pillar._check_test_command_documented(tmp_path).passed
+
+
 def test_check_tests_in_ci_github_actions(tmp_path: Path) -> None:
     """Test CI check passes when tests run in GitHub Actions."""
     workflows_dir = tmp_path / ".github" / "workflows"
@@ -177,6 +427,32 @@ jobs:
     assert result.level == 3
 
 
+def test_check_tests_in_ci_gitlab_mixed_case(tmp_path: Path) -> None:
+    """Test CI check matches test commands case-insensitively in single-file configs."""
+    (tmp_path / ".gitlab-ci.yml").write_text("test:\n  script:\n    - Cargo Test --all\n")
+
+    pillar = TestingPillar()
+    result = pillar._check_tests_in_ci(tmp_path)
+
+    assert result.passed
+    assert "GitLab CI (.gitlab-ci.yml)" in result.message
+
+
+def test_check_tests_in_ci_prefers_test_workflows(tmp_path: Path) -> None:
+    """Test that workflows named like test jobs are searched first."""
+    workflows_dir = tmp_path / ".github" / "workflows"
+    workflows_dir.mkdir(parents=True)
+    (workflows_dir / "a-release.yml").write_text("run: pytest --collect-only\n")
+    (workflows_dir / "CI.yml").write_text("run: make test\n")
+    (workflows_dir / "unit-tests.yml").write_text("run: pytest\n")
+
+    pillar = TestingPillar()
+    result = pillar._check_tests_in_ci(tmp_path)
+
+    assert result.passed
+    assert result.message == "Tests run in CI: GitHub Actions (unit-tests.yml)"
+
+
 def test_check_tests_in_ci_not_found(tmp_path: Path) -> None:
     """Test CI check fails when no CI configuration found."""
     pillar = TestingPillar()
@@ -214,6 +490,33 @@ source = ["src"]
     assert results[0].level == 3
 
 
+def test_check_python_coverage_addopts_list(tmp_path: Path) -> None:
+    """Test that pytest-cov is found in an addopts array."""
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.pytest.ini_options]\naddopts = ["-ra", "--cov=src"]\n'
+    )
+
+    pillar = TestingPillar()
+
+    assert pillar._check_python_coverage(tmp_path).passed
+
+
+def test_check_javascript_coverage_package_json(tmp_path: Path) -> None:
+    """Test that package.json coverage is read from config keys, not free text."""
+    package_json = tmp_path / "package.json"
+    package_json.write_text('{"description": "coverage reports, someday"}')
+    pillar = TestingPillar()
+    assert not pillar._check_javascript_coverage(tmp_path).passed
+
+    package_json.write_text('{"devDependencies": {"@vitest/coverage-v8": "^1.0.0"}}')
+    pillar.clear_cache()
+    assert pillar._check_javascript_coverage(tmp_path).passed
+
+    package_json.write_text('{"scripts": {"test": "c8 mocha"}}')
+    pillar.clear_cache()
+    assert pillar._check_javascript_coverage(tmp_path).passed
+
+
 def test_check_coverage_measured_not_configured(tmp_path: Path) -> None:
     """Test coverage measured check fails when not configured."""
     # Create Python test infrastructure without coverage config
@@ -264,6 +567,18 @@ def test_check_unit_tests_isolated_not_found(tmp_path: Path) -> None:
     assert not results[0].passed
 
 
+def test_check_javascript_isolation_large_file(tmp_path: Path) -> None:
+    """Test that a mock call past the memory-mapping threshold is found."""
+    test_dir = tmp_path / "__tests__"
+    test_dir.mkdir()
+    (test_dir / "big.test.js").write_text("// fixture\n" * 4096 + "vi.mock('./api')\n")
+
+    pillar = TestingPillar()
+    results = pillar._check_unit_tests_isolated(tmp_path, {"javascript"})
+
+    assert results[0].passed
+
+
 # Level 4 tests
 def test_check_parallel_test_config_python(tmp_path: Path) -> None:
     """Test parallel config check for Python."""
@@ -296,6 +611,46 @@ def test_check_coverage_threshold_from_config(tmp_path: Path) -> None:
     assert "80" in results[0].message
 
 
+def test_check_coverage_threshold_javascript(tmp_path: Path) -> None:
+    """Test that the lowest numeric jest global threshold is reported."""
+    (tmp_path / "package.json").write_text(
+        '{"jest": {"coverageThreshold": {"global": {"lines": 90, "branches": 75}}}}'
+    )
+
+    pillar = TestingPillar()
+    results = pillar._check_coverage_threshold(tmp_path, {"javascript"})
+
+    assert results[0].passed
+    assert "75%" in results[0].message
+
+
+def test_config_files_read_once_per_scan(tmp_path: Path) -> None:
+    """Test that checks share one read of each config file until clear_cache."""
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[tool.coverage.report]\nfail_under = 80\n[tool.pytest]\naddopts = "-n 4"')
+    pillar = TestingPillar()
+    assert pillar._check_python_coverage(tmp_path).passed
+
+    pyproject.unlink()
+    assert pillar._check_coverage_threshold(tmp_path, {"python"})[0].passed
+    assert pillar._check_parallel_test_config(tmp_path, {"python"})[0].passed
+
+    pillar.clear_cache()
+    assert not pillar._check_python_coverage(tmp_path).passed
+
+
+def test_root_listed_once_per_scan(tmp_path: Path) -> None:
+    """Test that config probes answer from one cached listing of the directory."""
+    pillar = TestingPillar()
+    assert not pillar._check_python_coverage(tmp_path).passed
+
+    (tmp_path / ".coveragerc").touch()
+    assert not pillar._check_python_coverage(tmp_path).passed
+
+    pillar.clear_cache()
+    assert pillar._check_python_coverage(tmp_path).passed
+
+
 # Level 5 tests
 def test_check_property_based_testing_python(tmp_path: Path) -> None:
     """Test property-based testing check for Python."""
@@ -0,0 +1,131 @@
+"""Tests for the filesystem helpers."""
+
+import re
+from pathlib import Path
+
+from agent_readiness.fs import (
+    MMAP_THRESHOLD,
+    DirIndex,
+    compile_pattern,
+    file_matches,
+    walk,
+    walk_files,
+)
+
+PATTERN = re.compile(rb"lint", re.IGNORECASE)
+
+
+def test_file_matches_small_file(tmp_path: Path) -> None:
+    """Test matching a file below the mmap threshold."""
+    doc = tmp_path / "CONTRIBUTING.md"
+    doc.write_text("Run the LINT step before pushing.")
+
+    assert file_matches(doc, PATTERN)
+
+
+def test_file_matches_large_file(tmp_path: Path) -> None:
+    """Test matching near the end of a memory-mapped file."""
+    doc = tmp_path / "CONTRIBUTING.md"
+    doc.write_text("x" * MMAP_THRESHOLD + "\nlint\n")
+
+    assert file_matches(doc, PATTERN)
+
+
+def test_file_matches_no_match(tmp_path: Path) -> None:
+    """Test a file without the pattern."""
+    doc = tmp_path / "CONTRIBUTING.md"
+    doc.write_text("Nothing relevant here.")
+
+    assert not file_matches(doc, PATTERN)
+
+
+def test_file_matches_binary_file(tmp_path: Path) -> None:
+    """Test that binary content never matches."""
+    blob = tmp_path / "blob.bin"
+    blob.write_bytes(b"\x00\x01lint")
+
+    assert not file_matches(blob, PATTERN)
+
+
+def test_file_matches_missing_file(tmp_path: Path) -> None:
+    """Test that unreadable paths never match."""
+    assert not file_matches(tmp_path / "missing.md", PATTERN)
+    assert not file_matches(tmp_path, PATTERN)
+
+
+def test_compile_pattern_ignore_case() -> None:
+    """Test compiling a case-insensitive bytes pattern."""
+    pattern = compile_pattern(rb"helmet|csrf", ignore_case=True)
+
+    assert pattern.search(b"app.use(CSRF())")
+    assert not pattern.search(b"app.use(cors())")
+
+
+def test_compile_pattern_case_sensitive() -> None:
+    """Test that patterns are case-sensitive by default."""
+    pattern = compile_pattern(rb"gitleaks")
+
+    assert pattern.search(b"uses: gitleaks/gitleaks-action@v2")
+    assert not pattern.search(b"uses: GITLEAKS")
+
+
+def test_walk_files_prunes_vendored_dirs(tmp_path: Path) -> None:
+    """Test that walk_files skips pruned directories."""
+    (tmp_path / "pkg" / "sub").mkdir(parents=True)
+    (tmp_path / "pkg" / "sub" / "mod.py").touch()
+    (tmp_path / "node_modules" / "dep").mkdir(parents=True)
+    (tmp_path / "node_modules" / "dep" / "index.js").touch()
+
+    names = {entry.name for entry in walk_files(tmp_path)}
+
+    assert names == {"mod.py"}
+
+
+def test_walk_yields_directories(tmp_path: Path) -> None:
+    """Test that walk yields directories as well as files."""
+    (tmp_path / "src" / "test").mkdir(parents=True)
+
+    dirs = {entry.name for entry in walk(tmp_path) if entry.is_dir()}
+
+    assert dirs == {"src", "test"}
+
+
+def test_walk_missing_root(tmp_path: Path) -> None:
+    """Test that walking a missing directory yields nothing."""
+    assert list(walk_files(tmp_path / "missing")) == []
+
+
+def test_walk_max_depth(tmp_path: Path) -> None:
+    """Test that walk stops descending below max_depth."""
+    (tmp_path / "a" / "b" / "c").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "c" / "deep.py").touch()
+    (tmp_path / "a" / "shallow.py").touch()
+
+    assert {entry.name for entry in walk(tmp_path, max_depth=2)} == {"a", "b", "shallow.py"}
+    assert {entry.name for entry in walk_files(tmp_path, max_depth=4)} == {
+        "shallow.py",
+        "deep.py",
+    }
+
+
+def test_dir_index_scan(tmp_path: Path) -> None:
+    """Test that a directory index splits files from directories."""
+    (tmp_path / "Makefile").touch()
+    (tmp_path / ".github" / "workflows").mkdir(parents=True)
+    (tmp_path / ".github" / "workflows" / "ci.yml").touch()
+
+    index = DirIndex.scan(tmp_path)
+
+    assert index.files == {"Makefile"}
+    assert index.dirs == {".github"}
+    assert index.subdir(".github").subdir("workflows").files == {"ci.yml"}
+    assert index.subdir(".github") is index.subdir(".github")
+
+
+def test_dir_index_missing(tmp_path: Path) -> None:
+    """Test that missing directories and children index as empty."""
+    (tmp_path / "Dockerfile").touch()
+
+    assert DirIndex.scan(tmp_path / "missing").files == frozenset()
+    assert DirIndex.scan(tmp_path).subdir("Dockerfile").files == frozenset()
+    assert DirIndex.scan(tmp_path).subdir(".circleci").dirs == frozenset()
@@ -1,7 +1,14 @@
 """Integration tests for scanner and pillars."""
 
+import shutil
+import subprocess
+import threading
 from pathlib import Path
 
+import pytest
+
+from agent_readiness.models import CheckResult, PillarResult, ScanContext
+from agent_readiness.pillar import Pillar
 from agent_readiness.pillars import BuildPillar, StylePillar, TestingPillar
 from agent_readiness.scanner import Scanner
 
@@ -110,3 +117,185 @@ def test_scanner_with_all_three_pillars(tmp_path: Path) -> None:
         "Testing",
     }
     assert result.overall_score > 0
+
+
+def test_scanner_preserves_pillar_order(tmp_path: Path) -> None:
+    """Test that concurrently evaluated pillars are reported in registration order."""
+    (tmp_path / "main.py").touch()
+
+    scanner = Scanner()
+    scanner.register_pillars([TestingPillar(), StylePillar(), BuildPillar(), TestingPillar()])
+    result = scanner.scan(tmp_path)
+
+    assert [p.name for p in result.pillars] == [
+        "Testing",
+        "Style & Validation",
+        "Build System",
+        "Testing",
+    ]
+
+
+def test_scanner_overall_score_weighted() -> None:
+    """Test that the overall score is the weight-averaged pillar score."""
+    scanner = Scanner()
+    results = [
+        PillarResult(name="A", checks=[], score=100.0, weight=3.0),
+        PillarResult(name="B", checks=[], score=0.0, weight=1.0),
+    ]
+
+    assert scanner._calculate_overall_score(results) == 75.0
+    assert scanner._calculate_overall_score([]) == 0.0
+
+
+def test_scanner_maturity_level_boundaries() -> None:
+    """Test that each maturity level starts at its documented score."""
+    scanner = Scanner()
+
+    scores = (0, 39.9, 40, 59.9, 60, 80, 94.9, 95, 100)
+    levels = [scanner._determine_maturity_level(score) for score in scores]
+
+    assert levels == [1, 1, 2, 2, 3, 4, 4, 5, 5]
+
+
+def _git(repo: Path, *args: str) -> None:
+    """Run a git command in repo with a throwaway identity."""
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_scanner_incremental_scan(tmp_path: Path) -> None:
+    """Test that an incremental scan samples only test files changed since base_ref."""
+    tests_dir = tmp_path / "tests"
+    tests_dir.mkdir()
+    for i in range(10):
+        (tests_dir / f"test_old_{i}.py").write_text("def test_plain(): pass\n")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "base")
+    (tests_dir / "test_new.py").write_text("import pytest\n\n@pytest.fixture\ndef db(): pass\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "change")
+
+    def isolation_passed(**kwargs: str) -> bool:
+        scanner = Scanner()
+        scanner.register_pillar(TestingPillar())
+        checks = scanner.scan(tmp_path, **kwargs).pillars[0].checks
+        return next(c for c in checks if c.name == "Unit tests isolated (python)").passed
+
+    assert isolation_passed(base_ref="HEAD~1")
+    assert isolation_passed(base_ref="no-such-ref") == isolation_passed()
+
+
+def test_concurrent_runs_keep_their_own_context(tmp_path: Path) -> None:
+    """Test that two scans sharing a pillar instance each see their own context."""
+    barrier = threading.Barrier(2)
+    seen: dict[str, ScanContext | None] = {}
+
+    class ContextPillar(Pillar):
+        name = "Context"
+
+        def evaluate(self, target_dir: Path) -> list[CheckResult]:
+            barrier.wait()
+            seen[target_dir.name] = self.context
+            return []
+
+    pillar = ContextPillar()
+    contexts = {}
+    threads = []
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        contexts[name] = ScanContext(root=tmp_path / name)
+        threads.append(threading.Thread(target=pillar.run, args=(tmp_path / name, contexts[name])))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert seen == contexts
+    assert pillar.context is None
+
+
+def test_scanner_result_cache(tmp_path: Path) -> None:
+    """Test that cached results are reused until a signal file changes."""
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text("[tool.ruff]\n")
+    pillar = StylePillar()
+    runs = []
+    evaluate = pillar.evaluate
+    pillar.evaluate = lambda target_dir: runs.append(target_dir) or evaluate(target_dir)
+
+    scanner = Scanner()
+    scanner.register_pillar(pillar)
+    first = scanner.scan(tmp_path, use_cache=True)
+    cached = scanner.scan(tmp_path, use_cache=True)
+
+    assert len(runs) == 1
+    assert cached is not first
+    assert cached.to_dict() == first.to_dict()
+
+    scanner.scan(tmp_path)
+    assert len(runs) == 2
+
+    pyproject.write_text("[tool.ruff]\nline-length = 100\n")
+    scanner.scan(tmp_path, use_cache=True)
+    assert len(runs) == 3
+
+    scanner.clear_cache()
+    scanner.scan(tmp_path, use_cache=True)
+    assert len(runs) == 4
+
+
+def test_scanner_result_cache_sees_workflow_edits(tmp_path: Path) -> None:
+    """Test that editing an existing workflow invalidates the cached result."""
+    workflows = tmp_path / ".github" / "workflows"
+    workflows.mkdir(parents=True)
+    workflow = workflows / "ci.yml"
+    workflow.write_text("- run: make\n")
+    (tmp_path / "pyproject.toml").touch()
+
+    scanner = Scanner()
+    scanner.register_pillar(BuildPillar())
+
+    def caching_passed() -> bool:
+        checks = scanner.scan(tmp_path, use_cache=True).pillars[0].checks
+        return next(c for c in checks if c.name == "Build caching").passed
+
+    assert not caching_passed()
+    workflow.write_text("- uses: actions/cache@v4\n")
+    assert caching_passed()
+
+
+def test_scanner_result_cache_sees_nested_edits(tmp_path: Path) -> None:
+    """Test that editing a file deep in the source or test trees invalidates the cache."""
+    test_file = tmp_path / "tests" / "unit" / "test_app.py"
+    test_file.parent.mkdir(parents=True)
+    test_file.write_text("def test_app():\n    pass\n")
+    pillar = StylePillar()
+    runs = []
+    evaluate = pillar.evaluate
+    pillar.evaluate = lambda target_dir: runs.append(target_dir) or evaluate(target_dir)
+
+    scanner = Scanner()
+    scanner.register_pillar(pillar)
+    scanner.scan(tmp_path, use_cache=True)
+    scanner.scan(tmp_path, use_cache=True)
+    assert len(runs) == 1
+
+    test_file.write_text("def test_app():\n    assert True\n")
+    scanner.scan(tmp_path, use_cache=True)
+    assert len(runs) == 2
+
+
+def test_scanner_result_cache_returns_copies(tmp_path: Path) -> None:
+    """Test that mutating a returned result does not corrupt the cache."""
+    scanner = Scanner()
+    scanner.register_pillar(StylePillar())
+
+    scanner.scan(tmp_path, use_cache=True).pillars.clear()
+
+    assert scanner.scan(tmp_path, use_cache=True).pillars
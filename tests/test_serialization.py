@@ -0,0 +1,54 @@
+"""Tests for the JSON serialization helpers."""
+
+import json
+
+import pytest
+
+from agent_readiness import serialization
+from agent_readiness.models import Severity
+from agent_readiness.serialization import dumps_pretty
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test with orjson when installed and with the stdlib fallback."""
+    if request.param == "orjson":
+        if serialization.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+def test_dumps_pretty_stdlib_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that pretty JSON matches the stdlib output without orjson."""
+    data = {"name": "Test", "checks": [{"passed": True, "score": 50.0}]}
+
+    monkeypatch.setattr(serialization, "orjson", None)
+
+    assert dumps_pretty(data) == json.dumps(data, indent=2)
+
+
+def test_dumps_pretty_round_trip(encoder: str) -> None:
+    """Test that pretty JSON parses back to the same data."""
+    data = {"name": "Test", "metadata": {"files": ["a.py"], "count": 1}}
+
+    assert json.loads(dumps_pretty(data)) == data
+    assert dumps_pretty(data).startswith('{\n  "name"')
+
+
+def test_dumps_pretty_non_ascii(encoder: str) -> None:
+    """Test that non-ASCII text survives either encoder."""
+    data = {"message": "Fichier trouvé: café.py ✓"}
+
+    assert json.loads(dumps_pretty(data)) == data
+
+
+def test_dumps_pretty_non_str_keys(encoder: str) -> None:
+    """Test that non-str dict keys are written as strings by either encoder."""
+    assert json.loads(dumps_pretty({1: "one"})) == {"1": "one"}
+
+
+def test_dumps_pretty_severity(encoder: str) -> None:
+    """Test that severities serialize as their values without to_dict."""
+    assert json.loads(dumps_pretty({"severity": Severity.WARNING})) == {"severity": "warning"}